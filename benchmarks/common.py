@@ -0,0 +1,134 @@
+# benchmarks/common.py
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import math
+import wave
+import struct
+import random
+import resource
+import subprocess
+import threading
+
+WORDS = (
+    "orion pulse propulsion declassified archives reveal soviet engineers designed "
+    "cities under domes while cybernetic planners wired factories to a single "
+    "control room records show the project was cancelled in nineteen sixty five"
+).split()
+
+def synthetic_script(word_count: int, seed: int = 42) -> str:
+    """Sabit tohumlu, cümlelere bölünmüş sentetik script üretir."""
+    rng = random.Random(seed)
+    sentences = []
+    remaining = word_count
+    while remaining > 0:
+        n = min(remaining, rng.randint(6, 14))
+        words = [rng.choice(WORDS) for _ in range(n)]
+        sentences.append(" ".join(words).capitalize() + ".")
+        remaining -= n
+    return " ".join(sentences)
+
+def write_sine_wav(path: str, seconds: float, sample_rate: int = 24000, freq: float = 220.0,
+                   silent: bool = False) -> str:
+    """Sabit uzunlukta mono 16-bit sinüs (veya sessiz) WAV dosyası yazar."""
+    frames_total = int(seconds * sample_rate)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        block = sample_rate
+        for offset in range(0, frames_total, block):
+            n = min(block, frames_total - offset)
+            if silent:
+                wav.writeframes(b"\x00\x00" * n)
+            else:
+                samples = (
+                    int(8000 * math.sin(2 * math.pi * freq * (offset + i) / sample_rate))
+                    for i in range(n)
+                )
+                wav.writeframes(struct.pack(f"<{n}h", *samples))
+    return str(path)
+
+def _descendant_pids(root: int) -> list:
+    """/proc'taki ebeveyn ilişkisinden root'un tüm alt süreçleri."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # "pid (komut) durum ppid ..." - komut adı boşluk içerebilir
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    pids, stack = [], [root]
+    while stack:
+        for pid in children.get(stack.pop(), []):
+            pids.append(pid)
+            stack.append(pid)
+    return pids
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+class ChildRSSSampler:
+    """Alt süreçlerin (ffmpeg, işçi havuzları) toplam RSS'ini /proc'tan periyodik örnekler.
+
+    RUSAGE_CHILDREN yalnızca beklenmiş (wait) alt süreçleri kapsar ve fork anındaki
+    Python RSS'ini raporlayabilir; bu yüzden aynı anda yaşayan alt süreçlerin RSS
+    toplamının en yükseği ölçülür. Örnekleme aralığından kısa tepeler kaçabilir.
+    /proc yoksa (Linux dışı) peak_mb None olur.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_kb = 0
+        self.supported = os.path.isdir("/proc")
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        root = os.getpid()
+        while True:
+            total = sum(_rss_kb(pid) for pid in _descendant_pids(root))
+            self.peak_kb = max(self.peak_kb, total)
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self):
+        if self.supported:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.supported:
+            self._stop.set()
+            self._thread.join()
+
+    @property
+    def peak_mb(self):
+        return round(self.peak_kb / 1024, 1) if self.supported else None
+
+def peak_rss_mb(sampler: ChildRSSSampler) -> dict:
+    to_mb = 1 / 1024  # Linux'ta ru_maxrss KiB cinsindendir
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * to_mb, 1),
+        "children": sampler.peak_mb,
+    }
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
@@ -0,0 +1,46 @@
+# benchmarks/encoder_profiles.py
+"""Kodlayıcı profillerinin kodlama süresi ve dosya boyutu karşılaştırması.
+
+Kullanım: python -m benchmarks.encoder_profiles --mode podcast --seconds 120 --backend ffmpeg
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.common import synthetic_script, write_sine_wav
+from src.config import Config
+from src.video_generator import create_shorts_video, create_podcast_video
+
+def run(mode: str, seconds: float, backend: str, profiles: list) -> dict:
+    render = create_shorts_video if mode == "shorts" else create_podcast_video
+    script = synthetic_script(int(seconds * 2.5))
+    results = {"mode": mode, "seconds": seconds, "backend": backend, "profiles": {}}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        audio_path = write_sine_wav(Path(temp_dir) / "audio.wav", seconds)
+        for name in profiles:
+            output_path = Path(temp_dir) / f"{mode}_{name}.mp4"
+            start = time.perf_counter()
+            render(audio_path, script, str(output_path), backend=backend, profile=name)
+            elapsed = time.perf_counter() - start
+            size = output_path.stat().st_size
+            results["profiles"][name] = {
+                "encode_seconds": round(elapsed, 3),
+                "file_bytes": size,
+                "kbit_per_second": round(size * 8 / 1000 / seconds, 1),
+            }
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kodlayıcı profili benchmark'ı")
+    parser.add_argument("--mode", choices=["shorts", "podcast"], default="podcast")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Sentetik ses süresi")
+    parser.add_argument("--backend", choices=["moviepy", "ffmpeg", "segmented"], default="ffmpeg")
+    parser.add_argument("--profiles", nargs="+", default=list(Config.ENCODER_PROFILES))
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.mode, args.seconds, args.backend, args.profiles), indent=2))
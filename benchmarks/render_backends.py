@@ -0,0 +1,44 @@
+# benchmarks/render_backends.py
+"""MoviePy ve ffmpeg (concat demuxer) render motorlarının duvar saati karşılaştırması.
+
+Kullanım: python -m benchmarks.render_backends --mode shorts --seconds 60
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.common import synthetic_script, write_sine_wav
+from src.video_generator import create_shorts_video, create_podcast_video
+
+def run(mode: str, seconds: float, backends: list) -> dict:
+    render = create_shorts_video if mode == "shorts" else create_podcast_video
+    # Shorts ~2.5 kelime/sn, podcast ~2.5 kelime/sn ile yaklaşık aynı süreyi doldurur
+    script = synthetic_script(int(seconds * 2.5))
+    results = {"mode": mode, "seconds": seconds, "backends": {}}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        audio_path = write_sine_wav(Path(temp_dir) / "audio.wav", seconds)
+        for backend in backends:
+            output_path = Path(temp_dir) / f"{mode}_{backend}.mp4"
+            start = time.perf_counter()
+            render(audio_path, script, str(output_path), backend=backend)
+            elapsed = time.perf_counter() - start
+            results["backends"][backend] = {
+                "wall_seconds": round(elapsed, 3),
+                "realtime_factor": round(elapsed / seconds, 4),
+                "file_bytes": output_path.stat().st_size,
+            }
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render motoru benchmark'ı")
+    parser.add_argument("--mode", choices=["shorts", "podcast"], default="shorts")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Sentetik ses süresi")
+    parser.add_argument("--backends", nargs="+", default=["moviepy", "ffmpeg"])
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.mode, args.seconds, args.backends), indent=2))
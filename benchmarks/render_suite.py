@@ -0,0 +1,156 @@
+# benchmarks/render_suite.py
+"""src/video_generator.py render yolu için mikro-benchmark paketi.
+
+Her senaryo ayrı bir alt süreçte çalışır; böylece tepe RSS senaryo başına ölçülür.
+Sonuçlar JSON olarak yazılır ve commit'ler arasında karşılaştırılabilir. Ağ veya GPU
+gerektirmez (sentetik script + sinüs/sessiz WAV, paketli ffmpeg).
+
+Kullanım:
+    python -m benchmarks.render_suite --shorts-seconds 60 --podcast-seconds 120
+    python -m benchmarks.render_suite --cases raster_shorts shorts_video --backends ffmpeg
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from benchmarks.common import synthetic_script, write_sine_wav, ChildRSSSampler, peak_rss_mb, git_commit
+
+CASES = ["raster_shorts", "raster_podcast", "shorts_video", "podcast_video"]
+
+def _run_raster(case: str, count: int) -> dict:
+    from src.video_generator import create_text_image_shorts, create_text_image_podcast
+    from src.utils import timed_stage, get_stage_timings
+
+    if case == "raster_shorts":
+        texts = [" ".join(synthetic_script(6, seed=i).split()[:6]) for i in range(count)]
+        render, size, fontsize = create_text_image_shorts, (1080, 1920), 1000
+    else:
+        texts = [synthetic_script(100, seed=i) for i in range(count)]
+        render, size, fontsize = create_text_image_podcast, (1920, 1080), 60
+
+    start = time.perf_counter()
+    for text in texts:
+        with timed_stage("rasterize"):
+            render(text, size[0], size[1], fontsize=fontsize)
+    wall = time.perf_counter() - start
+    return {
+        "slides": count,
+        "wall_seconds": round(wall, 4),
+        "slides_per_second": round(count / wall, 2),
+        "stages": {k: round(v, 4) for k, v in get_stage_timings().items()},
+    }
+
+def _run_video(case: str, seconds: float, backend: str, profile: str, audio: str) -> dict:
+    from src.config import Config
+    from src.utils import get_stage_timings
+    from src.video_generator import create_shorts_video, create_podcast_video
+
+    render = create_shorts_video if case == "shorts_video" else create_podcast_video
+    fps = Config.get_encoder_profile(profile)["fps"]
+    script = synthetic_script(int(seconds * 2.5))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        audio_path = write_sine_wav(Path(temp_dir) / "audio.wav", seconds, silent=(audio == "silent"))
+        output_path = Path(temp_dir) / "out.mp4"
+        start = time.perf_counter()
+        render(audio_path, script, str(output_path), backend=backend, profile=profile)
+        wall = time.perf_counter() - start
+        size = output_path.stat().st_size
+
+    frames = int(round(seconds * fps))
+    return {
+        "backend": backend,
+        "profile": profile,
+        "audio_seconds": seconds,
+        "frames": frames,
+        "wall_seconds": round(wall, 3),
+        "frames_per_second": round(frames / wall, 2),
+        "stages": {k: round(v, 3) for k, v in get_stage_timings().items()},
+        "file_bytes": size,
+    }
+
+def run_single(args) -> dict:
+    """Tek senaryoyu bu süreçte çalıştırır (alt süreç girişi)."""
+    with ChildRSSSampler() as sampler:
+        if args.single.startswith("raster_"):
+            result = _run_raster(args.single, args.raster_count)
+        else:
+            seconds = args.shorts_seconds if args.single == "shorts_video" else args.podcast_seconds
+            result = _run_video(args.single, seconds, args.single_backend, args.profile, args.audio)
+    result["peak_rss_mb"] = peak_rss_mb(sampler)
+    return result
+
+def run_suite(args) -> dict:
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            "profile": args.profile,
+            "audio": args.audio,
+            "shorts_seconds": args.shorts_seconds,
+            "podcast_seconds": args.podcast_seconds,
+            "raster_count": args.raster_count,
+        },
+        "results": {},
+    }
+
+    for case in args.cases:
+        backends = [None] if case.startswith("raster_") else args.backends
+        for backend in backends:
+            name = case if backend is None else f"{case}[{backend}]"
+            print(f"▶ {name}", file=sys.stderr)
+            cmd = [
+                sys.executable, "-m", "benchmarks.render_suite", "--single", case,
+                "--single-backend", backend or "moviepy",
+                "--profile", args.profile, "--audio", args.audio,
+                "--shorts-seconds", str(args.shorts_seconds),
+                "--podcast-seconds", str(args.podcast_seconds),
+                "--raster-count", str(args.raster_count),
+            ]
+            proc = subprocess.run(cmd, capture_output=True, text=True,
+                                  cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+            if proc.returncode != 0:
+                report["results"][name] = {"error": proc.stderr.strip().splitlines()[-1:]}
+                continue
+            report["results"][name] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render mikro-benchmark paketi")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--backends", nargs="+", choices=["moviepy", "ffmpeg", "segmented"], default=["moviepy", "ffmpeg"])
+    parser.add_argument("--profile", default="upload-default", help="Kodlayıcı profili")
+    parser.add_argument("--audio", choices=["sine", "silent"], default="sine")
+    parser.add_argument("--shorts-seconds", type=float, default=60.0)
+    parser.add_argument("--podcast-seconds", type=float, default=120.0)
+    parser.add_argument("--raster-count", type=int, default=25, help="Rasterizasyon senaryosundaki slayt sayısı")
+    parser.add_argument("--output", default=None, help="JSON çıktı yolu (varsayılan: output/benchmarks/)")
+    parser.add_argument("--single", choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--single-backend", default="moviepy", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(args)))
+        sys.exit(0)
+
+    report = run_suite(args)
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        from src.config import Config
+        output_path = Config.OUTPUT_DIR / "benchmarks" / f"render_{report['commit']}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report, indent=2))
+    print(f"📄 Sonuçlar yazıldı: {output_path}", file=sys.stderr)
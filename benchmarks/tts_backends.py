@@ -0,0 +1,135 @@
+# benchmarks/tts_backends.py
+"""src/tts motorları için gerçek zaman çarpanı (RTF) benchmark'ı.
+
+Bu ortamda kurulu her motor, sabit tohumlu aynı metin üzerinde ayrı bir alt süreçte
+çalıştırılır (soğuk başlangıç: model yükleme dahil). Ölçülenler:
+  - time_to_first_audio: ilk cümlenin tek başına seslendirilme süresi
+  - rtf: tüm metnin sentez süresi / üretilen sesin süresi (< 1 gerçek zamandan hızlı)
+  - cpu_seconds: süreç + alt süreçlerin kullanıcı+sistem CPU süresi
+  - peak_rss_mb: tepe bellek
+TTS önbelleği kapatılır; ağ isteyen motorlar --offline ile atlanır.
+
+Kullanım:
+    python -m benchmarks.tts_backends --words 300
+    python -m benchmarks.tts_backends --backends piper coqui --modes podcast --offline
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from benchmarks.common import synthetic_script, ChildRSSSampler, peak_rss_mb, git_commit
+
+def _cpu_seconds() -> float:
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+def run_single(backend_name: str, mode: str, words: int) -> dict:
+    """Tek motor/mod ölçümü (alt süreç girişi)."""
+    from src.config import Config
+    from src.media import probe_duration
+    from src.tts.backends import get_backend
+    from src.tts.text_chunks import split_sentences
+
+    Config.TTS_CACHE_ENABLED = False
+    backend = get_backend(backend_name)
+    script = synthetic_script(words)
+
+    with ChildRSSSampler() as sampler, tempfile.TemporaryDirectory() as temp_dir:
+        first_path = Path(temp_dir) / f"first.{backend.output_format}"
+        full_path = Path(temp_dir) / f"full.{backend.output_format}"
+
+        start = time.perf_counter()
+        backend.synthesize(split_sentences(script)[0], str(first_path), mode=mode)
+        first_audio = time.perf_counter() - start
+
+        start = time.perf_counter()
+        backend.synthesize(script, str(full_path), mode=mode)
+        wall = time.perf_counter() - start
+        audio_seconds = probe_duration(full_path)
+
+    # Kalıcı işçi havuzları kapatılır ki CPU süreleri RUSAGE_CHILDREN'a yansısın
+    if backend_name == "piper":
+        from src.tts.piper_pool import _close_pools
+        _close_pools()
+
+    return {
+        "backend": backend_name,
+        "mode": mode,
+        "words": words,
+        "audio_seconds": round(audio_seconds, 3),
+        "time_to_first_audio": round(first_audio, 3),
+        "wall_seconds": round(wall, 3),
+        "rtf": round(wall / audio_seconds, 4) if audio_seconds else None,
+        "cpu_seconds": round(_cpu_seconds(), 3),
+        "peak_rss_mb": peak_rss_mb(sampler),
+    }
+
+def run_suite(args) -> dict:
+    from src.tts.backends import available_backends
+
+    available = available_backends(offline=args.offline)
+    backends = [name for name in (args.backends or available) if name in available]
+    skipped = sorted(set(args.backends or []) - set(backends))
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "settings": {"words": args.words, "modes": args.modes, "offline": args.offline},
+        "skipped": skipped,
+        "results": {},
+    }
+
+    for backend in backends:
+        for mode in args.modes:
+            name = f"{backend}[{mode}]"
+            print(f"▶ {name}", file=sys.stderr)
+            cmd = [
+                sys.executable, "-m", "benchmarks.tts_backends",
+                "--single", backend, "--single-mode", mode, "--words", str(args.words),
+            ]
+            proc = subprocess.run(cmd, capture_output=True, text=True,
+                                  cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+            if proc.returncode != 0:
+                report["results"][name] = {"error": proc.stderr.strip().splitlines()[-1:]}
+                continue
+            report["results"][name] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TTS motoru RTF benchmark'ı")
+    parser.add_argument("--backends", nargs="+", default=None, help="Varsayılan: kurulu tüm motorlar")
+    parser.add_argument("--modes", nargs="+", choices=["shorts", "podcast"], default=["shorts", "podcast"])
+    parser.add_argument("--words", type=int, default=200, help="Sabit metnin kelime sayısı")
+    parser.add_argument("--offline", action="store_true", help="Ağ gerektiren motorları atla")
+    parser.add_argument("--output", default=None, help="JSON çıktı yolu (varsayılan: output/benchmarks/)")
+    parser.add_argument("--single", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--single-mode", default="shorts", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(args.single, args.single_mode, args.words)))
+        sys.exit(0)
+
+    report = run_suite(args)
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        from src.config import Config
+        output_path = Config.OUTPUT_DIR / "benchmarks" / f"tts_{report['commit']}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report, indent=2))
+    print(f"📄 Sonuçlar yazıldı: {output_path}", file=sys.stderr)
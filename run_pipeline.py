@@ -1,18 +1,19 @@
 # run_pipeline.py
 import argparse
-import asyncio
 from pathlib import Path
 import tempfile
 import logging
 from src.config import Config
 from src.utils import setup_logging, get_todays_idea, save_upload_log
 from src.script_generator import generate_shorts_script, generate_podcast_script
-from src.video_generator import create_shorts_video, create_podcast_video, generate_voice_with_edge_tts
+from src.video_generator import create_shorts_video, create_podcast_video
+from src.tts.backends import backend_for_mode
+from src.tts.duration_budget import fit_script, record_duration
 from src.upload_video import upload_to_youtube
 
 Config.ensure_directories()
 
-def run_shorts_pipeline():
+def run_shorts_pipeline(profile: str = None):
     logger = setup_logging(Config.OUTPUT_DIR / "shorts.log")
     logger.info("📱 SHORTS PIPELINE BAŞLIYOR...")
 
@@ -26,13 +27,16 @@ def run_shorts_pipeline():
         with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR)) as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Ses üret
-            audio_path = temp_path / "shorts_audio.mp3"
-            asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
+            # Ses üret (modun Config'te seçili TTS motoru); script önce süre bütçesine sığdırılır
+            tts_backend = backend_for_mode("shorts")
+            script, predicted = fit_script(script, "shorts", tts_backend)
+            audio_path = temp_path / f"shorts_audio.{tts_backend.output_format}"
+            tts_backend.synthesize(script, str(audio_path), mode="shorts")
+            record_duration(script, str(audio_path), "shorts", tts_backend, predicted)
 
             # Video üret
             video_path = temp_path / "shorts_video.mp4"
-            create_shorts_video(str(audio_path), script, str(video_path))
+            create_shorts_video(str(audio_path), script, str(video_path), profile=profile)
 
             # YouTube’a yükle (gizli)
             description = f"{script[:300]}...\n\n#shorts #ColdWar #History #SynapseDaily"
@@ -50,7 +54,7 @@ def run_shorts_pipeline():
         logger.exception(f"❌ Shorts pipeline hatası: {str(e)}")
         raise
 
-def run_podcast_pipeline():
+def run_podcast_pipeline(profile: str = None):
     logger = setup_logging(Config.OUTPUT_DIR / "podcast.log")
     logger.info("🎙️ PODCAST PIPELINE BAŞLIYOR...")
 
@@ -64,13 +68,16 @@ def run_podcast_pipeline():
         with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR)) as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Ses üret
-            audio_path = temp_path / "podcast_audio.mp3"
-            asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
+            # Ses üret (modun Config'te seçili TTS motoru); script önce süre bütçesine sığdırılır
+            tts_backend = backend_for_mode("podcast")
+            script, predicted = fit_script(script, "podcast", tts_backend)
+            audio_path = temp_path / f"podcast_audio.{tts_backend.output_format}"
+            tts_backend.synthesize(script, str(audio_path), mode="podcast")
+            record_duration(script, str(audio_path), "podcast", tts_backend, predicted)
 
             # Video üret
             video_path = temp_path / "podcast_video.mp4"
-            create_podcast_video(str(audio_path), script, str(video_path))
+            create_podcast_video(str(audio_path), script, str(video_path), profile=profile)
 
             # YouTube’a yükle (gizli)
             description = (
@@ -96,9 +103,14 @@ def run_podcast_pipeline():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Synapse Daily Pipeline")
     parser.add_argument("--mode", choices=["shorts", "podcast"], required=True, help="Çalıştırılacak mod")
+    parser.add_argument("--profile", choices=list(Config.ENCODER_PROFILES), default=None,
+                        help="Kodlayıcı profili (varsayılan: modun Config profili)")
+    parser.add_argument("--no-llm-cache", action="store_true", help="LLM yanıt önbelleğini atla (yeniden üret)")
     args = parser.parse_args()
+    if args.no_llm_cache:
+        Config.LLM_CACHE_ENABLED = False
 
     if args.mode == "shorts":
-        run_shorts_pipeline()
+        run_shorts_pipeline(args.profile)
     else:
-        run_podcast_pipeline()
+        run_podcast_pipeline(args.profile)
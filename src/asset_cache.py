@@ -0,0 +1,99 @@
+# src/asset_cache.py
+import os
+import hashlib
+import threading
+from pathlib import Path
+import numpy as np
+from PIL import Image
+from src.config import Config
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+RESAMPLE_FILTERS = {
+    "NEAREST": Image.NEAREST,
+    "BILINEAR": Image.BILINEAR,
+    "BICUBIC": Image.BICUBIC,
+    "LANCZOS": Image.LANCZOS,
+}
+
+# Süreç içi önbellek: anahtar -> salt okunur RGB dizi
+_memory_cache = {}
+# (yol, mtime, boyut) -> içerik özeti; her çağrıda dosyayı yeniden hash'lememek için
+_digest_cache = {}
+_lock = threading.Lock()
+
+def _file_digest(path: Path) -> str:
+    """Dosya içeriğinin SHA-256 özetini döndürür (mtime/boyut değişmedikçe tekrar okunmaz)."""
+    stat = path.stat()
+    stat_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    digest = _digest_cache.get(stat_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        _digest_cache[stat_key] = digest
+    return digest
+
+def _cache_file(digest: str, size: tuple, resample: str) -> Path:
+    width, height = size
+    return Config.ASSET_CACHE_DIR / f"bg_{digest[:24]}_{width}x{height}_{resample.lower()}.npy"
+
+def _decode_and_resize(path: Path, size: tuple, resample: str) -> np.ndarray:
+    with Image.open(path) as img:
+        img = img.convert("RGB")
+        if img.size != tuple(size):
+            img = img.resize(tuple(size), RESAMPLE_FILTERS[resample])
+        return np.array(img)
+
+def load_background(path, size: tuple, resample: str = "LANCZOS") -> np.ndarray:
+    """Arka planı (içerik hash'i, çözünürlük, filtre) başına bir kez çözüp boyutlandırır.
+
+    Sonuç bellekte ve Config.ASSET_CACHE_DIR altında .npy olarak tutulur; dönen dizi
+    paylaşıldığı için salt okunurdur.
+    """
+    path = Path(path)
+    resample = resample.upper()
+    if resample not in RESAMPLE_FILTERS:
+        raise ValueError(f"Bilinmeyen yeniden örnekleme filtresi: {resample}")
+
+    digest = _file_digest(path)
+    key = (digest, tuple(size), resample)
+
+    with _lock:
+        cached = _memory_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cache_file = _cache_file(digest, size, resample)
+        frame = None
+        if cache_file.exists():
+            try:
+                frame = np.load(cache_file, allow_pickle=False)
+                logger.info(f"🗂️ Arka plan diskteki önbellekten yüklendi: {cache_file.name}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Bozuk arka plan önbelleği yok sayılıyor ({cache_file.name}): {e}")
+                frame = None
+
+        if frame is None:
+            logger.info(f"🖼️ Arka plan boyutlandırılıyor: {path.name} -> {size[0]}x{size[1]} ({resample})")
+            frame = _decode_and_resize(path, size, resample)
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, "wb") as f:
+                    np.save(f, frame, allow_pickle=False)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning(f"⚠️ Arka plan önbelleği diske yazılamadı: {e}")
+
+        frame.setflags(write=False)
+        _memory_cache[key] = frame
+        return frame
+
+def clear_memory_cache():
+    """Süreç içi arka plan önbelleğini boşaltır (disk önbelleğine dokunmaz)."""
+    with _lock:
+        _memory_cache.clear()
@@ -8,6 +8,7 @@ class Config:
     MODELS_DIR = BASE_DIR / "models"
     TEMP_DIR = BASE_DIR / "temp"
     OUTPUT_DIR = BASE_DIR / "output"
+    ASSET_CACHE_DIR = TEMP_DIR / "asset_cache"
     
     # ✅ EKLENDİ: Dosya yolları
     IDEA_FILE = DATA_DIR / "idea.txt"  # 🟢 Burası eksikti!
@@ -25,11 +26,115 @@ class Config:
     SHORTS_DURATION = 60  # saniye
     PODCAST_DURATION = 900  # saniye (15 dakika)
     
+    # Render motoru (mod başına): "moviepy", "ffmpeg" (concat demuxer, sabit slaytlar)
+    # veya "segmented" (slayt sınırlarında bölünmüş paralel kodlama)
+    SHORTS_RENDER_BACKEND = os.environ.get("SHORTS_RENDER_BACKEND", "moviepy")
+    PODCAST_RENDER_BACKEND = os.environ.get("PODCAST_RENDER_BACKEND", "moviepy")
+    # "segmented" motoru için segment sayısı (0 = işçi sayısı kadar)
+    RENDER_SEGMENTS = int(os.environ.get("RENDER_SEGMENTS", "0"))
+    
+    # Kodlayıcı profilleri: sabit metin + sabit arka plan içeriğine göre ayarlı
+    # (fps, x264 preset, CRF, tune, anahtar kare aralığı, iş parçacığı; 0 = otomatik)
+    ENCODER_PROFILES = {
+        "fast-draft": {"fps": 12, "preset": "ultrafast", "crf": 30, "tune": "stillimage", "keyint": 240, "threads": 0},
+        "stillimage-archive": {"fps": 24, "preset": "slow", "crf": 18, "tune": "stillimage", "keyint": 480, "threads": 0},
+        "upload-default": {"fps": 24, "preset": "medium", "crf": 23, "tune": "stillimage", "keyint": 48, "threads": 4},
+    }
+    SHORTS_ENCODER_PROFILE = os.environ.get("SHORTS_ENCODER_PROFILE", "upload-default")
+    PODCAST_ENCODER_PROFILE = os.environ.get("PODCAST_ENCODER_PROFILE", "upload-default")
+    
+    # Slayt rasterizasyonu için işçi süreç sayısı (0 = CPU sayısı, 1 = seri)
+    RENDER_WORKERS = int(os.environ.get("RENDER_WORKERS", "0"))
+    
+    # Tembel slaytlar: slayt yalnızca zaman çizelgesi ona ulaşınca rasterize edilir ve
+    # bitince bırakılır (bellek senaryo uzunluğundan bağımsız kalır)
+    LAZY_SLIDES = os.environ.get("LAZY_SLIDES", "0") == "1"
+    
+    # Slayt fontu (bulunamazsa PIL varsayılan fontu kullanılır)
+    FONT_PATH = os.environ.get("FONT_PATH", "arial.ttf")
+    
+    # Hata ayıklama: ayarlıysa her render'ın slaytları bu klasöre PNG olarak yazılır
+    SLIDE_DEBUG_DIR = os.environ.get("SLIDE_DEBUG_DIR", "")
+    
+    # Edge TTS: uzun metinler cümle sınırlarında parçalanıp eşzamanlı seslendirilir
+    EDGE_TTS_VOICE = os.environ.get("EDGE_TTS_VOICE", "en-US-GuyNeural")
+    EDGE_TTS_CHUNKED = os.environ.get("EDGE_TTS_CHUNKED", "1") == "1"
+    EDGE_TTS_CHUNK_CHARS = int(os.environ.get("EDGE_TTS_CHUNK_CHARS", "1500"))
+    EDGE_TTS_CONCURRENCY = int(os.environ.get("EDGE_TTS_CONCURRENCY", "4"))
+    EDGE_TTS_RETRIES = int(os.environ.get("EDGE_TTS_RETRIES", "3"))
+    EDGE_TTS_RETRY_DELAY = float(os.environ.get("EDGE_TTS_RETRY_DELAY", "1.0"))
+    EDGE_TTS_WSS_URL = os.environ.get("EDGE_TTS_WSS_URL", "")  # boşsa edge-tts varsayılanı
+    
+    # Mod başına TTS motoru: "edge", "gtts", "piper" veya "coqui" (bkz. benchmarks/tts_backends.py)
+    SHORTS_TTS_BACKEND = os.environ.get("SHORTS_TTS_BACKEND", "edge")
+    PODCAST_TTS_BACKEND = os.environ.get("PODCAST_TTS_BACKEND", "edge")
+    
+    # Süre bütçesi: script, sentezden önce modun süresine sığacak şekilde cümle sınırında kırpılır.
+    # Konuşma hızı (kelime/sn) ses başına önceki çalıştırmalardan öğrenilir.
+    TTS_DURATION_BUDGET = os.environ.get("TTS_DURATION_BUDGET", "1") == "1"
+    SPEECH_RATES_FILE = OUTPUT_DIR / "speech_rates.json"
+    DEFAULT_WORDS_PER_SECOND = float(os.environ.get("DEFAULT_WORDS_PER_SECOND", "2.5"))
+    
+    # Zamanlama izi olmayan seste (Piper, gTTS, Coqui) slaytlar enerji/duraklama hizalamasıyla planlanır
+    ALIGN_AUDIO = os.environ.get("ALIGN_AUDIO", "1") == "1"
+    
+    # Coqui modelleri (mod başına) ve süreç içi model belleği bütçesi
+    SHORTS_TTS_MODEL = os.environ.get("SHORTS_TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC")
+    PODCAST_TTS_MODEL = os.environ.get("PODCAST_TTS_MODEL", "tts_models/en/ljspeech/vits")
+    COQUI_MEMORY_BUDGET_MB = float(os.environ.get("COQUI_MEMORY_BUDGET_MB", "1500"))
+    
+    # Piper: kalıcı ses havuzu (0 = CPU sayısı) ve işçi başına cümle grubu boyutu
+    PIPER_WORKERS = int(os.environ.get("PIPER_WORKERS", "0"))
+    PIPER_BATCH_CHARS = int(os.environ.get("PIPER_BATCH_CHARS", "400"))
+    
+    # Yerel model deposu: indirme kaynağı aynası (http(s)://, file:// veya klasör; boşsa asıl URL'ler)
+    MODEL_MIRROR = os.environ.get("MODEL_MIRROR", "")
+    MODEL_MANIFEST = MODELS_DIR / "manifest.json"
+    COQUI_MODELS_DIR = MODELS_DIR / "coqui"  # Coqui'ye TTS_HOME olarak verilir
+    
+    # TTS ses önbelleği (içerik adresli, boyut sınırlı LRU), birim cümledir. Edge TTS'te yalnızca
+    # önbellekte olmayan cümleler EDGE_TTS_CHUNK_CHARS'a paketlenip istenir, ses kelime sınırlarından bölünür
+    TTS_CACHE_ENABLED = os.environ.get("TTS_CACHE_ENABLED", "1") == "1"
+    TTS_CACHE_DIR = TEMP_DIR / "tts_cache"
+    TTS_CACHE_MAX_MB = float(os.environ.get("TTS_CACHE_MAX_MB", "512"))
+    
+    # LLM sağlayıcıları: eşzamanlı (hedged) yarış; sonraki sağlayıcı bu kadar saniye sonra
+    # (ya da öncekiler başarısız olunca hemen) başlatılır. 0 = hepsi aynı anda.
+    LLM_HEDGED = os.environ.get("LLM_HEDGED", "1") == "1"
+    LLM_HEDGE_STAGGER = float(os.environ.get("LLM_HEDGE_STAGGER", "3.0"))
+    
+    # Ollama / OpenAI uyumlu sağlayıcılar akışla okunur; red kesinleşince istek erken kesilir
+    LLM_STREAMING = os.environ.get("LLM_STREAMING", "1") == "1"
+    
+    # LLM sağlayıcı devre kesicisi: art arda bu kadar hatada URL atlanır, cooldown sonra yoklanır
+    LLM_HEALTH_FILE = OUTPUT_DIR / "provider_health.json"
+    LLM_BREAKER_THRESHOLD = int(os.environ.get("LLM_BREAKER_THRESHOLD", "3"))
+    LLM_BREAKER_COOLDOWN = float(os.environ.get("LLM_BREAKER_COOLDOWN", "600"))
+    LLM_PROBE_TIMEOUT = float(os.environ.get("LLM_PROBE_TIMEOUT", "2.0"))
+    
+    # LLM yanıt önbelleği (SQLite); aynı konu yeniden çalıştırılınca üretim atlanır
+    LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "1") == "1"
+    LLM_CACHE_FILE = OUTPUT_DIR / "llm_cache.sqlite3"
+    LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_MB = float(os.environ.get("LLM_CACHE_MAX_MB", "50"))
+    
+    # Podcast script'i bölümlü üretilir: önce taslak (HOOK, N bölüm, CONCLUSION), sonra
+    # bölümler en fazla PODCAST_SECTION_CONCURRENCY eşzamanlı istekle yazılıp birleştirilir
+    PODCAST_SECTIONED = os.environ.get("PODCAST_SECTIONED", "1") == "1"
+    PODCAST_SECTIONS = int(os.environ.get("PODCAST_SECTIONS", "6"))
+    PODCAST_SECTION_CONCURRENCY = int(os.environ.get("PODCAST_SECTION_CONCURRENCY", "3"))
+    
     # ✅ EKLENDİ: Etiketler
     SHORTS_TAGS = ["ColdWar", "History", "Shorts", "SynapseDaily", "RetroFuturism"]
     PODCAST_TAGS = ["ColdWarTech", "UnbuiltCities", "RetroFuturism", "HistoryPodcast", "SynapseDaily"]
     
+    @classmethod
+    def get_encoder_profile(cls, name: str) -> dict:
+        if name not in cls.ENCODER_PROFILES:
+            raise ValueError(f"Bilinmeyen kodlayıcı profili: {name} (seçenekler: {', '.join(cls.ENCODER_PROFILES)})")
+        return dict(cls.ENCODER_PROFILES[name], name=name)
+    
     @classmethod
     def ensure_directories(cls):
-        for dir_path in [cls.MODELS_DIR, cls.TEMP_DIR, cls.OUTPUT_DIR]:
+        for dir_path in [cls.MODELS_DIR, cls.TEMP_DIR, cls.OUTPUT_DIR, cls.ASSET_CACHE_DIR]:
             dir_path.mkdir(exist_ok=True, parents=True)
@@ -0,0 +1,95 @@
+# src/llm_cache.py
+import json
+import time
+import sqlite3
+import hashlib
+from contextlib import closing
+from pathlib import Path
+from src.config import Config
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+# İstek gövdesinin önbellek anahtarına girmeyen alanları
+_VOLATILE_KEYS = ("messages", "stream", "model")
+
+def request_key(provider: str, payload: dict) -> str:
+    """(sağlayıcı, model, örnekleme seçenekleri, prompt özeti) -> SHA-256 anahtar"""
+    prompt_hash = hashlib.sha256(
+        json.dumps(payload.get("messages", []), sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    options = {k: v for k, v in payload.items() if k not in _VOLATILE_KEYS}
+    material = json.dumps([provider, payload.get("model", ""), options, prompt_hash], sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+class LLMResponseCache:
+    """Doğrulamadan geçmiş LLM yanıtları için SQLite önbelleği.
+
+    Girdiler ttl saniye sonra geçersiz olur; toplam boyut max_bytes'ı aşınca en uzun
+    süredir kullanılmayanlar silinir. Her işlem kendi bağlantısını açar ve kapatır (iş parçacığı
+    güvenli; bağlantı bağlamı yalnızca commit eder, kapatmaz).
+    """
+
+    def __init__(self, path: Path = None, ttl: float = None, max_bytes: int = None):
+        self.path = Path(path or Config.LLM_CACHE_FILE)
+        self.ttl = ttl if ttl is not None else Config.LLM_CACHE_TTL
+        self.max_bytes = max_bytes if max_bytes is not None else int(Config.LLM_CACHE_MAX_MB * 1024 * 1024)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, provider TEXT, model TEXT, content TEXT, "
+                "size INTEGER, created_at REAL, last_used REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=10)
+
+    def get(self, key: str):
+        """Süresi dolmamış yanıtı döndürür (yoksa None)."""
+        now = time.time()
+        with closing(self._connect()) as db, db:
+            row = db.execute(
+                "SELECT content FROM responses WHERE key = ? AND created_at > ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def put(self, key: str, provider: str, model: str, content: str):
+        now = time.time()
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, content, len(content.encode("utf-8")), now, now)
+            )
+        self.evict()
+
+    def evict(self):
+        """Süresi dolanları, ardından boyut sınırını aşan en eski kullanılanları siler."""
+        with closing(self._connect()) as db, db:
+            db.execute("DELETE FROM responses WHERE created_at <= ?", (time.time() - self.ttl,))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            removed = 0
+            for key, size in db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                total -= size
+                removed += 1
+            logger.info(f"♻️ LLM önbelleğinden {removed} yanıt silindi")
+
+_cache = None
+
+def get_llm_cache():
+    """Etkinse paylaşılan önbelleği, LLM_CACHE_ENABLED kapalıysa None döndürür."""
+    global _cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = LLMResponseCache()
+    return _cache
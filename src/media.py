@@ -0,0 +1,104 @@
+# src/media.py
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+import numpy as np
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+def ffmpeg_binary() -> str:
+    """Kullanılacak ffmpeg yolunu bulur (FFMPEG_BINARY > imageio-ffmpeg > PATH)."""
+    env_binary = os.environ.get("FFMPEG_BINARY")
+    if env_binary and env_binary != "ffmpeg-imageio":
+        return env_binary
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        pass
+    found = shutil.which("ffmpeg")
+    if not found:
+        raise RuntimeError("❌ ffmpeg bulunamadı! Sistem paketini veya imageio-ffmpeg'i kurun.")
+    return found
+
+def run_ffmpeg(args: list):
+    """ffmpeg'i verilen argümanlarla çalıştırır; hata olursa stderr'i loglar."""
+    cmd = [ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y"] + [str(a) for a in args]
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"ffmpeg hatası:\nKomut: {' '.join(cmd)}\nStderr: {e.stderr}")
+        raise
+
+# Konteyner -> yeniden kodlamadan taşınabilen ses kodekleri
+AUDIO_COPY_CODECS = {
+    ".mp4": {"aac", "mp3", "alac"},
+    ".m4v": {"aac", "mp3", "alac"},
+    ".mov": {"aac", "mp3", "alac", "pcm_s16le"},
+    ".mkv": {"aac", "mp3", "opus", "vorbis", "flac", "pcm_s16le"},
+    ".webm": {"opus", "vorbis"},
+}
+
+def _probe_header(path: str) -> str:
+    """Yalnızca dosya başlığını okur ('ffmpeg -i'); akışlar çözülmez."""
+    result = subprocess.run(
+        [ffmpeg_binary(), "-hide_banner", "-i", str(path)],
+        capture_output=True, text=True
+    )
+    return result.stderr
+
+def probe_duration(path: str) -> float:
+    """Medya süresini başlıktan okur (ffprobe varsa onunla); tam çözme yapılmaz."""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "default=nw=1:nk=1", str(path)],
+            capture_output=True, text=True
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            pass
+    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", _probe_header(path))
+    if not match:
+        raise RuntimeError(f"❌ Süre okunamadı: {path}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+def probe_audio_codec(path: str) -> str:
+    """İlk ses akışının kodek adını döndürür (örn. 'mp3', 'aac', 'pcm_s16le')."""
+    match = re.search(r"Stream #\S+.*?: Audio: (\w+)", _probe_header(path))
+    return match.group(1) if match else ""
+
+def audio_codec_args(audio_path: str, output_path: str) -> list:
+    """Konteyner izin veriyorsa sesi kopyalar, vermiyorsa AAC'ye kodlar."""
+    codec = probe_audio_codec(audio_path)
+    if codec in AUDIO_COPY_CODECS.get(Path(output_path).suffix.lower(), set()):
+        return ["-c:a", "copy"]
+    return ["-c:a", "aac"]
+
+def mux_audio(video_path: str, audio_path: str, output_path: str, duration: float = None):
+    """Yalnız-video akışına orijinal sesi tek ffmpeg geçişinde ekler (video kopyalanır)."""
+    args = [
+        "-i", video_path,
+        "-i", audio_path,
+        "-map", "0:v:0", "-map", "1:a:0",
+        "-c:v", "copy",
+        *audio_codec_args(audio_path, output_path),
+    ]
+    if duration is not None:
+        args += ["-t", f"{duration:.3f}"]
+    run_ffmpeg(args + ["-movflags", "+faststart", output_path])
+    return output_path
+
+def decode_pcm(path: str, sample_rate: int = 16000):
+    """Sesi tek geçişte mono 16-bit PCM'e çözer ve int16 NumPy dizisi olarak döndürür."""
+    cmd = [
+        ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+        "-i", str(path), "-ac", "1", "-ar", str(sample_rate), "-f", "s16le", "-"
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype="<i2")
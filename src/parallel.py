@@ -0,0 +1,30 @@
+# src/parallel.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+def resolve_workers(requested: int = None) -> int:
+    """İstenen işçi sayısını CPU sayısıyla sınırlar (None/0 = tüm çekirdekler)."""
+    cpus = os.cpu_count() or 1
+    if not requested or requested <= 0:
+        return cpus
+    return max(1, min(requested, cpus))
+
+def ordered_map(func, items, workers: int = None, initializer=None, initargs: tuple = ()) -> list:
+    """func'u süreç havuzunda çalıştırır, sonuçları girdi sırasıyla döndürür.
+
+    Tek çekirdekte veya tek öğede havuz kurulmaz; iş aynı süreçte seri yapılır.
+    """
+    items = list(items)
+    workers = min(resolve_workers(workers), len(items))
+    
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+    
+    logger.info(f"⚙️ {len(items)} iş {workers} sürece dağıtılıyor...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,107 @@
+# src/provider_health.py
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from src.config import Config
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+# URL ve istek türü başına saklanan son başarılı gecikme sayısı (p50 için)
+LATENCY_WINDOW = 20
+
+def _latencies(entry: dict) -> dict:
+    """İstek türü -> gecikmeler; eski kayıtlardaki düz liste tam script gecikmesi sayılır."""
+    latencies = entry.get("latencies") or {}
+    return {"script": latencies} if isinstance(latencies, list) else latencies
+
+class ProviderHealth:
+    """LLM sağlayıcı URL'leri için kalıcı sağlık kaydı ve devre kesici.
+
+    Her URL için art arda hata sayısı, istek türü başına (tam script, taslak, bölüm) son
+    başarılı gecikmeler ve doğrulama retleri JSON'da tutulur. threshold kadar art arda hatadan sonra devre açılır ve URL atlanır;
+    cooldown dolunca yarı açık duruma geçilir: ucuz bir yoklama başarılıysa tek bir
+    gerçek istek denenir, başarıda devre kapanır, hatada yeniden açılır.
+    """
+
+    def __init__(self, path: Path = None, threshold: int = None, cooldown: float = None):
+        self.path = Path(path or Config.LLM_HEALTH_FILE)
+        self.threshold = threshold if threshold is not None else Config.LLM_BREAKER_THRESHOLD
+        self.cooldown = cooldown if cooldown is not None else Config.LLM_BREAKER_COOLDOWN
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update(self, url: str, change):
+        with self._lock:
+            data = self.load()
+            entry = data.setdefault(url, {
+                "failures": 0, "opened_at": None, "latencies": {}, "rejects": 0, "last_error": None
+            })
+            change(entry)
+            entry["updated_at"] = time.time()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+    def state(self, url: str) -> str:
+        """"closed", "open" ya da "half_open" (bekleme süresi dolmuş açık devre)."""
+        entry = self.load().get(url)
+        if not entry or entry["opened_at"] is None:
+            return "closed"
+        if time.time() - entry["opened_at"] >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def p50(self, url: str, kind: str = "script"):
+        latencies = sorted(_latencies(self.load().get(url, {})).get(kind, []))
+        return latencies[len(latencies) // 2] if latencies else None
+
+    def record_success(self, url: str, latency: float, kind: str = "script"):
+        """Doğrulanmış yanıt; gecikme yalnızca burada ve kendi istek türünün penceresine eklenir."""
+        def change(entry):
+            entry["failures"] = 0
+            entry["opened_at"] = None
+            latencies = _latencies(entry)
+            latencies[kind] = (latencies.get(kind, []) + [round(latency, 3)])[-LATENCY_WINDOW:]
+            entry["latencies"] = latencies
+        self._update(url, change)
+
+    def record_reject(self, url: str):
+        """Sağlayıcı yanıt verdi ama içerik doğrulamadan geçmedi (erişilebilir sayılır).
+
+        Erken kesilen akışların süresi kısa olduğundan gecikme penceresine eklenmez; aksi
+        halde sürekli reddedilen sağlayıcı en hızlı görünüp yarışta öne alınırdı.
+        """
+        def change(entry):
+            entry["rejects"] += 1
+            entry["failures"] = 0
+            entry["opened_at"] = None
+        self._update(url, change)
+
+    def record_failure(self, url: str, error: str):
+        def change(entry):
+            entry["failures"] += 1
+            entry["last_error"] = error[:300]
+            if entry["failures"] >= self.threshold or entry["opened_at"] is not None:
+                if entry["opened_at"] is None:
+                    logger.warning(f"🔌 Devre açıldı: {url} ({entry['failures']} art arda hata)")
+                entry["opened_at"] = time.time()
+        self._update(url, change)
+
+    def order(self, providers: list, urls: dict, kind: str = "script") -> list:
+        """Sağlayıcıları istek türünün son p50 gecikmesine göre sıralar; ölçümü olmayanlar sonda, ilk sırayla."""
+        def key(item):
+            index, provider = item
+            p50 = self.p50(urls[provider], kind)
+            return (p50 is None, p50 or 0.0, index)
+        return [provider for _, provider in sorted(enumerate(providers), key=key)]
@@ -0,0 +1,308 @@
+# src/render_engine.py
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+import numpy as np
+from moviepy.editor import CompositeVideoClip, ImageClip, VideoClip
+from PIL import Image
+from src.config import Config
+from src.media import run_ffmpeg, audio_codec_args
+from src.parallel import ordered_map, resolve_workers
+from src.utils import setup_logging, timed_stage
+
+logger = setup_logging()
+
+def resolve_profile(profile=None) -> dict:
+    """Profil adını veya sözlüğünü kodlayıcı ayarlarına çevirir (varsayılan: upload-default)."""
+    if isinstance(profile, dict):
+        return profile
+    return Config.get_encoder_profile(profile or "upload-default")
+
+def x264_params(profile: dict) -> list:
+    """Profilin CRF/tune/anahtar kare ayarlarını ffmpeg argümanlarına çevirir."""
+    return ["-crf", str(profile["crf"]), "-tune", profile["tune"], "-g", str(profile["keyint"])]
+
+def x264_args(profile: dict) -> list:
+    """ffmpeg'e doğrudan verilecek tam libx264 argümanları."""
+    return (["-c:v", "libx264", "-preset", profile["preset"]] + x264_params(profile)
+            + ["-threads", str(profile["threads"]), "-pix_fmt", "yuv420p"])
+
+class LazySlide:
+    """Rasterizasyonu, zaman çizelgesi slayta ulaşana kadar erteleyen hafif slayt tanımı.
+
+    factory: argümansız çağrıldığında PIL görüntüsü döndüren (picklable) nesne,
+    örn. functools.partial(create_text_image_podcast, metin, ...).
+    """
+    __slots__ = ("factory", "transparent")
+
+    def __init__(self, factory, transparent: bool = True):
+        self.factory = factory
+        self.transparent = transparent
+
+    def render(self) -> Image.Image:
+        with timed_stage("rasterize"):
+            return self.factory()
+
+def materialize(slide):
+    """LazySlide ise şimdi rasterize eder, değilse görüntüyü olduğu gibi döndürür."""
+    return slide.render() if isinstance(slide, LazySlide) else slide
+
+def slide_arrays(text_img: Image.Image):
+    """(rgb, alfa maskesi | None, konum) üçlüsü; RGBA -> maske ayrımı bir kez yapılır.
+
+    Saydam slaytlar yalnızca görünür bölgeye kırpılır, böylece hem bellekte tutulan
+    dizi hem de kare başına birleştirme alanı küçülür. Tamamen boş slaytta None döner.
+    """
+    if text_img.mode == "RGBA":
+        bbox = text_img.getchannel("A").getbbox()
+        if bbox is None:
+            return None
+        region = np.asarray(text_img.crop(bbox))
+        return region[:, :, :3], region[:, :, 3].astype(np.float32) / 255.0, tuple(bbox[:2])
+    return np.asarray(text_img.convert("RGB")), None, (0, 0)
+
+class SlideWindow:
+    """Zaman çizelgesinde yalnızca oynayan slaytları bellekte tutan pencere.
+
+    Bir slayt ilk karesi istendiğinde rasterize edilir; yeni bir slayt yüklenirken
+    bitişi geçmiş slaytlar bırakılır ve en fazla max_resident slayt tutulur.
+    """
+    _EMPTY = (np.zeros((1, 1, 3), dtype=np.uint8), np.zeros((1, 1), dtype=np.float32), (0, 0))
+
+    def __init__(self, max_resident: int = 2):
+        self.max_resident = max(1, max_resident)
+        self.rasterized = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, slide: LazySlide, start_time: float, end_time: float):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        for stale in [k for k, (end, _) in self._entries.items() if end <= start_time]:
+            del self._entries[stale]
+
+        arrays = slide_arrays(slide.render()) or self._EMPTY
+        self._entries[key] = (end_time, arrays)
+        self.rasterized += 1
+        while len(self._entries) > self.max_resident:
+            self._entries.popitem(last=False)
+        return arrays
+
+class LazySlideClip(VideoClip):
+    """Karesini SlideWindow'dan alan klip; slayt yalnızca oynarken bellekte durur."""
+
+    def __init__(self, slide: LazySlide, start_time: float, duration: float, window: SlideWindow, size: tuple):
+        VideoClip.__init__(self)
+        key = object()
+        end_time = start_time + duration
+
+        def load():
+            return window.get(key, slide, start_time, end_time)
+
+        self.size = size
+        self.make_frame = lambda t: load()[0]
+        self.pos = lambda t: load()[2]
+        if slide.transparent:
+            self.mask = VideoClip(make_frame=lambda t: load()[1], ismask=True)
+            self.mask.size = size
+
+def slide_clip(text_img, start_time: float, duration: float, window: SlideWindow = None, size: tuple = None):
+    """Slaytı diske yazmadan klibe çevirir; LazySlide için pencereli tembel klip kurar."""
+    if isinstance(text_img, LazySlide):
+        clip = LazySlideClip(text_img, start_time, duration, window or SlideWindow(), size)
+        return clip.set_duration(duration).set_start(start_time)
+
+    arrays = slide_arrays(text_img)
+    if arrays is None:
+        return None
+    rgb, alpha, pos = arrays
+    clip = ImageClip(rgb)
+    if alpha is not None:
+        clip = clip.set_mask(ImageClip(alpha, ismask=True)).set_position(pos)
+    return clip.set_duration(duration).set_start(start_time)
+
+def _compose_slide(background: Image.Image, slide) -> Image.Image:
+    """Slaytı arka planın üzerine bir kez yerleştirir (RGBA ise alfa ile)."""
+    slide = materialize(slide)
+    if isinstance(slide, np.ndarray):
+        slide = Image.fromarray(slide)
+    if slide.mode == "RGBA":
+        frame = background.convert("RGBA")
+        frame.alpha_composite(slide)
+        return frame.convert("RGB")
+    return slide.convert("RGB")
+
+def _timeline(slides: list, total_duration: float) -> list:
+    """(görüntü|None, süre) listesi üretir; boşluklar None (yalnız arka plan) ile doldurulur."""
+    entries = []
+    cursor = 0.0
+    for image, start, duration in sorted(slides, key=lambda s: s[1]):
+        if start >= total_duration:
+            break
+        if start > cursor:
+            entries.append((None, start - cursor))
+        end = min(start + duration, total_duration)
+        if end > max(start, cursor):
+            entries.append((image, end - max(start, cursor)))
+            cursor = end
+    if cursor < total_duration:
+        entries.append((None, total_duration - cursor))
+    return entries
+
+def render_static_slides(background: np.ndarray, slides: list, audio_path: str, output_path: str,
+                         total_duration: float, profile=None):
+    """Sabit slaytları ffmpeg concat demuxer ile kodlar; kare başına Python birleştirmesi yapılmaz.
+
+    slides: (PIL görüntü veya dizi, başlangıç, süre) listesi. Her slayt arka plana bir kez
+    basılır, PNG olarak yazılır ve ffmpeg'e kendi süresiyle verilir.
+    """
+    profile = resolve_profile(profile)
+    bg_image = Image.fromarray(np.asarray(background)).convert("RGB")
+    entries = _timeline(slides, total_duration)
+
+    Config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR), prefix="slides_") as work_dir:
+        work_path = Path(work_dir)
+        bg_file = None
+        lines = ["ffconcat version 1.0"]
+
+        for i, (image, duration) in enumerate(entries):
+            with timed_stage("composite"):
+                if image is None:
+                    if bg_file is None:
+                        bg_file = work_path / "background.png"
+                        bg_image.save(bg_file, compress_level=1)
+                    frame_file = bg_file
+                else:
+                    frame_file = work_path / f"slide_{i:05d}.png"
+                    _compose_slide(bg_image, image).save(frame_file, compress_level=1)
+            lines.append(f"file '{frame_file.name}'")
+            lines.append(f"duration {duration:.6f}")
+
+        # concat demuxer son girdinin süresini ancak dosya tekrarlanırsa uygular
+        if entries:
+            lines.append(lines[-2])
+
+        list_file = work_path / "slides.ffconcat"
+        list_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        logger.info(f"🎞️ ffmpeg ile {len(entries)} slayt kodlanıyor...")
+        with timed_stage("encode"):
+            run_ffmpeg([
+                "-f", "concat", "-safe", "0", "-i", list_file,
+                "-i", audio_path,
+                "-map", "0:v:0", "-map", "1:a:0",
+                "-vf", f"fps={profile['fps']}",
+                *x264_args(profile),
+                *audio_codec_args(audio_path, output_path),
+                "-t", f"{total_duration:.3f}",
+                "-movflags", "+faststart",
+                output_path,
+            ])
+
+    return output_path
+
+def _segment_bounds(slides: list, total_duration: float, segments: int, fps: int) -> list:
+    """Zaman çizelgesini slayt sınırlarında, kare ızgarasına hizalı N parçaya böler."""
+    frame_count = int(round(total_duration * fps))
+    cut_frames = sorted({
+        int(round(start * fps)) for _, start, _ in slides
+        if 0 < int(round(start * fps)) < frame_count
+    })
+    bounds = [0]
+    for k in range(1, segments):
+        target = k * frame_count / segments
+        candidates = [f for f in cut_frames if f > bounds[-1]]
+        if not candidates:
+            break
+        bounds.append(min(candidates, key=lambda f: abs(f - target)))
+    bounds.append(frame_count)
+    return sorted(set(bounds))
+
+def _encode_segment(job: dict) -> str:
+    """İşçi süreç: bir segmenti sessiz (yalnız video) olarak MoviePy ile kodlar."""
+    duration = job["duration"]
+    background = ImageClip(job["background"]).set_duration(duration)
+    window = SlideWindow()
+    clips = [
+        clip for clip in (slide_clip(img, start, dur, window, background.size) for img, start, dur in job["slides"])
+        if clip is not None
+    ]
+    video = CompositeVideoClip([background] + clips).set_duration(duration)
+    profile = job["profile"]
+    video.write_videofile(
+        job["output_path"],
+        fps=profile["fps"],
+        codec="libx264",
+        preset=profile["preset"],
+        ffmpeg_params=x264_params(profile),
+        audio=False,
+        logger=None,
+        threads=profile["threads"]
+    )
+    return job["output_path"]
+
+def render_segmented(background: np.ndarray, slides: list, audio_path: str, output_path: str,
+                     total_duration: float, profile=None, segments: int = None, workers: int = None):
+    """Zaman çizelgesini slayt sınırlarında bölüp segmentleri paralel kodlar.
+
+    Segmentler kayıpsız (stream copy) birleştirilir; ses en sonda tek seferde eklenir,
+    böylece segment geçişlerinde ses dikişi oluşmaz.
+    """
+    profile = resolve_profile(profile)
+    fps = profile["fps"]
+    workers = resolve_workers(workers if workers is not None else Config.RENDER_WORKERS)
+    segments = segments or Config.RENDER_SEGMENTS or workers
+    bounds = _segment_bounds(slides, total_duration, max(1, segments), fps)
+    background = np.asarray(background)
+
+    Config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR), prefix="segments_") as work_dir:
+        work_path = Path(work_dir)
+        jobs = []
+        for i, (first, last) in enumerate(zip(bounds[:-1], bounds[1:])):
+            seg_start, seg_end = first / fps, last / fps
+            seg_slides = []
+            for img, start, duration in slides:
+                end = start + duration
+                if end <= seg_start or start >= seg_end:
+                    continue
+                local_start = max(start, seg_start) - seg_start
+                local_end = min(end, seg_end) - seg_start
+                seg_slides.append((img, local_start, local_end - local_start))
+            jobs.append({
+                "background": background,
+                "slides": seg_slides,
+                "duration": (last - first) / fps,
+                # Paralellik segmentlerden gelir; her işçi tek iş parçacığıyla kodlar
+                "profile": dict(profile, threads=1),
+                "output_path": str(work_path / f"segment_{i:03d}.mp4"),
+            })
+
+        logger.info(f"🧩 {len(jobs)} segment {min(workers, len(jobs))} süreçte kodlanıyor...")
+        # Birleştirme işçi süreçlerde kodlamayla iç içe yapılır; tek aşama olarak ölçülür
+        with timed_stage("encode"):
+            segment_files = ordered_map(_encode_segment, jobs, workers)
+
+        list_file = work_path / "segments.ffconcat"
+        list_file.write_text(
+            "ffconcat version 1.0\n" + "".join(f"file '{Path(f).name}'\n" for f in segment_files),
+            encoding="utf-8"
+        )
+
+        logger.info("🔗 Segmentler birleştiriliyor ve ses ekleniyor...")
+        with timed_stage("mux"):
+            run_ffmpeg([
+                "-f", "concat", "-safe", "0", "-i", list_file,
+                "-i", audio_path,
+                "-map", "0:v:0", "-map", "1:a:0",
+                "-c:v", "copy",
+                *audio_codec_args(audio_path, output_path),
+                "-t", f"{total_duration:.3f}",
+                "-movflags", "+faststart",
+                output_path,
+            ])
+
+    return output_path
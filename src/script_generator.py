@@ -1,14 +1,171 @@
 # src/script_generator.py
 import requests
 import json
+import re
 import time
+import queue
 import random
 import os
+import threading
+from urllib.parse import urlsplit
 from src.config import Config
 from src.utils import setup_logging
+from src.provider_health import ProviderHealth
+from src.llm_cache import get_llm_cache, request_key
+from src.tts.text_chunks import sentence_spans
 
 logger = setup_logging()
 
+SYSTEM_PROMPT = "You are a professional YouTube content creator. All information must be accurate, well-researched, and factually correct. Never invent facts or make unverified claims. If you're unsure about something, say you don't know rather than guessing."
+
+PROVIDER_LABELS = {
+    "ollama": "Ollama",
+    "lmstudio": "LM Studio",
+    "textgen": "Text Generation WebUI"
+}
+
+# Akışla okunabilen sağlayıcılar (Ollama NDJSON, OpenAI uyumlu SSE)
+STREAMING_PROVIDERS = ("ollama", "lmstudio")
+
+UNRELIABLE_PHRASES = [
+    "I think", "I believe", "might have", "could have been", "possibly", 
+    "maybe", "some people say", "it is said that", "legend has it",
+    "no one knows", "nobody knows", "experts think", "scientists believe"
+]
+
+CONSISTENCY_RULE = """
+RULE NUMBER ONE: All content must be FACTUALLY ACCURATE and VERIFIABLE. 
+- Never invent facts, statistics, quotes, or historical events
+- If you don't know something, say "Historical records show..." or "According to verified sources..."
+- All claims must be based on real historical/scientific evidence
+- Double-check dates, names, and technical details before writing
+- When in doubt, choose the most conservative, well-documented version
+- NO speculation, NO "might have been", NO "could have happened"
+- Only use information that can be verified through multiple reliable sources
+- This rule is non-negotiable and must be followed in every sentence
+"""
+
+# Bölümlü podcast taslağının satır biçimi: "HOOK: ...", "SECTION 2: ...", "CONCLUSION: ..."
+OUTLINE_LINE = re.compile(
+    r"^[\s*#>-]*\**\s*(HOOK|SECTION\s*\d+|CONCLUSION)\s*\**\s*[:.\-–]\s*\**\s*(.+)$", re.IGNORECASE
+)
+# Bölüm metinleri arasına konan ayraç
+SECTION_SEPARATOR = "\n\n"
+# Karakter bütçesi payı; giriş ve kapanış bir gövde bölümünün yarısı kadardır
+SECTION_WEIGHTS = {"HOOK": 0.5, "CONCLUSION": 0.5}
+# Bölüm (ve birleştirilmiş script) bütçesinin en az bu kadarını doldurmalıdır
+SECTION_MIN_SHARE = 0.25
+OUTLINE_TOKEN_BUDGET = 600
+# Dış iptal işareti verilmiş yarışın sonuç kuyruğunu yoklama aralığı (sn)
+CANCEL_POLL_SECONDS = 0.2
+
+def token_budget(mode: str) -> int:
+    return 1000 if mode == "shorts" else 5000
+
+def trim_to_sentence(text: str, max_chars: int) -> str:
+    """Metni max_chars içinde kalan son cümle sonunda keser (cümle ortasında kesmez).
+    
+    Cümle sınırları TTS parçalamasıyla aynıdır (sentence_spans). Sınırın ilk yarısında
+    hiç cümle sonu yoksa metin karakter sınırında kesilir.
+    """
+    if len(text) <= max_chars:
+        return text
+    end = max((end for _, end in sentence_spans(text) if end <= max_chars), default=0)
+    if end < max_chars // 2:
+        end = max_chars
+    return text[:end].rstrip()
+
+def unreliable_phrase(text: str) -> str:
+    """Metindeki ilk güvenilmez ifade (yoksa None); akış doğrulaması aynı listeyi kullanır."""
+    lower = text.lower()
+    for phrase in UNRELIABLE_PHRASES:
+        if phrase.lower() in lower:
+            return phrase
+    return None
+
+def parse_outline(text: str, sections: int) -> list:
+    """Taslak yanıtını [(etiket, açıklama), ...] listesine çevirir.
+    
+    HOOK, en az iki gövde bölümü ve CONCLUSION yoksa None döner; fazladan gövde
+    bölümleri atılır.
+    """
+    hook, body, conclusion = None, [], None
+    for line in text.splitlines():
+        match = OUTLINE_LINE.match(line.strip())
+        if not match:
+            continue
+        label, description = match.group(1).upper(), match.group(2).strip(" *")
+        if label == "HOOK":
+            hook = hook or description
+        elif label == "CONCLUSION":
+            conclusion = conclusion or description
+        else:
+            body.append(description)
+    if not hook or not conclusion or len(body) < 2:
+        return None
+    body = body[:sections]
+    return (
+        [("HOOK", hook)]
+        + [(f"SECTION {n}", description) for n, description in enumerate(body, 1)]
+        + [("CONCLUSION", conclusion)]
+    )
+
+def section_budgets(outline: list, char_limit: int) -> list:
+    """Toplam karakter sınırını (ayraçlar düşülerek) bölümlere ağırlıklarıyla paylaştırır."""
+    weights = [SECTION_WEIGHTS.get(label, 1.0) for label, _ in outline]
+    usable = char_limit - len(SECTION_SEPARATOR) * (len(outline) - 1)
+    return [int(usable * weight / sum(weights)) for weight in weights]
+
+def section_token_budget(max_chars: int) -> int:
+    """Bölüm için token sınırı: ~4 karakter/token, kırpma payıyla birlikte."""
+    return max_chars // 3 + 100
+
+class CancelGroup:
+    """Birden çok iptal işaretini tek işaret gibi gösterir: herhangi biri verilmişse iptal."""
+    
+    def __init__(self, *events):
+        self.events = [event for event in events if event is not None]
+    
+    def is_set(self) -> bool:
+        return any(event.is_set() for event in self.events)
+
+class StreamValidator:
+    """Akışla gelen metni artımlı doğrular.
+    
+    Yalnızca sonradan düzelmesi imkânsız redleri erken yakalar: güvenilmez ifade
+    (_validate_content aynı listeyle reddeder) ve token bütçesinin aşılması. Konu ve
+    CTA kontrolleri metin tamamlanınca _validate_content ile yapılır.
+    """
+    
+    def __init__(self, mode: str, budget: int = None):
+        self.parts = []
+        self.lower = ""
+        self.tokens = 0
+        self.budget = budget or token_budget(mode)
+        self._phrases = [phrase.lower() for phrase in UNRELIABLE_PHRASES]
+        self._overlap = max(len(phrase) for phrase in self._phrases)
+    
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+    
+    def feed(self, delta: str) -> str:
+        """Yeni parçayı ekler; red kesinleştiyse nedenini, değilse None döndürür."""
+        if not delta:
+            return None
+        self.parts.append(delta)
+        self.tokens += 1
+        # Yalnızca yeni parça ve ifade uzunluğu kadar öncesi taranır
+        window_start = max(0, len(self.lower) - self._overlap)
+        self.lower += delta.lower()
+        window = self.lower[window_start:]
+        for phrase in self._phrases:
+            if phrase in window:
+                return f"unreliable phrase '{phrase}'"
+        if self.tokens > self.budget:
+            return f"token budget exceeded ({self.budget})"
+        return None
+
 class OpenSourceAIAPI:
     """GitHub üzerinde çalışan açık kaynaklı AI entegrasyonu - giriş gerektirmez"""
     
@@ -18,168 +175,272 @@ class OpenSourceAIAPI:
         self.lmstudio_url = os.getenv("LMSTUDIO_URL", "http://localhost:1234/v1/chat/completions")
         self.textgen_url = os.getenv("TEXTGEN_URL", "http://localhost:5000/api/v1/chat")
         self.provider_order = ["ollama", "lmstudio", "textgen"]
+        self.timeouts = {"ollama": 120, "lmstudio": 60, "textgen": 120}
+        self.hedged = Config.LLM_HEDGED
+        self.hedge_stagger = Config.LLM_HEDGE_STAGGER
+        self.streaming = Config.LLM_STREAMING
+        self.health = ProviderHealth()
+        self._local = threading.local()
     
-    def generate_with_ollama(self, topic: str, mode: str = "shorts", model: str = "llama3") -> str:
-        """Ollama ile yerel script üretimi (en hızlı ve ücretsiz)"""
-        try:
-            prompt = self._create_prompt(topic, mode)
-            
-            payload = {
+    def _session(self) -> requests.Session:
+        """İş parçacığı başına kalıcı (keep-alive) HTTP oturumu"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
+    def _provider_url(self, provider: str) -> str:
+        return {"ollama": self.ollama_url, "lmstudio": self.lmstudio_url, "textgen": self.textgen_url}[provider]
+    
+    def _build_payload(self, provider: str, prompt: str, mode: str, model: str = "llama3",
+                       max_tokens: int = None) -> dict:
+        """Sağlayıcıya özgü istek gövdesi"""
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        if provider == "ollama":
+            options = {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "repeat_penalty": 1.1
+            }
+            # Açık bütçe (ör. podcast bölümleri) Ollama'ya da iletilir
+            if max_tokens:
+                options["num_predict"] = max_tokens
+            return {
                 "model": model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional YouTube content creator. All information must be accurate, well-researched, and factually correct. Never invent facts or make unverified claims. If you're unsure about something, say you don't know rather than guessing."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                "messages": messages,
                 "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "repeat_penalty": 1.1
-                }
-            }
-            
-            response = requests.post(
-                self.ollama_url,
-                json=payload,
-                timeout=120
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "message" in result and "content" in result["message"]:
-                    content = result["message"]["content"].strip()
-                    if self._validate_content(content, topic, mode):
-                        return content
-            
-            logger.warning(f"⚠️ Ollama failed or returned invalid content")
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Ollama error: {str(e)}")
-            return None
-    
-    def generate_with_lmstudio(self, topic: str, mode: str = "shorts") -> str:
-        """LM Studio ile script üretimi (açık kaynaklı, giriş gerektirmez)"""
-        try:
-            prompt = self._create_prompt(topic, mode)
-            
-            headers = {
-                "Content-Type": "application/json"
+                "options": options
             }
-            
-            payload = {
+        max_tokens = max_tokens or token_budget(mode)
+        if provider == "lmstudio":
+            return {
                 "model": "local-model",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional YouTube content creator. All information must be accurate, well-researched, and factually correct. Never invent facts or make unverified claims. If you're unsure about something, say you don't know rather than guessing."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                "messages": messages,
                 "temperature": 0.7,
-                "max_tokens": 1000 if mode == "shorts" else 5000,
+                "max_tokens": max_tokens,
                 "stream": False
             }
-            
-            response = requests.post(
-                self.lmstudio_url,
-                headers=headers,
-                json=payload,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "choices" in result and len(result["choices"]) > 0:
-                    content = result["choices"][0]["message"]["content"].strip()
-                    if self._validate_content(content, topic, mode):
-                        return content
-            
-            logger.warning(f"⚠️ LM Studio API returned error: {response.status_code}")
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ LM Studio API error: {str(e)}")
+        return {
+            "messages": messages,
+            "max_new_tokens": max_tokens,
+            "temperature": 0.7,
+            "stop": ["<|eot_id|>", "<|end_of_text|>"]
+        }
+    
+    def _parse_content(self, provider: str, result: dict) -> str:
+        """Sağlayıcı yanıtından metni çıkarır (yoksa None)"""
+        if provider == "ollama":
+            if "message" in result and "content" in result["message"]:
+                return result["message"]["content"].strip()
             return None
+        if "choices" in result and len(result["choices"]) > 0:
+            choice = result["choices"][0]
+            if "message" in choice:
+                return choice["message"]["content"].strip()
+            if "text" in choice:
+                return choice["text"].strip()
+        return None
     
-    def generate_with_textgen(self, topic: str, mode: str = "shorts") -> str:
-        """Text Generation WebUI ile script üretimi (açık kaynaklı)"""
+    def _generate(self, provider: str, topic: str, mode: str = "shorts", model: str = "llama3",
+                  cancel: threading.Event = None, prompt: str = None, validate=None,
+                  max_tokens: int = None, kind: str = "script") -> str:
+        """Tek sağlayıcıdan script ister; yalnızca doğrulamayı geçen içerik döner.
+        
+        prompt/validate/max_tokens verilmezse modun tam script prompt'u, _validate_content
+        ve modun token bütçesi kullanılır (bölümlü podcast üretimi bunları geçersiz kılar).
+        Güvenilmez ifade kuralı validate'ten bağımsızdır: akışta erken kesen StreamValidator
+        ile aynı kural akışsız yanıtlara da her istek türünde uygulanır.
+        kind, başarılı gecikmenin kaydedildiği istek türüdür ("script", "outline", "section").
+        """
+        label = PROVIDER_LABELS[provider]
+        url = self._provider_url(provider)
+        if validate is None:
+            validate = lambda content: self._validate_content(content, topic, mode)
         try:
-            prompt = self._create_prompt(topic, mode)
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
+            if cancel is not None and cancel.is_set():
+                return None
+            payload = self._build_payload(
+                provider, prompt or self._create_prompt(topic, mode), mode, model, max_tokens
+            )
+            streaming = self.streaming and provider in STREAMING_PROVIDERS
+            start = time.monotonic()
+            response = self._session().post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=dict(payload, stream=True) if streaming else payload,
+                timeout=self.timeouts[provider],
+                stream=streaming
+            )
             
-            payload = {
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional YouTube content creator. All information must be accurate, well-researched, and factually correct. Never invent facts or make unverified claims. If you're unsure about something, say you don't know rather than guessing."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_new_tokens": 1000 if mode == "shorts" else 5000,
-                "temperature": 0.7,
-                "stop": ["<|eot_id|>", "<|end_of_text|>"]
-            }
+            if response.status_code != 200:
+                response.close()
+                self.health.record_failure(url, f"HTTP {response.status_code}")
+                logger.warning(f"⚠️ {label} failed or returned invalid content (HTTP {response.status_code})")
+                return None
             
-            response = requests.post(
-                self.textgen_url,
-                headers=headers,
-                json=payload,
-                timeout=120
-            )
+            if streaming:
+                content, abort_reason = self._read_stream(provider, response, mode, start, cancel, max_tokens)
+                if abort_reason == "cancelled":
+                    return None
+                if abort_reason == "timeout":
+                    # Süresi dolan akış erişilemez sayılır: art arda takılan sağlayıcının devresi açılır
+                    self.health.record_failure(url, f"stream deadline exceeded after {len(content)} chars")
+                    logger.warning(f"✂️ {label} stream aborted after {len(content)} chars: {abort_reason}")
+                    return None
+                if abort_reason:
+                    self.health.record_reject(url)
+                    logger.warning(f"✂️ {label} stream aborted after {len(content)} chars: {abort_reason}")
+                    return None
+            else:
+                content = self._parse_content(provider, response.json())
+            latency = time.monotonic() - start
+            if cancel is not None and cancel.is_set():
+                # Yarış bitti: kaybedenin yanıtı sağlık geçmişine ve önbelleğe yazılmaz
+                return None
             
-            if response.status_code == 200:
-                result = response.json()
-                if "choices" in result and len(result["choices"]) > 0:
-                    if "message" in result["choices"][0]:
-                        content = result["choices"][0]["message"]["content"].strip()
-                    else:
-                        content = result["choices"][0]["text"].strip()
-                    
-                    if self._validate_content(content, topic, mode):
-                        return content
+            phrase = unreliable_phrase(content) if content else None
+            if phrase:
+                logger.warning(f"❌ {label} response contains unreliable phrase: '{phrase}'")
+            if content and not phrase and validate(content):
+                self.health.record_success(url, latency, kind)
+                self._cache_put(provider, payload, content)
+                return content
+            self.health.record_reject(url)
             
-            logger.warning(f"⚠️ Text Generation WebUI returned error: {response.status_code}")
+            logger.warning(f"⚠️ {label} failed or returned invalid content (HTTP {response.status_code})")
             return None
             
         except Exception as e:
-            logger.error(f"❌ Text Generation WebUI error: {str(e)}")
+            self.health.record_failure(url, str(e))
+            logger.error(f"❌ {label} error: {str(e)}")
             return None
     
+    def _iter_stream(self, provider: str, response):
+        """Akış yanıtından metin parçalarını verir (Ollama NDJSON / OpenAI SSE)."""
+        for line in response.iter_lines():
+            if not line:
+                continue
+            line = line.decode("utf-8")
+            if provider == "ollama":
+                chunk = json.loads(line)
+                yield chunk.get("message", {}).get("content", "")
+                if chunk.get("done"):
+                    return
+            else:
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    return
+                choices = json.loads(data).get("choices") or []
+                if choices:
+                    yield (choices[0].get("delta") or {}).get("content") or ""
+    
+    def _read_stream(self, provider: str, response, mode: str, start: float,
+                     cancel: threading.Event = None, max_tokens: int = None) -> tuple:
+        """Akışı okurken artımlı doğrular; red kesinleşince bağlantıyı kapatır.
+        
+        Döndürür: (metin, iptal nedeni veya None). Bağlantının kapanması sunucudaki
+        üretimi de durdurur.
+        """
+        validator = StreamValidator(mode, max_tokens)
+        deadline = start + self.timeouts[provider]
+        try:
+            for delta in self._iter_stream(provider, response):
+                if cancel is not None and cancel.is_set():
+                    return validator.text, "cancelled"
+                reason = validator.feed(delta)
+                if reason is None and time.monotonic() > deadline:
+                    reason = "timeout"
+                if reason:
+                    return validator.text, reason
+            return validator.text.strip(), None
+        finally:
+            response.close()
+    
+    def _cache_put(self, provider: str, payload: dict, content: str):
+        """Yalnızca doğrulamadan geçen yanıtlar önbelleğe yazılır."""
+        cache = get_llm_cache()
+        if cache is not None:
+            cache.put(request_key(provider, payload), provider, payload.get("model", ""), content)
+    
+    def _cached_result(self, topic: str, mode: str, prompt: str = None, max_tokens: int = None) -> str:
+        """Herhangi bir sağlayıcının bu prompt için önbellekteki yanıtı (yoksa None)"""
+        cache = get_llm_cache()
+        if cache is None:
+            return None
+        prompt = prompt or self._create_prompt(topic, mode)
+        for provider in self.provider_order:
+            payload = self._build_payload(provider, prompt, mode, max_tokens=max_tokens)
+            content = cache.get(request_key(provider, payload))
+            if content:
+                logger.info(f"🗃️ Using cached {provider.upper()} response (LLM cache hit)")
+                return content
+        return None
+    
+    def _probe(self, provider: str) -> bool:
+        """Yarı açık devre için ucuz yoklama: sunucu köküne kısa zaman aşımlı GET.
+        
+        Bağlantı hatası ya da 5xx yanıt başarısızlık sayılır (4xx: sunucu ayakta, kök yolu yok).
+        """
+        url = self._provider_url(provider)
+        parts = urlsplit(url)
+        try:
+            response = self._session().get(f"{parts.scheme}://{parts.netloc}/", timeout=Config.LLM_PROBE_TIMEOUT)
+        except requests.RequestException as e:
+            self.health.record_failure(url, f"probe: {e}")
+            return False
+        if response.status_code >= 500:
+            self.health.record_failure(url, f"probe: HTTP {response.status_code}")
+            return False
+        return True
+    
+    def _healthy_providers(self, kind: str = "script") -> list:
+        """Devresi açık sağlayıcıları atlar, kalanları istek türünün son p50 gecikmesine göre sıralar."""
+        urls = {provider: self._provider_url(provider) for provider in self.provider_order}
+        providers = []
+        for provider in self.health.order(self.provider_order, urls, kind):
+            state = self.health.state(urls[provider])
+            if state == "open":
+                logger.info(f"⏭️ Skipping {provider.upper()} (circuit open)")
+                continue
+            if state == "half_open" and not self._probe(provider):
+                logger.info(f"⏭️ Skipping {provider.upper()} (half-open probe failed)")
+                continue
+            providers.append(provider)
+        return providers
+    
+    def _any_reachable(self) -> bool:
+        """Son denemede yanıt veren (art arda hata sayısı sıfır olan) bir sağlayıcı var mı?"""
+        data = self.health.load()
+        return any(
+            data.get(self._provider_url(provider), {}).get("failures", 0) == 0
+            for provider in self.provider_order
+        )
+    
+    def generate_with_ollama(self, topic: str, mode: str = "shorts", model: str = "llama3") -> str:
+        """Ollama ile yerel script üretimi (en hızlı ve ücretsiz)"""
+        return self._generate("ollama", topic, mode, model)
+    
+    def generate_with_lmstudio(self, topic: str, mode: str = "shorts") -> str:
+        """LM Studio ile script üretimi (açık kaynaklı, giriş gerektirmez)"""
+        return self._generate("lmstudio", topic, mode)
+    
+    def generate_with_textgen(self, topic: str, mode: str = "shorts") -> str:
+        """Text Generation WebUI ile script üretimi (açık kaynaklı)"""
+        return self._generate("textgen", topic, mode)
+    
     def _create_prompt(self, topic: str, mode: str = "shorts") -> str:
         """Tüm AI'lar için ortak, tutarlılık kurallı prompt oluşturma"""
-        consistency_rule = """
-RULE NUMBER ONE: All content must be FACTUALLY ACCURATE and VERIFIABLE. 
-- Never invent facts, statistics, quotes, or historical events
-- If you don't know something, say "Historical records show..." or "According to verified sources..."
-- All claims must be based on real historical/scientific evidence
-- Double-check dates, names, and technical details before writing
-- When in doubt, choose the most conservative, well-documented version
-- NO speculation, NO "might have been", NO "could have happened"
-- Only use information that can be verified through multiple reliable sources
-- This rule is non-negotiable and must be followed in every sentence
-"""
         
         if mode == "shorts":
             return f"""
 You are a professional YouTube Shorts scriptwriter. Write a 60-second video script about: "{topic}"
 
-{consistency_rule}
+{CONSISTENCY_RULE}
 
 IMPORTANT RULES (STRICTLY FOLLOW):
 ✅ First 3 seconds MUST have a SHOCKING HOOK that grabs attention (based on verified facts)
@@ -207,7 +468,7 @@ SCRIPT:
             return f"""
 You are a professional podcast producer. Write a 15-20 minute in-depth podcast script about: "{topic}"
 
-{consistency_rule}
+{CONSISTENCY_RULE}
 
 IMPORTANT RULES (STRICTLY FOLLOW):
 ✅ First 30 seconds MUST have a POWERFUL HOOK with a verified shocking fact
@@ -236,6 +497,60 @@ EXAMPLE STRUCTURE:
 [Next episode tease: Verified upcoming topic]
 
 SCRIPT:
+"""
+    
+    def _create_outline_prompt(self, topic: str, sections: int) -> str:
+        """Bölümlü podcast için taslak prompt'u (HOOK, N gövde bölümü, CONCLUSION)"""
+        body_lines = "\n".join(
+            f"SECTION {n}: <title> - <one sentence on what this part covers>" for n in range(1, sections + 1)
+        )
+        return f"""
+You are a professional podcast producer. Plan a 15-20 minute in-depth podcast episode about: "{topic}"
+
+{CONSISTENCY_RULE}
+
+Reply with the outline ONLY, exactly {sections + 2} lines in this format and nothing else:
+HOOK: <the verified shocking fact that opens the episode>
+{body_lines}
+CONCLUSION: <key takeaways and the verified topic teased for the next episode>
+
+The body sections must follow the story chronologically: context, real people with names and dates, verified events, human struggles, outcomes and modern relevance.
+
+OUTLINE:
+"""
+    
+    def _create_section_prompt(self, topic: str, outline: list, index: int, max_chars: int) -> str:
+        """Taslaktaki tek bölümün prompt'u; tutarlılık için tüm taslak bağlam olarak verilir"""
+        label, description = outline[index]
+        outline_text = "\n".join(f"{name}: {text}" for name, text in outline)
+        if label == "HOOK":
+            part_rules = """✅ Open with a POWERFUL HOOK built on the verified shocking fact above
+✅ Welcome listeners and tell them what this episode will uncover"""
+        elif label == "CONCLUSION":
+            part_rules = """✅ Summarize the key points of the episode
+✅ Ask listeners to like, comment and subscribe
+✅ Tease the next episode with a verified upcoming topic"""
+        else:
+            part_rules = """✅ Continue naturally from the previous part; do NOT re-introduce the episode or say goodbye
+✅ DESCRIPTION and STORYTELLING must be PROMINENT - real people, names, dates, verified quotes
+✅ Include at least one RHETORICAL QUESTION that makes listeners think"""
+        return f"""
+You are a professional podcast producer writing ONE PART of a podcast episode about: "{topic}"
+
+{CONSISTENCY_RULE}
+
+EPISODE OUTLINE:
+{outline_text}
+
+Write ONLY the {label} part: {description}
+
+IMPORTANT RULES (STRICTLY FOLLOW):
+{part_rules}
+✅ At most {max_chars} characters (NOT words - characters)
+✅ Spoken narration only: no headings, labels, outline markers or stage directions
+✅ Include verification notes in parentheses when citing specific facts (e.g., "(NASA Archives, 1963)")
+
+{label}:
 """
     
     def _validate_content(self, content: str, topic: str, mode: str) -> bool:
@@ -243,16 +558,10 @@ SCRIPT:
         if not content or len(content.strip()) < 50:
             return False
         
-        unreliable_phrases = [
-            "I think", "I believe", "might have", "could have been", "possibly", 
-            "maybe", "some people say", "it is said that", "legend has it",
-            "no one knows", "nobody knows", "experts think", "scientists believe"
-        ]
-        
-        for phrase in unreliable_phrases:
-            if phrase.lower() in content.lower():
-                logger.warning(f"❌ Content contains unreliable phrase: '{phrase}'")
-                return False
+        phrase = unreliable_phrase(content)
+        if phrase:
+            logger.warning(f"❌ Content contains unreliable phrase: '{phrase}'")
+            return False
         
         must_have_phrases = [
             "according to", "records show", "historical evidence", 
@@ -280,6 +589,17 @@ SCRIPT:
         
         return True
     
+    def _validate_section(self, content: str, max_chars: int) -> bool:
+        """Bölüm metni kontrolü: konu ve CTA kontrolleri birleştirilmiş script'te yapılır"""
+        if not content or len(content.strip()) < max(50, int(max_chars * SECTION_MIN_SHARE)):
+            logger.warning(f"❌ Section too short ({len(content.strip()) if content else 0}/{max_chars} characters)")
+            return False
+        phrase = unreliable_phrase(content)
+        if phrase:
+            logger.warning(f"❌ Section contains unreliable phrase: '{phrase}'")
+            return False
+        return True
+    
     def generate_fallback_script(self, topic: str, mode: str = "shorts") -> str:
         """Kaliteli fallback script - her seferinde farklı seçenek"""
         if mode == "shorts":
@@ -352,44 +672,217 @@ CONCLUSION: If you believe in humanity's potential to reach the stars, don't for
             ]
             return random.choice(templates).strip()
     
-    def generate_script_content(self, topic: str, mode: str = "shorts") -> str:
-        """3 açık kaynaklı AI sağlayıcı ile fallback mekanizmalı script üretimi"""
-        logger.info(f"🎬 Generating {mode.upper()} script for: '{topic}'")
+    def _generate_serial(self, topic: str, mode: str, providers: list = None,
+                         cancel: threading.Event = None, **request) -> str:
+        """Sağlayıcıları sırayla dener (her biri kendi zaman aşımına kadar bekletir)"""
+        for provider in (self.provider_order if providers is None else providers):
+            if cancel is not None and cancel.is_set():
+                return None
+            logger.info(f"🔄 Trying {provider.upper()} API...")
+            result = self._generate(provider, topic, mode, cancel=cancel, **request)
+            if result:
+                logger.info(f"✅ Successfully generated with {provider.upper()}")
+                return result
+            logger.warning(f"⚠️ {provider.upper()} failed or returned empty result")
+        return None
+    
+    def _generate_hedged(self, topic: str, mode: str, providers: list = None,
+                         cancel: threading.Event = None, **request) -> str:
+        """Sağlayıcıları eşzamanlı (hedge_stagger > 0 ise kademeli) yarıştırır.
         
-        for provider in self.provider_order:
+        Bir sonraki sağlayıcı, stagger süresi dolunca ya da çalışanlardan biri başarısız
+        olunca hemen başlatılır. _validate_content'i geçen ilk yanıt kazanır; diğerlerine
+        iptal işareti verilir ve sonuçları beklenmez (daemon iş parçacıkları). Akışla
+        okunan sağlayıcılar işareti bir sonraki parçada görüp bağlantıyı kapatır.
+        cancel verilirse (ör. bölümlü üretimin ortak işareti) yarış onunla da durdurulur.
+        """
+        waiting = list(self.provider_order if providers is None else providers)
+        results = queue.Queue()
+        race_over = threading.Event()
+        stop = CancelGroup(race_over, cancel)
+        running = 0
+        start = time.monotonic()
+        next_launch = start
+        
+        def worker(provider: str):
+            # Sonuç her durumda yazılır; yoksa running hiç azalmaz ve döngü sonsuza dek bekler
+            result = None
             try:
-                logger.info(f"🔄 Trying {provider.upper()} API...")
-                
-                if provider == "ollama":
-                    result = self.generate_with_ollama(topic, mode)
-                elif provider == "lmstudio":
-                    result = self.generate_with_lmstudio(topic, mode)
-                elif provider == "textgen":
-                    result = self.generate_with_textgen(topic, mode)
-                else:
-                    result = None
+                result = self._generate(provider, topic, mode, cancel=stop, **request)
+            except Exception as e:
+                logger.error(f"❌ {PROVIDER_LABELS[provider]} worker error: {e}")
+            finally:
+                results.put((provider, result))
+        
+        try:
+            while waiting or running:
+                if cancel is not None and cancel.is_set():
+                    return None
+                if waiting and (not running or time.monotonic() >= next_launch):
+                    provider = waiting.pop(0)
+                    logger.info(f"🏁 Starting {provider.upper()} (hedged, +{time.monotonic() - start:.1f}s)")
+                    threading.Thread(target=worker, args=(provider,), name=f"llm-{provider}", daemon=True).start()
+                    running += 1
+                    next_launch = time.monotonic() + self.hedge_stagger
+                    continue
                 
+                timeout = max(0.0, next_launch - time.monotonic()) if waiting else None
+                if cancel is not None:
+                    timeout = CANCEL_POLL_SECONDS if timeout is None else min(timeout, CANCEL_POLL_SECONDS)
+                try:
+                    provider, result = results.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                running -= 1
                 if result:
-                    logger.info(f"✅ Successfully generated with {provider.upper()}")
+                    logger.info(f"✅ Successfully generated with {provider.upper()} in {time.monotonic() - start:.1f}s")
                     return result
-                
                 logger.warning(f"⚠️ {provider.upper()} failed or returned empty result")
-                
-            except Exception as e:
-                logger.error(f"❌ {provider.upper()} failed: {str(e)}")
-                continue
+                next_launch = time.monotonic()
+            return None
+        finally:
+            race_over.set()
+    
+    def _complete(self, topic: str, mode: str, providers: list = None, hedged: bool = None, **request) -> str:
+        """Önbellekten ya da sağlayıcılardan (hedged veya sıralı) doğrulanmış yanıt; yoksa None.
+        
+        providers verilmezse önbellek ıskalandıktan sonra sağlıklı sağlayıcılar seçilir;
+        hedged verilmezse self.hedged kullanılır.
+        """
+        cached = self._cached_result(topic, mode, request.get("prompt"), request.get("max_tokens"))
+        if cached:
+            return cached
+        if providers is None:
+            providers = self._healthy_providers(request.get("kind", "script"))
+        if self.hedged if hedged is None else hedged:
+            return self._generate_hedged(topic, mode, providers, **request)
+        return self._generate_serial(topic, mode, providers, **request)
+    
+    def generate_script_content(self, topic: str, mode: str = "shorts") -> str:
+        """3 açık kaynaklı AI sağlayıcı ile fallback mekanizmalı script üretimi"""
+        logger.info(f"🎬 Generating {mode.upper()} script for: '{topic}'")
+        
+        result = self._complete(topic, mode)
+        if result:
+            return result
         
         logger.warning(f"🔥 All AI providers failed, using fallback script")
         return self.generate_fallback_script(topic, mode)
 
+    def _clean_section(self, content: str, label: str, max_chars: int) -> str:
+        """Tekrarlanan bölüm etiketini atar, metni bütçesine cümle sınırında sığdırır."""
+        content = re.sub(rf"^\W*{label}\W*?[:\-–]\s*", "", content.strip(), flags=re.IGNORECASE)
+        return trim_to_sentence(content, max_chars)
+    
+    def _generate_section(self, topic: str, outline: list, index: int, max_chars: int,
+                          cancel: threading.Event = None) -> str:
+        """Taslaktaki bir bölümü üretir; temizlenmiş metin doğrulanır (yoksa None).
+        
+        Bölüm içinde sağlayıcılar yarıştırılmaz, sırayla denenir: eşzamanlı istek sayısı
+        bölüm eşzamanlılığıyla sınırlı kalır (aynı yerel sunuculara en fazla concurrency istek).
+        """
+        label = outline[index][0]
+        content = self._complete(
+            topic, "podcast", hedged=False,
+            prompt=self._create_section_prompt(topic, outline, index, max_chars),
+            validate=lambda text: self._validate_section(self._clean_section(text, label, max_chars), max_chars),
+            max_tokens=section_token_budget(max_chars),
+            cancel=cancel,
+            kind="section"
+        )
+        return self._clean_section(content, label, max_chars) if content else None
+    
+    def generate_sectioned_script(self, topic: str, sections: int = None, concurrency: int = None) -> str:
+        """Podcast script'ini taslak + eşzamanlı bölümler halinde üretir.
+        
+        Önce HOOK / N gövde bölümü / CONCLUSION taslağı istenir; ardından bölümler
+        (her biri kendi karakter bütçesiyle) en fazla concurrency eşzamanlı istekle
+        üretilip sırayla birleştirilir. Toplu istek işleyen sunucularda süre kabaca tek
+        bölümünkü kadardır. Taslak ya da bir bölüm alınamazsa tek parça üretime dönülür.
+        """
+        sections = sections or Config.PODCAST_SECTIONS
+        concurrency = concurrency or Config.PODCAST_SECTION_CONCURRENCY
+        logger.info(f"🎬 Generating sectioned PODCAST script for: '{topic}' ({sections} sections)")
+        start = time.monotonic()
+        
+        outline_text = self._complete(
+            topic, "podcast",
+            prompt=self._create_outline_prompt(topic, sections),
+            validate=lambda content: parse_outline(content, sections) is not None,
+            max_tokens=OUTLINE_TOKEN_BUDGET,
+            kind="outline"
+        )
+        outline = parse_outline(outline_text, sections) if outline_text else None
+        if not outline:
+            # Hiçbir sağlayıcıya ulaşılamadıysa tek parça üretim yarışı tekrarlamaz
+            # (bekleme ve hata sayıları ikiye katlanırdı): önbellek ya da şablon kullanılır
+            if not self._any_reachable():
+                logger.warning("🔥 No AI provider reachable for the outline, using fallback script")
+                return self._cached_result(topic, "podcast") or self.generate_fallback_script(topic, "podcast")
+            logger.warning("⚠️ Podcast outline unavailable, falling back to single-request generation")
+            return self.generate_script_content(topic, "podcast")
+        logger.info(f"🗂️ Outline ready: {len(outline)} parts ({time.monotonic() - start:.1f}s)")
+        
+        budgets = section_budgets(outline, Config.PODCAST_CHAR_LIMIT)
+        parts = [None] * len(outline)
+        # Bir bölüm başarısız olursa süren bölüm istekleri de durdurulur; yedek üretim
+        # aynı yerel model için onlarla yarışmaz. İşçiler daemon iş parçacığıdır: akışsız,
+        # kesilemeyen bir istek süreç çıkışını zaman aşımına kadar bekletmez.
+        cancel = threading.Event()
+        slots = threading.BoundedSemaphore(max(1, concurrency))
+        results = queue.Queue()
+        
+        def worker(index: int):
+            content = None
+            try:
+                with slots:
+                    if not cancel.is_set():
+                        content = self._generate_section(topic, outline, index, budgets[index], cancel)
+                    if not content:
+                        # Yuva bırakılmadan iptal edilir: sıradaki bölüm isteği başlamaz
+                        cancel.set()
+            except Exception as e:
+                cancel.set()
+                logger.error(f"❌ {outline[index][0]} worker error: {e}")
+            finally:
+                results.put((index, content))
+        
+        for index in range(len(outline)):
+            threading.Thread(target=worker, args=(index,), name=f"llm-section-{index}", daemon=True).start()
+        for _ in range(len(outline)):
+            index, content = results.get()
+            if not content:
+                logger.warning(f"⚠️ {outline[index][0]} failed, falling back to single-request generation")
+                cancel.set()
+                return self.generate_script_content(topic, "podcast")
+            parts[index] = content
+            logger.info(
+                f"🧩 {outline[index][0]} ready ({len(content)}/{budgets[index]} characters, "
+                f"{time.monotonic() - start:.1f}s)"
+            )
+        
+        script = SECTION_SEPARATOR.join(parts)
+        min_chars = int(Config.PODCAST_CHAR_LIMIT * SECTION_MIN_SHARE)
+        if len(script) < min_chars:
+            logger.warning(
+                f"⚠️ Stitched podcast script too short ({len(script)}/{min_chars} characters), "
+                f"falling back to single-request generation"
+            )
+            return self.generate_script_content(topic, "podcast")
+        if not self._validate_content(script, topic, "podcast"):
+            logger.warning("⚠️ Stitched podcast script failed validation, falling back to single-request generation")
+            return self.generate_script_content(topic, "podcast")
+        logger.info(f"✅ Sectioned PODCAST script stitched from {len(parts)} parts in {time.monotonic() - start:.1f}s")
+        return script
+
 def generate_shorts_script(topic: str) -> str:
     """Shorts için özel script üretici — 60 saniyelik, dinamik, CTA ile"""
     ai_api = OpenSourceAIAPI()
     script = ai_api.generate_script_content(topic, "shorts")
     
-    # Karakter limiti
+    # Karakter limiti (cümle sınırında)
     if len(script) > Config.SHORTS_CHAR_LIMIT:
-        script = script[:Config.SHORTS_CHAR_LIMIT]
+        script = trim_to_sentence(script, Config.SHORTS_CHAR_LIMIT)
         logger.warning(f"⚠️ Shorts script exceeded character limit ({len(script)}/{Config.SHORTS_CHAR_LIMIT}), shortened")
     
     logger.info(f"✅ SHORTS script ready! ({len(script)} characters)")
@@ -398,11 +891,14 @@ def generate_shorts_script(topic: str) -> str:
 def generate_podcast_script(topic: str) -> str:
     """Podcast için özel script üretici — 15-20 dakikalık, derinlikli, CTA ile"""
     ai_api = OpenSourceAIAPI()
-    script = ai_api.generate_script_content(topic, "podcast")
+    if Config.PODCAST_SECTIONED:
+        script = ai_api.generate_sectioned_script(topic)
+    else:
+        script = ai_api.generate_script_content(topic, "podcast")
     
-    # Karakter limiti
+    # Karakter limiti (cümle sınırında)
     if len(script) > Config.PODCAST_CHAR_LIMIT:
-        script = script[:Config.PODCAST_CHAR_LIMIT]
+        script = trim_to_sentence(script, Config.PODCAST_CHAR_LIMIT)
         logger.warning(f"⚠️ Podcast script exceeded character limit ({len(script)}/{Config.PODCAST_CHAR_LIMIT}), shortened")
     
     logger.info(f"✅ PODCAST script ready! ({len(script)} characters)")
@@ -0,0 +1,78 @@
+# src/text_layout.py
+from functools import lru_cache
+from PIL import ImageFont
+from src.config import Config
+
+# Boyut aramasında ölçüm için kullanılan referans punto
+_REFERENCE_SIZE = 100
+
+@lru_cache(maxsize=64)
+def get_font(path: str = None, size: int = 60):
+    """Fontu (yol, punto) başına bir kez yükler; süreç boyunca paylaşılır."""
+    try:
+        return ImageFont.truetype(path or Config.FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+def is_scalable(font) -> bool:
+    """Varsayılan bitmap font boyut değiştiremez; yalnızca TrueType ölçeklenir."""
+    return isinstance(font, ImageFont.FreeTypeFont)
+
+@lru_cache(maxsize=16384)
+def word_width(path: str, size: int, word: str) -> float:
+    """Kelimenin ilerleme genişliği (önbellekli)."""
+    return get_font(path, size).getlength(word)
+
+def text_width(text: str, path: str = None, size: int = 60) -> float:
+    """Satır genişliği = kelime genişliklerinin ve boşlukların toplamı."""
+    path = path or Config.FONT_PATH
+    words = text.split()
+    if not words:
+        return 0.0
+    space = word_width(path, size, " ")
+    return sum(word_width(path, size, w) for w in words) + space * (len(words) - 1)
+
+def wrap_text(text: str, max_width: float, path: str = None, size: int = 60) -> list:
+    """Metni doğrusal zamanda satırlara böler (satır genişliği kümülatif toplamla izlenir)."""
+    path = path or Config.FONT_PATH
+    space = word_width(path, size, " ")
+    lines = []
+    
+    for paragraph in text.split('\n'):
+        current_words = []
+        current_width = 0.0
+        for word in paragraph.split():
+            w = word_width(path, size, word)
+            candidate = current_width + space + w if current_words else w
+            if candidate <= max_width or not current_words:
+                current_words.append(word)
+                current_width = candidate
+            else:
+                lines.append(" ".join(current_words))
+                current_words = [word]
+                current_width = w
+        if current_words:
+            lines.append(" ".join(current_words))
+    
+    return lines
+
+def fit_font_size(text: str, max_width: float, max_size: int, path: str = None, min_size: int = 8) -> int:
+    """Tek satırlık metnin max_width'e sığdığı en büyük puntoyu bulur.
+
+    Genişlik puntoyla yaklaşık doğrusal ölçeklendiği için referans puntoda bir kez
+    ölçülür, tahmin edilen punto sonra birkaç adımda doğrulanır; büyük puntoda
+    font yüklemek veya rasterize etmek gerekmez.
+    """
+    path = path or Config.FONT_PATH
+    if not is_scalable(get_font(path, _REFERENCE_SIZE)):
+        return max_size
+    
+    reference_width = text_width(text, path, _REFERENCE_SIZE)
+    if reference_width <= 0:
+        return max_size
+    
+    size = int(min(max_size, _REFERENCE_SIZE * max_width / reference_width))
+    size = max(size, min_size)
+    while size > min_size and text_width(text, path, size) > max_width:
+        size = max(min_size, int(size * 0.97))
+    return size
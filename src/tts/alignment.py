@@ -0,0 +1,125 @@
+# src/tts/alignment.py
+import time
+import numpy as np
+from src.media import decode_pcm
+from src.utils import setup_logging
+from .text_chunks import split_sentences
+from .timing import save_timing, load_timing
+
+logger = setup_logging()
+
+ALIGN_SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.01       # 10 ms enerji çerçevesi
+MIN_PAUSE_SECONDS = 0.15   # bundan kısa sessizlik duraklama sayılmaz
+SNAP_WINDOW_SECONDS = 1.5  # cümle sınırı en fazla bu kadar uzaktaki duraklamaya çekilir
+
+def frame_energy_db(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """10 ms'lik çerçevelerin RMS enerjisi (dBFS)."""
+    frame = int(sample_rate * FRAME_SECONDS)
+    count = len(samples) // frame
+    frames = samples[:count * frame].astype(np.float32).reshape(count, frame) / 32768.0
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-6))
+
+def detect_speech(energy_db: np.ndarray) -> np.ndarray:
+    """Konuşma çerçeveleri (bool); eşik gürültü tabanı ile tepe seviyesinden uyarlanır."""
+    if not len(energy_db):
+        return np.zeros(0, dtype=bool)
+    floor = np.percentile(energy_db, 10)
+    peak = np.percentile(energy_db, 99)
+    threshold = max(floor + 0.25 * (peak - floor), peak - 40.0)
+    speech = energy_db > threshold
+
+    # MIN_PAUSE'dan kısa sessizlikler konuşmaya katılır (kelime içi kısa boşluklar)
+    edges = np.flatnonzero(np.diff(speech.astype(np.int8))) + 1
+    bounds = np.concatenate(([0], edges, [len(speech)]))
+    starts, ends = bounds[:-1], bounds[1:]
+    silent = ~speech[starts]
+    short = silent & ((ends - starts) * FRAME_SECONDS < MIN_PAUSE_SECONDS) & (starts > 0) & (ends < len(speech))
+    fill = np.zeros(len(speech) + 1, dtype=np.int32)
+    np.add.at(fill, starts[short], 1)
+    np.add.at(fill, ends[short], -1)
+    return speech | (np.cumsum(fill[:-1]) > 0)
+
+def find_pauses(speech: np.ndarray) -> tuple:
+    """Sessiz aralıkların (başlangıç, bitiş) çerçeve indeksleri."""
+    padded = np.concatenate(([True], speech, [True])).astype(np.int8)
+    diff = np.diff(padded)
+    return np.flatnonzero(diff == -1), np.flatnonzero(diff == 1)
+
+def _voiced_to_time(voiced_cum: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Kümülatif konuşma süresindeki hedefleri gerçek zamana (sn) çevirir."""
+    return np.searchsorted(voiced_cum, targets, side="left") * FRAME_SECONDS
+
+def align_words(samples: np.ndarray, sample_rate: int, text: str) -> tuple:
+    """Metnin kelimelerini sesin enerji/duraklama yapısına hizalar.
+
+    Cümle sınırları, konuşma süresine (duraklamalar hariç) metin uzunluğuyla orantılı
+    tahmin edilip en yakın duraklamanın bitişine (konuşma başlangıcına) çekilir; cümle içindeki kelimeler cümlenin
+    konuşulan kısmına uzunluklarıyla orantılı yayılır (iç duraklamalar atlanır).
+    Döndürür: ([(başlangıç, bitiş, kelime), ...], süre)
+    """
+    duration = len(samples) / sample_rate
+    speech = detect_speech(frame_energy_db(samples, sample_rate))
+    sentences = [s.split() for s in split_sentences(text)]
+    words = [w for sentence in sentences for w in sentence]
+    if not words or not len(speech):
+        # Boş (ya da tek çerçeveden kısa) ses: hizalanacak konuşma yok
+        return [], duration
+    if not speech.any():
+        speech = np.ones_like(speech)
+
+    voiced_cum = np.cumsum(speech) * FRAME_SECONDS
+    total_voiced = voiced_cum[-1]
+    weights = np.array([len(w) + 1 for w in words], dtype=np.float64)
+    word_cum = np.concatenate(([0.0], np.cumsum(weights))) / weights.sum()
+
+    # Cümle sınırları: orantılı tahmin -> en yakın duraklamanın sonu (konuşmanın yeniden başladığı an)
+    sentence_ends = np.cumsum([len(s) for s in sentences])
+    boundary_index = np.concatenate(([0], sentence_ends))
+    estimates = _voiced_to_time(voiced_cum, word_cum[boundary_index[1:-1]] * total_voiced)
+    pause_starts, pause_ends = find_pauses(speech)
+    inner = (pause_starts > 0) & (pause_ends < len(speech))
+    onsets = pause_ends[inner] * FRAME_SECONDS
+    first_voice = np.argmax(speech) * FRAME_SECONDS
+    last_voice = (len(speech) - np.argmax(speech[::-1])) * FRAME_SECONDS
+
+    boundaries = [first_voice]
+    for estimate in estimates:
+        snapped = estimate
+        if len(onsets):
+            i = np.searchsorted(onsets, estimate)
+            candidates = onsets[max(0, i - 1):i + 1]
+            nearest = candidates[np.argmin(np.abs(candidates - estimate))]
+            if abs(nearest - estimate) <= SNAP_WINDOW_SECONDS and nearest > boundaries[-1]:
+                snapped = nearest
+        boundaries.append(max(snapped, boundaries[-1]))
+    boundaries.append(max(last_voice, boundaries[-1]))
+    boundaries = np.array(boundaries)
+
+    # Cümle içi kelimeler: cümlenin konuşulan süresine orantılı
+    frame_index = np.minimum((boundaries / FRAME_SECONDS).astype(np.int64), len(voiced_cum) - 1)
+    voiced_at = voiced_cum[frame_index]
+    sentence_of_word = np.repeat(np.arange(len(sentences)), [len(s) for s in sentences])
+    start_w, end_w = boundary_index[:-1][sentence_of_word], boundary_index[1:][sentence_of_word]
+    local = (word_cum[:-1] - word_cum[start_w]) / np.maximum(word_cum[end_w] - word_cum[start_w], 1e-9)
+    v0, v1 = voiced_at[sentence_of_word], voiced_at[sentence_of_word + 1]
+    starts = _voiced_to_time(voiced_cum, v0 + local * (v1 - v0))
+    starts = np.maximum(starts, boundaries[sentence_of_word])
+    ends = np.append(starts[1:], boundaries[-1])
+    return [(float(s), float(e), w) for s, e, w in zip(starts, ends, words)], duration
+
+def align_audio(audio_path: str, text: str):
+    """Zamanlama bilgisi olmayan ses için hizalama yapar ve izi sesin yanına kaydeder."""
+    start = time.perf_counter()
+    samples = decode_pcm(audio_path, ALIGN_SAMPLE_RATE)
+    decoded = time.perf_counter()
+    words, duration = align_words(samples, ALIGN_SAMPLE_RATE, text)
+    logger.info(
+        f"🔍 Ses hizalandı: {len(words)} kelime, {duration:.1f} sn ses "
+        f"(çözme {decoded - start:.2f} sn, hizalama {time.perf_counter() - decoded:.2f} sn)"
+    )
+    if not words:
+        return None
+    save_timing(audio_path, words, duration, "energy")
+    return load_timing(audio_path)
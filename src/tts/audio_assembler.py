@@ -0,0 +1,189 @@
+# src/tts/audio_assembler.py
+import io
+import os
+import wave
+from pathlib import Path
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+# Akış blok boyutu (dosyadan okurken)
+BLOCK_SIZE = 1 << 16
+
+# MPEG Layer III bit hızı (kbps) ve örnekleme hızı tabloları
+_MP3_BITRATES = {
+    "mpeg1": [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    "mpeg2": [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+def _id3v2_length(data: bytes, offset: int = 0) -> int:
+    """offset'teki ID3v2 etiketinin toplam uzunluğu (etiket yoksa 0)."""
+    header = data[offset:offset + 10]
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+def _mp3_frame_info(data: bytes, offset: int) -> tuple:
+    """offset'teki Layer III kare başlığından (kare uzunluğu, süre sn); geçersizse (0, 0.0)."""
+    header = data[offset:offset + 4]
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return 0, 0.0
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0, 0.0
+    table = "mpeg1" if version == 3 else "mpeg2"
+    bitrate = _MP3_BITRATES[table][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    coefficient = 144 if version == 3 else 72
+    samples = 1152 if version == 3 else 576
+    return coefficient * bitrate // sample_rate + padding, samples / sample_rate
+
+def _mp3_frame_length(data: bytes, offset: int) -> int:
+    """offset'teki Layer III kare başlığından kare uzunluğunu hesaplar (geçersizse 0)."""
+    return _mp3_frame_info(data, offset)[0]
+
+def mp3_frames(data: bytes) -> memoryview:
+    """MP3 parçasından yalnızca ses karelerini döndürür.
+
+    Baştaki ID3v2 etiketleri, sondaki ID3v1 etiketi ve Xing/Info/VBRI başlık karesi
+    atılır; aksi halde art arda eklenen parçalarda süre yanlış okunur.
+    """
+    view = memoryview(data)
+    start = 0
+    while True:
+        length = _id3v2_length(data, start)
+        if not length:
+            break
+        start += length
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+
+    frame_length = _mp3_frame_length(data, start)
+    if frame_length:
+        probe = data[start + 4:start + 40]
+        if b"Xing" in probe or b"Info" in probe or b"VBRI" in probe:
+            start += frame_length
+    return view[start:end]
+
+def split_mp3(data: bytes, cuts: list) -> list:
+    """MP3 parçasını artan kesim zamanlarında (sn) kare sınırından böler; len(cuts) + 1 parça döner.
+
+    Her kesim en yakın kare sınırına yuvarlanır; parçalar etiketsiz ses kareleridir.
+    """
+    frames = mp3_frames(data)
+    pieces = []
+    cuts = list(cuts)
+    start = offset = 0
+    elapsed = 0.0
+    while offset < len(frames):
+        length, duration = _mp3_frame_info(frames, offset)
+        if not length:
+            break
+        while cuts and cuts[0] <= elapsed + duration / 2:
+            pieces.append(bytes(frames[start:offset]))
+            start = offset
+            cuts.pop(0)
+        offset += length
+        elapsed += duration
+    pieces.append(bytes(frames[start:]))
+    pieces.extend(b"" for _ in cuts)
+    return pieces
+
+class AudioAssembler:
+    """Ses parçalarını sırayla tek çıktı dosyasına akıtan birleştirici.
+
+    MP3 parçaları yeniden kodlanmadan (etiketleri ayıklanıp) art arda yazılır; WAV
+    parçalarının PCM kareleri tek WAV'a akıtılır. Bellekte en fazla bir parça tutulur.
+    Çıktı önce geçici dosyaya yazılır, başarıyla kapanınca yerine taşınır.
+    """
+
+    def __init__(self, output_path: str, fmt: str = None):
+        self.output_path = Path(output_path)
+        self.fmt = (fmt or self.output_path.suffix.lstrip(".")).lower()
+        if self.fmt not in ("mp3", "wav"):
+            raise ValueError(f"Desteklenmeyen ses biçimi: {self.fmt}")
+        self._tmp_path = self.output_path.with_name(f".{self.output_path.name}.{os.getpid()}.part")
+        self._file = None
+        self._wav = None
+        self._params = None
+        self.chunks = 0
+
+    def __enter__(self):
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == "mp3":
+            self._file = open(self._tmp_path, "wb")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._wav is not None:
+            self._wav.close()
+        if self._file is not None:
+            self._file.close()
+        if exc_type is not None or not self.chunks:
+            self._tmp_path.unlink(missing_ok=True)
+            if exc_type is None:
+                raise ValueError("Birleştirilecek ses parçası yok")
+            return False
+        os.replace(self._tmp_path, self.output_path)
+        return False
+
+    def _open_wav(self, channels: int, sampwidth: int, sample_rate: int):
+        params = (channels, sampwidth, sample_rate)
+        if self._wav is None:
+            self._wav = wave.open(str(self._tmp_path), "wb")
+            self._wav.setnchannels(channels)
+            self._wav.setsampwidth(sampwidth)
+            self._wav.setframerate(sample_rate)
+            self._params = params
+        elif params != self._params:
+            raise ValueError(f"WAV parçası biçimi uyuşmuyor: {params} != {self._params}")
+
+    def append_pcm(self, pcm: bytes, sample_rate: int, channels: int = 1, sampwidth: int = 2):
+        """Ham PCM parçasını WAV çıktısına ekler."""
+        if self.fmt != "wav":
+            raise ValueError("Ham PCM yalnızca WAV çıktısına eklenebilir")
+        self._open_wav(channels, sampwidth, sample_rate)
+        self._wav.writeframesraw(pcm)
+        self.chunks += 1
+
+    def _append_wav(self, source):
+        with wave.open(source, "rb") as part:
+            self._open_wav(part.getnchannels(), part.getsampwidth(), part.getframerate())
+            frames = BLOCK_SIZE // (part.getnchannels() * part.getsampwidth())
+            while True:
+                block = part.readframes(frames)
+                if not block:
+                    break
+                self._wav.writeframesraw(block)
+        self.chunks += 1
+
+    def append(self, data: bytes):
+        """Kodlanmış bir parçayı (MP3 veya WAV bytes) ekler."""
+        if self.fmt == "mp3":
+            self._file.write(mp3_frames(data))
+            self.chunks += 1
+        else:
+            self._append_wav(io.BytesIO(data))
+
+    def append_file(self, path: str):
+        """Parça dosyasını ekler; WAV kareleri bloklar halinde okunur."""
+        if self.fmt == "mp3":
+            self.append(Path(path).read_bytes())
+        else:
+            self._append_wav(str(path))
+
+def assemble(chunks, output_path: str, fmt: str = None) -> str:
+    """Parça (bytes) akışını sırayla tek ses dosyasına yazar."""
+    with AudioAssembler(output_path, fmt) as assembler:
+        for data in chunks:
+            assembler.append(data)
+    logger.info(f"🔗 {assembler.chunks} ses parçası birleştirildi: {output_path}")
+    return str(output_path)
@@ -0,0 +1,138 @@
+# src/tts/audio_cache.py
+import os
+import json
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from src.config import Config
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+def normalize_sentence(text: str) -> str:
+    """Önbellek anahtarı için cümleyi normalize eder (Unicode NFC + tek boşluk)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+class TTSAudioCache:
+    """Cümle başına sentezlenmiş sesi içerik adresli olarak saklayan kalıcı önbellek.
+
+    Anahtar: (backend, ses, sentez parametreleri, normalize cümle) SHA-256'sı.
+    Her isabette dosyanın mtime'ı güncellenir; toplam boyut max_bytes'ı aşınca en
+    eski kullanılan girdiler silinir (LRU).
+    """
+
+    def __init__(self, root: Path = None, max_bytes: int = None):
+        self.root = Path(root or Config.TTS_CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else int(Config.TTS_CACHE_MAX_MB * 1024 * 1024)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(backend: str, voice: str, params: dict, text: str) -> str:
+        payload = json.dumps(
+            [backend, voice, params or {}, normalize_sentence(text)],
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, ext: str) -> Path:
+        return self.root / key[:2] / f"{key}.{ext}"
+
+    def contains(self, key: str, ext: str) -> bool:
+        return self._path(key, ext).exists()
+
+    def get(self, key: str, ext: str):
+        """İsabette sesi (bytes) döndürür ve girdiyi en yeni kullanılan yapar; yoksa None."""
+        path = self._path(key, ext)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, ext: str, data: bytes):
+        """Sesi atomik olarak yazar (geçici dosya + os.replace)."""
+        if not data:
+            return
+        path = self._path(key, ext)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ TTS önbelleğine yazılamadı: {e}")
+
+    def enforce_limit(self):
+        """Toplam boyut sınırı aşıldıysa en eski kullanılan girdileri siler."""
+        with self._lock:
+            if not self.root.exists():
+                return
+            entries = []
+            total = 0
+            for path in self.root.glob("*/*"):
+                if path.suffix == ".tmp":
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    removed += 1
+                except OSError:
+                    pass
+            logger.info(f"♻️ TTS önbelleğinden {removed} girdi silindi ({total / (1024 * 1024):.1f} MB kaldı)")
+
+_cache = None
+
+def get_cache():
+    """Etkinse paylaşılan önbelleği, TTS_CACHE_ENABLED kapalıysa None döndürür."""
+    global _cache
+    if not Config.TTS_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = TTSAudioCache()
+    return _cache
+
+def cached_synthesize(backend: str, voice: str, params: dict, sentences: list, ext: str,
+                      synthesize_many):
+    """Cümleleri önbellekten okur, yalnızca eksikleri sentezler; sesleri sırayla üretir.
+
+    synthesize_many: list[str] -> iterable[bytes] (eksik cümleler, aynı sırayla).
+    Sesler tek tek üretilir; bellekte aynı anda yalnızca bir cümlenin sesi tutulur.
+    Önbellek kapalıysa tüm cümleler doğrudan sentezlenir.
+    """
+    cache = get_cache()
+    if cache is None:
+        yield from synthesize_many(sentences)
+        return
+
+    keys = [cache.key(backend, voice, params, s) for s in sentences]
+    missing = [i for i, key in enumerate(keys) if not cache.contains(key, ext)]
+    logger.info(f"🗃️ TTS önbelleği ({backend}): {len(sentences) - len(missing)}/{len(sentences)} cümle isabet")
+
+    fresh = iter(synthesize_many([sentences[i] for i in missing]))
+    missing = set(missing)
+    for i, key in enumerate(keys):
+        data = None if i in missing else cache.get(key, ext)
+        if data is None:
+            # Eksik cümle ya da kontrolden sonra silinmiş girdi
+            data = next(fresh) if i in missing else next(iter(synthesize_many([sentences[i]])))
+            cache.put(key, ext, data)
+        yield data
+    if missing:
+        cache.enforce_limit()
@@ -0,0 +1,107 @@
+# src/tts/backends.py
+import importlib.util
+from src.config import Config
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+class TTSBackend:
+    """Tüm TTS motorları için ortak arayüz.
+
+    synthesize(metin, çıktı yolu, mod) sesi output_format biçiminde yazar ve yolu döndürür;
+    hata olursa istisna fırlatır (yedek motora geçiş kararı çağırana aittir).
+    """
+
+    name = ""
+    output_format = "wav"
+    requires = ()             # içe aktarılabilir olması gereken paketler
+    requires_network = False  # çevrimdışı ortamda çalışmaz
+
+    def voice(self, mode: str = "shorts") -> str:
+        """Modda kullanılan sesin kimliği (konuşma hızı kalibrasyonu bu anahtarla tutulur)."""
+        return "default"
+
+    def is_available(self) -> bool:
+        return all(importlib.util.find_spec(module) is not None for module in self.requires)
+
+    def synthesize(self, text: str, output_path: str, mode: str = "shorts") -> str:
+        raise NotImplementedError
+
+_BACKENDS = {}
+
+def register_backend(cls):
+    """Sınıfı adıyla kayda ekler (dekoratör)."""
+    _BACKENDS[cls.name] = cls
+    return cls
+
+def backend_names() -> list:
+    return list(_BACKENDS)
+
+def get_backend(name: str) -> TTSBackend:
+    if name not in _BACKENDS:
+        raise ValueError(f"Bilinmeyen TTS motoru: {name} (seçenekler: {', '.join(_BACKENDS)})")
+    return _BACKENDS[name]()
+
+def available_backends(offline: bool = False) -> list:
+    """Bu ortamda kurulu (ve istenirse ağ gerektirmeyen) motorların adları."""
+    return [
+        name for name, cls in _BACKENDS.items()
+        if cls().is_available() and not (offline and cls.requires_network)
+    ]
+
+def backend_for_mode(mode: str) -> TTSBackend:
+    """Modun Config'te seçili motoru (SHORTS_TTS_BACKEND / PODCAST_TTS_BACKEND)."""
+    return get_backend(Config.SHORTS_TTS_BACKEND if mode == "shorts" else Config.PODCAST_TTS_BACKEND)
+
+@register_backend
+class EdgeBackend(TTSBackend):
+    name = "edge"
+    output_format = "mp3"
+    requires = ("edge_tts",)
+    requires_network = True
+
+    def voice(self, mode: str = "shorts") -> str:
+        return Config.EDGE_TTS_VOICE
+
+    def synthesize(self, text: str, output_path: str, mode: str = "shorts") -> str:
+        from .edge_tts_tts import generate_tts
+        return generate_tts(text, output_path, mode)
+
+@register_backend
+class GTTSBackend(TTSBackend):
+    name = "gtts"
+    output_format = "mp3"
+    requires = ("gtts",)
+    requires_network = True
+
+    def voice(self, mode: str = "shorts") -> str:
+        return "en"
+
+    def synthesize(self, text: str, output_path: str, mode: str = "shorts") -> str:
+        from .gtts_tts import generate_tts
+        return generate_tts(text, output_path, mode)
+
+@register_backend
+class PiperBackend(TTSBackend):
+    name = "piper"
+    requires = ("piper",)
+
+    def voice(self, mode: str = "shorts") -> str:
+        from .piper_tts import PIPER_MODELS
+        return PIPER_MODELS[mode]["name"]
+
+    def synthesize(self, text: str, output_path: str, mode: str = "shorts") -> str:
+        from .piper_tts import generate_tts
+        return generate_tts(text, output_path, mode)
+
+@register_backend
+class CoquiBackend(TTSBackend):
+    name = "coqui"
+    requires = ("TTS",)
+
+    def voice(self, mode: str = "shorts") -> str:
+        return Config.SHORTS_TTS_MODEL if mode == "shorts" else Config.PODCAST_TTS_MODEL
+
+    def synthesize(self, text: str, output_path: str, mode: str = "shorts") -> str:
+        from .coqui_tts import generate_tts
+        return generate_tts(text, output_path, mode)
@@ -1,55 +1,159 @@
 # src/tts/coqui_tts.py
+import gc
+import io
 import os
+import wave
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from TTS.api import TTS
+import numpy as np
 from src.config import Config
+from TTS.api import TTS
 from src.utils import setup_logging
+from .audio_cache import get_cache, cached_synthesize
+from .audio_assembler import assemble
+from .text_chunks import split_sentences
+from .model_store import get_store
 
 logger = setup_logging()
 
-def ensure_models_downloaded():
-    """Coqui modellerini indir (eğer yoksa)."""
-    Config.ensure_directories()
-    
-    # Shorts modeli
-    shorts_model_path = Config.MODELS_DIR / "fast_tacotron2"
-    if not shorts_model_path.exists():
-        logger.info("📥 Coqui Fast Tacotron2 modeli indiriliyor (Shorts için)...")
-        TTS(model_name=Config.SHORTS_TTS_MODEL, progress_bar=True, gpu=False)
-    
-    # Podcast modeli
-    podcast_model_path = Config.MODELS_DIR / "vits"
-    if not podcast_model_path.exists():
-        logger.info("📥 Coqui VITS modeli indiriliyor (Podcast için)...")
-        TTS(model_name=Config.PODCAST_TTS_MODEL, progress_bar=True, gpu=False)
+def _model_name(mode: str) -> str:
+    return Config.SHORTS_TTS_MODEL if mode == "shorts" else Config.PODCAST_TTS_MODEL
+
+def configure_model_home():
+    """Coqui modellerini ortak model deposuna yönlendirir (TTS_HOME önceden ayarlıysa dokunulmaz).
+
+    get_user_data_dir TTS_HOME'u çağrı anında okur; ilk indirme/yüklemeden önce çağrılır.
+    """
+    os.environ.setdefault("TTS_HOME", str(Config.COQUI_MODELS_DIR))
+
+def record_model_files(model_name: str):
+    """Coqui'nin indirdiği dosyaların özetlerini model deposu manifestine kaydeder."""
+    get_store().record_tree(model_cache_dir(model_name), f"coqui:{model_name}")
+
+def model_cache_dir(model_name: str) -> Path:
+    """Coqui'nin modeli indirdiği klasör (TTS_HOME / XDG_DATA_HOME'a uyar)."""
+    from TTS.utils.generic_utils import get_user_data_dir
+    return Path(get_user_data_dir("tts")) / model_name.replace("/", "--")
+
+def is_model_cached(model_name: str) -> bool:
+    """Model diskte var mı? Model nesnesi oluşturmadan yalnızca dosyalara bakar."""
+    model_dir = model_cache_dir(model_name)
+    return model_dir.is_dir() and any(model_dir.glob("*.pth"))
+
+def _model_size_mb(tts: TTS, model_name: str) -> float:
+    """Yüklü modelin parametre belleği (MB); ölçülemezse disk boyutu kullanılır."""
+    try:
+        synthesizer = tts.synthesizer
+        modules = [m for m in (synthesizer.tts_model, getattr(synthesizer, "vocoder_model", None)) if m is not None]
+        total = sum(p.numel() * p.element_size() for m in modules for p in m.parameters())
+        return total / (1024 * 1024)
+    except Exception:
+        model_dir = model_cache_dir(model_name)
+        return sum(f.stat().st_size for f in model_dir.rglob("*") if f.is_file()) / (1024 * 1024)
+
+class CoquiModelRegistry:
+    """Mod başına yalnızca gereken modeli yükleyen, süreç içinde tutan kayıt.
+
+    Toplam model belleği memory_budget_mb'yi aşarsa en uzun süredir kullanılmayan
+    model bırakılır (en az bir model her zaman bellekte kalır).
+    """
+
+    def __init__(self, memory_budget_mb: float = None):
+        self.memory_budget_mb = memory_budget_mb if memory_budget_mb is not None else Config.COQUI_MEMORY_BUDGET_MB
+        self._models = OrderedDict()  # model adı -> (TTS, MB)
+        self._lock = threading.Lock()
+
+    def get(self, mode: str) -> TTS:
+        model_name = _model_name(mode)
+        configure_model_home()
+        with self._lock:
+            entry = self._models.get(model_name)
+            if entry is not None:
+                self._models.move_to_end(model_name)
+                return entry[0]
+
+            if not is_model_cached(model_name):
+                logger.info(f"📥 Coqui modeli indiriliyor ({mode}): {model_name}")
+            logger.info(f"🧠 Coqui modeli yükleniyor ({mode}): {model_name}")
+            tts = TTS(
+                model_name=model_name,
+                progress_bar=False,
+                gpu=False  # GitHub Actions'ta GPU yok
+            )
+            record_model_files(model_name)
+            self._models[model_name] = (tts, _model_size_mb(tts, model_name))
+            self._evict()
+            return tts
+
+    def _evict(self):
+        while len(self._models) > 1 and self.resident_mb() > self.memory_budget_mb:
+            model_name, (_, size_mb) = self._models.popitem(last=False)
+            logger.info(f"♻️ Coqui modeli bellekten çıkarıldı: {model_name} ({size_mb:.0f} MB)")
+            gc.collect()
+
+    def resident_mb(self) -> float:
+        return sum(size_mb for _, size_mb in self._models.values())
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            gc.collect()
+
+_registry = CoquiModelRegistry()
+
+def get_registry() -> CoquiModelRegistry:
+    return _registry
+
+def ensure_models_downloaded(modes: tuple = ("shorts", "podcast")):
+    """Coqui modellerini indir (eğer yoksa); model belleğe yüklenmez."""
+    configure_model_home()
+    for mode in modes:
+        model_name = _model_name(mode)
+        if not is_model_cached(model_name):
+            logger.info(f"📥 Coqui modeli indiriliyor ({mode}): {model_name}")
+            from TTS.utils.manage import ModelManager
+            ModelManager(progress_bar=True).download_model(model_name)
+        record_model_files(model_name)
     
     logger.info("✅ Coqui modelleri hazır.")
 
+def _synthesize_wav_bytes(tts: TTS, sentence: str) -> bytes:
+    """Bir cümleyi 16-bit mono WAV bytes olarak sentezler."""
+    samples = np.clip(np.asarray(tts.tts(text=sentence), dtype=np.float32), -1.0, 1.0)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(tts.synthesizer.output_sample_rate)
+        wav_file.writeframes((samples * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
 def generate_tts(text: str, output_path: str, mode: str = "shorts"):
     """
     Coqui TTS ile ses üret.
     mode: 'shorts' veya 'podcast'
     """
-    ensure_models_downloaded()
-    
     logger.info(f"🎙️ Coqui TTS ile ses üretimine başlandı ({mode})...")
     
-    # Modeli seç
-    model_name = Config.SHORTS_TTS_MODEL if mode == "shorts" else Config.PODCAST_TTS_MODEL
-    
-    # TTS başlat (CPU modu)
-    tts = TTS(
-        model_name=model_name,
-        progress_bar=True,
-        gpu=False  # GitHub Actions'ta GPU yok
-    )
-    
-    # Ses dosyası üret
-    tts.tts_to_file(
-        text=text,
-        file_path=output_path
-    )
+    if get_cache() is not None:
+        # Cümle bazlı önbellek: model yalnızca eksik cümle varsa yüklenir
+        sentences = split_sentences(text)
+        audio = cached_synthesize(
+            "coqui", _model_name(mode), {}, sentences, "wav",
+            lambda missing: (_synthesize_wav_bytes(get_registry().get(mode), s) for s in missing)
+        )
+        assemble(audio, output_path, fmt="wav")
+    else:
+        # Yalnızca bu modun modeli yüklenir; aynı süreçte sonraki çağrılar yeniden kullanır
+        tts = get_registry().get(mode)
+        
+        # Ses dosyası üret
+        tts.tts_to_file(
+            text=text,
+            file_path=output_path
+        )
     
     logger.info(f"✅ Ses dosyası oluşturuldu: {output_path}")
-    return output_path
\ No newline at end of file
+    return output_path
@@ -0,0 +1,120 @@
+# src/tts/duration_budget.py
+import os
+import json
+import threading
+from pathlib import Path
+from src.config import Config
+from src.media import probe_duration
+from src.utils import setup_logging
+from .text_chunks import sentence_spans
+
+logger = setup_logging()
+
+# Yeni ölçümün hareketli ortalamadaki ağırlığı
+RATE_SMOOTHING = 0.3
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+def mode_budget(mode: str) -> float:
+    """Modun video süresi (saniye); bunu aşan ses zaten kırpılır."""
+    return Config.SHORTS_DURATION if mode == "shorts" else Config.PODCAST_DURATION
+
+class SpeechRateStore:
+    """Ses başına konuşma hızını (kelime/sn) önceki çalıştırmalardan öğrenen JSON deposu.
+
+    Anahtar "motor:ses" biçimindedir; ilk ölçüm varsayılanın yerine geçer, sonrakiler
+    üstel hareketli ortalamayla eklenir.
+    """
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path or Config.SPEECH_RATES_FILE)
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def words_per_second(self, voice_key: str) -> float:
+        entry = self.load().get(voice_key)
+        return entry["words_per_second"] if entry else Config.DEFAULT_WORDS_PER_SECOND
+
+    def update(self, voice_key: str, words: int, seconds: float) -> float:
+        """Yeni ölçümü ekler ve güncel hızı döndürür."""
+        if words <= 0 or seconds <= 0:
+            return self.words_per_second(voice_key)
+        measured = words / seconds
+        with self._lock:
+            rates = self.load()
+            entry = rates.get(voice_key)
+            if entry:
+                rate = (1 - RATE_SMOOTHING) * entry["words_per_second"] + RATE_SMOOTHING * measured
+                samples = entry["samples"] + 1
+            else:
+                rate, samples = measured, 1
+            rates[voice_key] = {"words_per_second": round(rate, 4), "samples": samples}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(rates, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        return rate
+
+def voice_key(backend, mode: str) -> str:
+    return f"{backend.name}:{backend.voice(mode)}"
+
+def trim_to_budget(text: str, budget_seconds: float, words_per_second: float) -> tuple:
+    """Metni, tahmini süresi bütçeye sığacak şekilde cümle sınırında kırpar.
+
+    Metin yeniden birleştirilmez: sığıyorsa olduğu gibi, sığmıyorsa son tutulan cümlenin
+    bittiği konumdan kesilerek döner (paragraf aralıkları korunur).
+    Döndürür: (kırpılmış metin, tahmini süre). İlk cümle bütçeyi aşsa bile korunur.
+    """
+    end = 0
+    words = 0
+    for start, sentence_end in sentence_spans(text):
+        sentence_words = count_words(text[start:sentence_end])
+        if end and (words + sentence_words) / words_per_second > budget_seconds:
+            return text[:end], words / words_per_second
+        end = sentence_end
+        words += sentence_words
+    return text, words / words_per_second
+
+def fit_script(script: str, mode: str, backend, store: SpeechRateStore = None) -> tuple:
+    """Script'i modun süre bütçesine sığdırır; (script, tahmini süre) döndürür."""
+    store = store or SpeechRateStore()
+    rate = store.words_per_second(voice_key(backend, mode))
+    if not Config.TTS_DURATION_BUDGET:
+        return script, count_words(script) / rate
+
+    budget = mode_budget(mode)
+    trimmed, predicted = trim_to_budget(script, budget, rate)
+    total_words, kept_words = count_words(script), count_words(trimmed)
+    if kept_words < total_words:
+        logger.info(
+            f"✂️ Script süre bütçesine göre kırpıldı: {kept_words}/{total_words} kelime "
+            f"(tahmini {predicted:.1f} sn / bütçe {budget} sn, {rate:.2f} kelime/sn)"
+        )
+    return trimmed, predicted
+
+def record_duration(script: str, audio_path: str, mode: str, backend, predicted: float,
+                    store: SpeechRateStore = None) -> dict:
+    """Tahmini ve gerçek süreyi raporlar, sesin konuşma hızını günceller (süre okunamazsa None)."""
+    store = store or SpeechRateStore()
+    key = voice_key(backend, mode)
+    try:
+        actual = probe_duration(audio_path)
+    except RuntimeError as e:
+        # Yalnızca ölçüm adımı: süre okunamazsa üretim durdurulmaz
+        logger.warning(f"⚠️ Ses süresi ölçülemedi, {key} hızı güncellenmedi: {e}")
+        return None
+    rate = store.update(key, count_words(script), actual)
+    error = (predicted - actual) / actual * 100 if actual else 0.0
+    logger.info(
+        f"⏱️ Ses süresi: tahmini {predicted:.1f} sn, gerçek {actual:.1f} sn ({error:+.1f}%); "
+        f"{key} hızı {rate:.2f} kelime/sn"
+    )
+    return {"voice": key, "predicted": round(predicted, 2), "actual": round(actual, 2), "words_per_second": rate}
@@ -0,0 +1,229 @@
+# src/tts/edge_tts_tts.py
+import json
+import bisect
+import asyncio
+import inspect
+import itertools
+import tempfile
+from pathlib import Path
+import edge_tts
+import edge_tts.communicate
+from src.config import Config
+from src.utils import setup_logging
+from .text_chunks import split_sentences
+from .audio_cache import get_cache
+from .audio_assembler import AudioAssembler, mp3_frames, split_mp3
+from .timing import save_timing, spread_words
+
+logger = setup_logging()
+
+def _apply_endpoint_override():
+    """EDGE_TTS_WSS_URL ayarlıysa istekleri o adrese (örn. yerel test sunucusu) yönlendirir."""
+    if Config.EDGE_TTS_WSS_URL:
+        edge_tts.communicate.WSS_URL = Config.EDGE_TTS_WSS_URL
+
+# edge-tts çıktı biçimi; önbellek anahtarına girer. Sabit 48 kbps olduğundan süre bayttan hesaplanır.
+OUTPUT_FORMAT = "audio-24khz-48kbitrate-mono-mp3"
+OUTPUT_BITRATE = 48000
+
+def mp3_duration(data: bytes) -> float:
+    """edge-tts MP3 parçasının süresi (sn); kod çözmeden, kare baytlarından."""
+    return len(mp3_frames(data)) * 8 / OUTPUT_BITRATE
+
+def _communicate(text: str, voice: str) -> edge_tts.Communicate:
+    # edge-tts 7+ varsayılan olarak cümle sınırı yollar; kelime sınırları açıkça istenir
+    if "boundary" in inspect.signature(edge_tts.Communicate.__init__).parameters:
+        return edge_tts.Communicate(text, voice, boundary="WordBoundary")
+    return edge_tts.Communicate(text, voice)
+
+async def synthesize_edge(text: str, output_path: str, voice: str) -> list:
+    """Tek bir edge-tts isteği: metni MP3 olarak kaydeder, kelime sınırlarını döndürür.
+
+    Döndürür: [(başlangıç sn, bitiş sn, kelime), ...] (WordBoundary olaylarından, akış sırasında)
+    """
+    _apply_endpoint_override()
+    words = []
+    with open(output_path, "wb") as f:
+        async for chunk in _communicate(text, voice).stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
+            elif chunk["type"] == "WordBoundary":
+                start = chunk["offset"] / 1e7  # 100 ns birimi
+                words.append((start, start + chunk["duration"] / 1e7, chunk["text"]))
+    return words
+
+async def _synthesize_chunk(index: int, chunk: str, path: Path, voice: str, semaphore: asyncio.Semaphore,
+                            synthesize, retries: int) -> tuple:
+    """Bir parçayı semafor altında seslendirir; hata olursa yalnızca bu parçayı yeniden dener.
+
+    Döndürür: (yol, kelime sınırları veya None)
+    """
+    for attempt in range(1, retries + 1):
+        async with semaphore:
+            try:
+                words = await synthesize(chunk, str(path), voice)
+                if path.exists() and path.stat().st_size > 0:
+                    return path, words
+                raise RuntimeError("boş ses dosyası")
+            except Exception as e:
+                logger.warning(f"⚠️ Edge TTS parça {index + 1} deneme {attempt}/{retries} başarısız: {e}")
+        if attempt < retries:
+            await asyncio.sleep(Config.EDGE_TTS_RETRY_DELAY * attempt)
+    raise RuntimeError(f"❌ Edge TTS parça {index + 1} {retries} denemede üretilemedi")
+
+def _pack_indices(sentences: list, indices: list, max_chars: int) -> list:
+    """Verilen cümlelerden ardışık olanları max_chars'ı aşmadan paketler (pack_sentences gibi).
+
+    Döndürür: [(cümle indeksleri, parça metni), ...]
+    """
+    groups = []
+    for i in indices:
+        if groups and groups[-1][0][-1] == i - 1 and len(groups[-1][1]) + 1 + len(sentences[i]) <= max_chars:
+            groups[-1] = (groups[-1][0] + [i], f"{groups[-1][1]} {sentences[i]}")
+        else:
+            groups.append(([i], sentences[i]))
+    return groups
+
+def _split_by_sentence(data: bytes, words: list, sentences: list) -> list:
+    """Paketlenmiş parçanın sesini WordBoundary zamanlarıyla cümlelere böler.
+
+    Kesimler, bir cümlenin son kelimesiyle sonrakinin ilk kelimesi arasındaki sessizliğin
+    ortasındadır. Döndürür: [(mp3 baytları, cümleye göreli kelime sınırları), ...]; kelimesi
+    eşlenemeyen bir cümle varsa None (parça bölünmeden kullanılır).
+    """
+    chunk = " ".join(sentences)
+    ends = list(itertools.accumulate(len(sentence) + 1 for sentence in sentences))
+    owned = [[] for _ in sentences]
+    cursor = owner = 0
+    for start, end, word in words or []:
+        found = chunk.find(word, cursor)
+        if found >= 0:
+            cursor = found + len(word)
+            owner = min(bisect.bisect_right(ends, found), len(sentences) - 1)
+        owned[owner].append((start, end, word))
+    if not all(owned):
+        return None
+
+    cuts = [(owned[i - 1][-1][1] + owned[i][0][0]) / 2 for i in range(1, len(sentences))]
+    pieces = []
+    offset = 0.0
+    for piece, sentence_words in zip(split_mp3(data, cuts), owned):
+        if not piece:
+            return None
+        pieces.append((piece, [(start - offset, end - offset, word) for start, end, word in sentence_words]))
+        offset += mp3_duration(piece)
+    return pieces
+
+async def synthesize_chunked(text: str, output_path: str, voice: str = None, synthesize=None,
+                             max_chars: int = None, concurrency: int = None, retries: int = None) -> str:
+    """Metni cümle sınırlarında böler, parçaları sınırlı eşzamanlılıkla seslendirir ve
+    sırayla tek MP3'te birleştirir (MP3 kareleri yeniden kodlanmadan art arda yazılır).
+
+    Önbellek cümle başınadır: yalnızca önbellekte olmayan ardışık cümleler max_chars'a
+    paketlenip istenir, dönen ses kelime sınırlarından cümlelere bölünüp ayrı ayrı saklanır.
+    Böylece tekrarlanan CTA/şablon cümleleri farklı metinlerde de önbellekten gelir.
+
+    synthesize: (metin, yol, ses) -> awaitable[kelime sınırları | None]; varsayılan edge-tts,
+    testte yerel taklit verilebilir. Parçaların kelime sınırları, önceki parçaların süresi
+    kadar kaydırılıp sesin yanına zamanlama izi olarak yazılır.
+    """
+    voice = voice or Config.EDGE_TTS_VOICE
+    synthesize = synthesize or synthesize_edge
+    cache = get_cache()
+    sentences = split_sentences(text)
+    if not sentences:
+        raise ValueError("Seslendirilecek metin boş")
+
+    # Sırayla birleştirilecek birimler: ilk cümle indeksi -> (mp3 baytları, kelime sınırları, metin)
+    units = {}
+    keys = [cache.key("edge", voice, {"format": OUTPUT_FORMAT}, sentence) if cache is not None else None
+            for sentence in sentences]
+    if cache is not None:
+        for i, key in enumerate(keys):
+            data = cache.get(key, "mp3")
+            if data:
+                words = cache.get(key, "json")
+                units[i] = (data, json.loads(words) if words else None, sentences[i])
+    missing = [i for i in range(len(sentences)) if i not in units]
+    chunks = _pack_indices(sentences, missing, max_chars or Config.EDGE_TTS_CHUNK_CHARS)
+
+    concurrency = concurrency or Config.EDGE_TTS_CONCURRENCY
+    semaphore = asyncio.Semaphore(concurrency)
+    retries = retries or Config.EDGE_TTS_RETRIES
+    logger.info(
+        f"🧩 Edge TTS: {len(chunks)} parça, {len(units)}/{len(sentences)} cümle önbellekten, "
+        f"en fazla {concurrency} eşzamanlı istek"
+    )
+
+    Config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR), prefix="edge_tts_") as work_dir:
+        work_path = Path(work_dir)
+        tasks = [
+            asyncio.ensure_future(_synthesize_chunk(
+                i, chunk, work_path / f"chunk_{i:04d}.mp3", voice, semaphore, synthesize, retries
+            ))
+            for i, (_, chunk) in enumerate(chunks)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Bir parça tükendiyse diğerleri, silinecek geçici dizine yazmadan durdurulur
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        for (indices, chunk), (path, words) in zip(chunks, results):
+            data = path.read_bytes()
+            if cache is None:
+                units[indices[0]] = (data, words, chunk)
+                continue
+            pieces = [(data, words)] if len(indices) == 1 else _split_by_sentence(
+                data, words, [sentences[i] for i in indices]
+            )
+            if pieces is None:
+                # Kelime sınırı olmayan parça bölünemez: bütün olarak kullanılır, önbelleğe yazılmaz
+                units[indices[0]] = (data, words, chunk)
+                continue
+            for i, (piece, piece_words) in zip(indices, pieces):
+                cache.put(keys[i], "mp3", piece)
+                if piece_words:
+                    cache.put(keys[i], "json", json.dumps(piece_words).encode("utf-8"))
+                units[i] = (piece, piece_words, sentences[i])
+        if cache is not None:
+            cache.enforce_limit()
+
+    timing = []
+    offset = 0.0
+    with AudioAssembler(output_path, fmt="mp3") as assembler:
+        for i in sorted(units):
+            data, words, unit_text = units[i]
+            assembler.append(data)
+            duration = mp3_duration(data)
+            if words:
+                timing.extend((offset + start, offset + end, word) for start, end, word in words)
+            else:
+                # Sınır bilgisi olmayan parça (eski önbellek girdisi ya da taklit): kelimeler yayılır
+                timing.extend(spread_words(unit_text, offset, offset + duration))
+            offset += duration
+
+    save_timing(output_path, timing, offset, "edge")
+    return output_path
+
+async def generate_tts_async(text: str, output_path: str, voice: str = None, chunked: bool = None) -> str:
+    """Edge TTS ile ses üretir; uzun metinlerde veya önbellek açıkken parçalı mod kullanılır."""
+    voice = voice or Config.EDGE_TTS_VOICE
+    chunked = Config.EDGE_TTS_CHUNKED if chunked is None else chunked
+    if get_cache() is not None or (chunked and len(text) > Config.EDGE_TTS_CHUNK_CHARS):
+        return await synthesize_chunked(text, output_path, voice)
+    words = await synthesize_edge(text, output_path, voice)
+    duration = mp3_duration(Path(output_path).read_bytes())
+    save_timing(output_path, words or spread_words(text, 0.0, duration), duration, "edge")
+    return output_path
+
+def generate_tts(text: str, output_path: str, mode: str = "shorts"):
+    """Diğer TTS modülleriyle aynı imza: Edge TTS ile ses üret."""
+    logger.info(f"🎙️ Edge TTS ile ses üretimine başlandı ({mode})...")
+    asyncio.run(generate_tts_async(text, output_path))
+    logger.info(f"✅ Ses dosyası oluşturuldu: {output_path}")
+    return output_path
@@ -1,10 +1,12 @@
 # src/tts/gtts_tts.py
-import os
+import io
 import logging
 from gtts import gTTS
-from pydub import AudioSegment
 from src.config import Config
 from src.utils import setup_logging
+from .audio_cache import get_cache, cached_synthesize
+from .audio_assembler import assemble
+from .text_chunks import split_sentences
 
 logger = setup_logging()
 
@@ -27,36 +29,31 @@ def split_text(text: str, max_chars: int = 4500) -> list:
     
     return chunks
 
+def _synthesize_mp3(texts: list):
+    """Her metni gTTS ile MP3 bytes'a çevirir (sırayla, tek tek üretir)."""
+    for i, text in enumerate(texts):
+        logger.info(f"🔊 Parça {i+1}/{len(texts)} seslendiriliyor...")
+        buffer = io.BytesIO()
+        gTTS(text=text, lang="en", slow=False).write_to_fp(buffer)
+        yield buffer.getvalue()
+
 def generate_tts(text: str, output_path: str, mode: str = "shorts"):
     """
     gTTS ile ses üret (uzun metinler için parçalı).
     """
     logger.info(f"🎙️ gTTS ile ses üretimine başlandı ({mode})...")
     
-    # Podcast için metni böl
-    if mode == "podcast":
-        chunks = split_text(text)
-        audio_segments = []
-        
-        for i, chunk in enumerate(chunks):
-            logger.info(f"🔊 Chunk {i+1}/{len(chunks)} seslendiriliyor...")
-            tts = gTTS(text=chunk, lang="en", slow=False)
-            
-            # Geçici dosya
-            temp_path = f"/tmp/temp_chunk_{i}.mp3"
-            tts.save(temp_path)
-            
-            # Pydub ile yükle
-            audio_segments.append(AudioSegment.from_mp3(temp_path))
-        
-        # Tüm parçaları birleştir
-        combined = sum(audio_segments)
-        combined.export(output_path, format="mp3")
-        
+    if get_cache() is not None:
+        # Cümle bazlı önbellek: yalnızca eksik cümleler seslendirilir
+        sentences = split_sentences(text)
+        audio = cached_synthesize("gtts", "en", {"slow": False}, sentences, "mp3", _synthesize_mp3)
     else:
-        # Shorts için normal seslendirme
-        tts = gTTS(text=text, lang="en", slow=False)
-        tts.save(output_path)
+        # Podcast için metni gTTS limitine göre böl, shorts tek parça
+        chunks = split_text(text) if mode == "podcast" else [text]
+        audio = _synthesize_mp3(chunks)
+    
+    # Parçalar bellekte biriktirilmeden, yeniden kodlanmadan çıktıya eklenir
+    assemble(audio, output_path, fmt="mp3")
     
     logger.info(f"✅ Ses dosyası oluşturuldu: {output_path}")
     return output_path
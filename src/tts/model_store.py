@@ -0,0 +1,159 @@
+# src/tts/model_store.py
+import os
+import json
+import mmap
+import time
+import hashlib
+import threading
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from src.config import Config
+from src.utils import setup_logging, timed_stage
+
+logger = setup_logging()
+
+DOWNLOAD_BLOCK_SIZE = 1 << 20
+
+def sha256_file(path: Path) -> str:
+    """Dosyanın SHA-256'sı; dosya belleğe eşlenerek (mmap) kopyasız okunur."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            digest.update(mapped)
+    return digest.hexdigest()
+
+def _mirror_url(mirror: str, name: str) -> str:
+    """Ayna kökü + dosya adı; düz klasör yolu file:// adresine çevrilir."""
+    if "://" not in mirror:
+        mirror = Path(mirror).resolve().as_uri()
+    return f"{mirror.rstrip('/')}/{urllib.parse.quote(name)}"
+
+class ModelStore:
+    """Config.MODELS_DIR altında, sağlama toplamlı ortak model deposu.
+
+    Dosyalar geçici dosyaya indirilip SHA-256'sı hesaplanır, beklenen değer verilmişse
+    doğrulanır ve os.replace ile yerine taşınır. Her dosyanın özeti, boyutu ve kaynağı
+    manifest.json'a yazılır; depodaki dosyanın özeti sabitlenen (yoksa manifestteki)
+    değerle aynıysa indirme yapılmaz, değilse dosya yeniden indirilir.
+    MODEL_MIRROR ayarlıysa dosyalar aynı adla aynadan (ör. file:///opt/models) alınır.
+    """
+
+    def __init__(self, root: Path = None, mirror: str = None):
+        self.root = Path(root or Config.MODELS_DIR)
+        self.mirror = Config.MODEL_MIRROR if mirror is None else mirror
+        self.manifest_path = self.root / Config.MODEL_MANIFEST.name
+        self._lock = threading.Lock()
+
+    def _relative(self, path: Path) -> str:
+        """Manifest anahtarı: depo köküne göre yol (kök dışındaysa mutlak yol)."""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update_manifest(self, entries: dict):
+        with self._lock:
+            manifest = self.load_manifest()
+            manifest.update(entries)
+            tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+
+    def _entry(self, path: Path, source: str, sha256: str = None) -> dict:
+        return {
+            "sha256": sha256 or sha256_file(path),
+            "size": path.stat().st_size,
+            "source": source,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    def fetch(self, name: str, url: str, sha256: str = None) -> Path:
+        """Dosyayı depodan döndürür; yoksa (veya özeti uyuşmuyorsa) atomik olarak indirir.
+
+        Var olan dosya her çağrıda yeniden özetlenir (mmap, kopyasız): boyutu değişmeden
+        bozulan dosya da yakalanır.
+        """
+        path = self.root / name
+        entry = self.load_manifest().get(name)
+        if path.exists():
+            expected = sha256 or (entry["sha256"] if entry else None)
+            recorded = self._entry(path, entry["source"] if entry else "local")
+            if expected is None or recorded["sha256"] == expected:
+                if entry is None or entry["sha256"] != recorded["sha256"] or entry["size"] != recorded["size"]:
+                    # Manifestten önce indirilmiş dosya: özeti kaydedilir
+                    self._update_manifest({name: recorded})
+                return path
+            logger.warning(f"⚠️ Model dosyasının özeti uyuşmuyor, yeniden indiriliyor: {name}")
+
+        source = _mirror_url(self.mirror, name) if self.mirror else url
+        with timed_stage("model_download"):
+            digest = self._download(source, path, sha256)
+        self._update_manifest({name: self._entry(path, source, digest)})
+        return path
+
+    def _download(self, source: str, path: Path, sha256: str = None) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.part")
+        digest = hashlib.sha256()
+        start = time.perf_counter()
+        logger.info(f"📥 Model indiriliyor: {source}")
+        try:
+            with urllib.request.urlopen(source) as response, open(tmp_path, "wb") as out:
+                while True:
+                    block = response.read(DOWNLOAD_BLOCK_SIZE)
+                    if not block:
+                        break
+                    digest.update(block)
+                    out.write(block)
+            if sha256 and digest.hexdigest() != sha256:
+                raise ValueError(f"Sağlama toplamı uyuşmuyor: {path.name} ({digest.hexdigest()} != {sha256})")
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        logger.info(f"✅ {path.name} indirildi ({size_mb:.1f} MB, {time.perf_counter() - start:.1f} sn)")
+        return digest.hexdigest()
+
+    def record_tree(self, directory: Path, source: str):
+        """Başka bir araçla indirilmiş klasördeki dosyaları manifeste ekler."""
+        manifest = self.load_manifest()
+        entries = {}
+        for path in sorted(Path(directory).rglob("*")):
+            if not path.is_file():
+                continue
+            key = self._relative(path)
+            entry = manifest.get(key)
+            if not entry or entry["size"] != path.stat().st_size:
+                entries[key] = self._entry(path, source)
+        if entries:
+            self._update_manifest(entries)
+
+    def verify(self) -> list:
+        """Manifestteki tüm dosyaları yeniden özetler; bozuk/eksik olanların adlarını döndürür."""
+        bad = []
+        for key, entry in self.load_manifest().items():
+            path = self.root / key  # mutlak anahtarda kök yok sayılır
+            if not path.exists() or sha256_file(path) != entry["sha256"]:
+                bad.append(key)
+        return bad
+
+_store = None
+
+def get_store() -> ModelStore:
+    global _store
+    if _store is None:
+        Config.ensure_directories()
+        _store = ModelStore()
+    return _store
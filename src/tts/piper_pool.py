@@ -0,0 +1,122 @@
+# src/tts/piper_pool.py
+import json
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from src.config import Config
+from src.parallel import resolve_workers
+from src.utils import setup_logging
+from .text_chunks import split_sentences, pack_sentences
+from .audio_cache import get_cache, cached_synthesize
+from .audio_assembler import AudioAssembler
+
+logger = setup_logging()
+
+# Süreç başına yüklü sesler: model yolu -> PiperVoice (her model süreç başına bir kez yüklenir)
+_voices = {}
+
+def load_voice(model_path: str):
+    """Piper sesini bu süreçte bir kez yükler, sonraki çağrılarda aynısını döndürür."""
+    model_path = str(model_path)
+    voice = _voices.get(model_path)
+    if voice is None:
+        from piper import PiperVoice
+        voice = PiperVoice.load(model_path)
+        _voices[model_path] = voice
+    return voice
+
+def _pcm_chunks(voice, text: str, length_scale: float = None, noise_scale: float = None):
+    """Ham 16-bit mono PCM parçaları üretir (piper-tts 1.2 ve 1.3+ API'leri)."""
+    if hasattr(voice, "synthesize_stream_raw"):
+        yield from voice.synthesize_stream_raw(text, length_scale=length_scale, noise_scale=noise_scale)
+        return
+    from piper import SynthesisConfig
+    syn_config = SynthesisConfig(length_scale=length_scale, noise_scale=noise_scale)
+    for chunk in voice.synthesize(text, syn_config=syn_config):
+        yield chunk.audio_int16_bytes
+
+def _synthesize_batch(job: tuple) -> bytes:
+    """İşçi süreç: yüklü sesle bir cümle grubunu PCM'e çevirir."""
+    model_path, text, length_scale, noise_scale = job
+    return b"".join(_pcm_chunks(load_voice(model_path), text, length_scale, noise_scale))
+
+def _model_sample_rate(model_path: str) -> int:
+    """Örnekleme hızını modelin .onnx.json dosyasından okur (modeli yüklemeden)."""
+    config_path = Path(f"{model_path}.json")
+    with open(config_path, "r", encoding="utf-8") as f:
+        return int(json.load(f)["audio"]["sample_rate"])
+
+class PiperVoicePool:
+    """Her işçisi modeli bir kez yüklemiş kalıcı Piper süreç havuzu.
+
+    Cümle grupları işçilere dağıtılır, PCM sonuçları sırayla doğrudan WAV'a yazılır.
+    Tek çekirdekte havuz kurulmaz; ses bu süreçte bir kez yüklenip kullanılır.
+    """
+
+    def __init__(self, model_path: str, workers: int = None):
+        self.model_path = str(model_path)
+        self.workers = resolve_workers(workers if workers is not None else Config.PIPER_WORKERS)
+        self.sample_rate = _model_sample_rate(self.model_path)
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None and self.workers > 1:
+            logger.info(f"⚙️ Piper havuzu başlatılıyor: {self.workers} süreç ({Path(self.model_path).name})")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=load_voice, initargs=(self.model_path,)
+            )
+        return self._executor
+
+    def _map(self, jobs: list):
+        executor = self._get_executor()
+        if executor is None or len(jobs) <= 1:
+            return map(_synthesize_batch, jobs)
+        return executor.map(_synthesize_batch, jobs)
+
+    def synthesize_pcm(self, text: str, length_scale: float = None, noise_scale: float = None,
+                       batch_chars: int = None):
+        """Metni cümle gruplarına bölüp PCM parçalarını sırayla üretir."""
+        if get_cache() is not None:
+            return self._synthesize_pcm_cached(text, length_scale, noise_scale)
+        batches = pack_sentences(split_sentences(text), batch_chars or Config.PIPER_BATCH_CHARS)
+        return self._map([(self.model_path, batch, length_scale, noise_scale) for batch in batches])
+
+    def _synthesize_pcm_cached(self, text: str, length_scale: float, noise_scale: float):
+        """Cümle bazlı önbellek: isabetler okunur, yalnızca eksik cümleler havuza gider."""
+        params = {"sample_rate": self.sample_rate, "length_scale": length_scale, "noise_scale": noise_scale}
+        return cached_synthesize(
+            "piper", Path(self.model_path).name, params, split_sentences(text), "pcm",
+            lambda missing: self._map([(self.model_path, s, length_scale, noise_scale) for s in missing])
+        )
+
+    def synthesize_to_wav(self, text: str, output_path: str, length_scale: float = None,
+                          noise_scale: float = None) -> str:
+        """PCM'i hazır oldukça (sırayla) çıktı WAV dosyasına akıtır."""
+        with AudioAssembler(output_path, fmt="wav") as assembler:
+            for pcm in self.synthesize_pcm(text, length_scale, noise_scale):
+                assembler.append_pcm(pcm, self.sample_rate)
+        return str(output_path)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(model_path: str, workers: int = None) -> PiperVoicePool:
+    """Model başına süreç boyunca yaşayan havuzu döndürür."""
+    key = (str(model_path), workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = PiperVoicePool(model_path, workers)
+            _pools[key] = pool
+        return pool
+
+@atexit.register
+def _close_pools():
+    for pool in _pools.values():
+        pool.close()
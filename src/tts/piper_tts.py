@@ -1,75 +1,64 @@
 # src/tts/piper_tts.py
-import os
 import logging
-import subprocess
-import sys
 from pathlib import Path
 from src.config import Config
 from src.utils import setup_logging
+from .piper_pool import get_pool
+from .model_store import get_store
 
 logger = setup_logging()
 
+# Piper sesleri (rhasspy/piper-voices v1.0.0)
+PIPER_VOICES_URL = "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US"
+
 # Piper model URL'leri
 PIPER_MODELS = {
     "shorts": {
-        "url": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/low/en_US-lessac-low.onnx",
-        "config_url": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/low/en_US-lessac-low.onnx.json",
+        "url": f"{PIPER_VOICES_URL}/lessac/low/en_US-lessac-low.onnx",
+        "config_url": f"{PIPER_VOICES_URL}/lessac/low/en_US-lessac-low.onnx.json",
         "name": "en_US-lessac-low.onnx"
     },
     "podcast": {
-        "url": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/medium/en_US-lessac-medium.onnx",
-        "config_url": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/medium/en_US-lessac-medium.onnx.json",
-        "name": "en_US-lessac-medium.onnx"
+        "url": f"{PIPER_VOICES_URL}/lessac/medium/en_US-lessac-medium.onnx",
+        "config_url": f"{PIPER_VOICES_URL}/lessac/medium/en_US-lessac-medium.onnx.json",
+        "name": "en_US-lessac-medium.onnx",
+        # Daha yavaş, daha net podcast anlatımı
+        "length_scale": 1.15,
+        "noise_scale": 0.667
     }
 }
 
+def fetch_voice(model_info: dict) -> Path:
+    """Piper modelini ve .onnx.json yapılandırmasını model deposundan alır."""
+    store = get_store()
+    # İsteğe bağlı "sha256"/"config_sha256" alanları sabitlenmiş sağlama toplamıdır
+    model_path = store.fetch(model_info["name"], model_info["url"], model_info.get("sha256"))
+    store.fetch(f"{model_info['name']}.json", model_info["config_url"], model_info.get("config_sha256"))
+    return model_path
+
 def download_model(mode: str = "shorts"):
-    """Piper modelini indir."""
-    Config.ensure_directories()
-    model_info = PIPER_MODELS[mode]
-    model_path = Config.MODELS_DIR / model_info["name"]
-    config_path = model_path.with_suffix(".onnx.json")
-    
-    if not model_path.exists():
-        logger.info(f"📥 {mode.upper()} için Piper modeli indiriliyor...")
-        # Modeli indir
-        subprocess.run([
-            "wget", "-O", str(model_path), model_info["url"]
-        ], check=True)
-        
-        # Config dosyasını indir
-        subprocess.run([
-            "wget", "-O", str(config_path), model_info["config_url"]
-        ], check=True)
-    
+    """Piper modelini indir (model deposunda varsa indirme yapılmaz)."""
+    model_path = fetch_voice(PIPER_MODELS[mode])
     logger.info(f"✅ {mode.upper()} modeli hazır: {model_path}")
     return str(model_path)
 
 def generate_tts(text: str, output_path: str, mode: str = "shorts"):
     """
-    Piper TTS ile ses üret.
+    Piper TTS ile ses üret (süreç içinde yüklü, kalıcı ses havuzu ile).
     """
     model_path = download_model(mode)
     logger.info(f"🎙️ Piper TTS ile ses üretimine başlandı ({mode})...")
     
-    # Piper komutunu çalıştır
-    cmd = [
-        sys.executable, "-m", "piper",
-        "--model", model_path,
-        "--output", output_path
-    ]
-    
-    # Metni Piper'a aktar
     try:
-        result = subprocess.run(
-            cmd,
-            input=text,
-            text=True,
-            capture_output=True,
-            check=True
+        model_info = PIPER_MODELS[mode]
+        get_pool(model_path).synthesize_to_wav(
+            text,
+            output_path,
+            length_scale=model_info.get("length_scale"),
+            noise_scale=model_info.get("noise_scale")
         )
         logger.info(f"✅ Ses dosyası oluşturuldu: {output_path}")
         return output_path
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Piper TTS hatası:\nStdout: {e.stdout}\nStderr: {e.stderr}")
+    except Exception as e:
+        logger.error(f"Piper TTS hatası: {e}")
         raise
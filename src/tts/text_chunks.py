@@ -0,0 +1,43 @@
+# src/tts/text_chunks.py
+import re
+
+# Cümle sonu: noktalama + kapanış tırnak/parantezleri (cümleye dahil), ardından boşluk gelir
+_SENTENCE_END = re.compile(r"[.!?…][\"'”’)\]]*(?=\s)")
+_PARAGRAPH = re.compile(r"[^\n]+")
+
+def _add_span(spans: list, text: str, start: int, end: int):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start < end:
+        spans.append((start, end))
+
+def sentence_spans(text: str) -> list:
+    """Cümlelerin metindeki (başlangıç, bitiş) konumları; satır sonları da cümle sınırıdır."""
+    spans = []
+    for paragraph in _PARAGRAPH.finditer(text):
+        start = paragraph.start()
+        for match in _SENTENCE_END.finditer(text, paragraph.start(), paragraph.end()):
+            _add_span(spans, text, start, match.end())
+            start = match.end()
+        _add_span(spans, text, start, paragraph.end())
+    return spans
+
+def split_sentences(text: str) -> list:
+    """Metni cümle sınırlarından böler (cümle içi boşluklar sadeleştirilir); boş parçalar atılır."""
+    return [" ".join(text[start:end].split()) for start, end in sentence_spans(text)]
+
+def pack_sentences(sentences: list, max_chars: int) -> list:
+    """Ardışık cümleleri max_chars'ı aşmayacak parçalarda toplar (tek uzun cümle bölünmez)."""
+    chunks = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
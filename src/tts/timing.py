@@ -0,0 +1,96 @@
+# src/tts/timing.py
+import re
+import json
+from difflib import SequenceMatcher
+from pathlib import Path
+import numpy as np
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+TIMING_VERSION = 1
+
+def timing_path(audio_path: str) -> Path:
+    """Sesin yanındaki zamanlama dosyası: audio.mp3 -> audio.timing.json"""
+    return Path(audio_path).with_suffix(".timing.json")
+
+def save_timing(audio_path: str, words: list, duration: float, source: str) -> Path:
+    """Kelime zamanlamalarını [[başlangıç, bitiş, kelime], ...] olarak kaydeder (saniye)."""
+    track = {
+        "version": TIMING_VERSION,
+        "source": source,
+        "duration": round(duration, 3),
+        "words": [[round(start, 3), round(end, 3), text] for start, end, text in words],
+    }
+    path = timing_path(audio_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(track, f, ensure_ascii=False, separators=(",", ":"))
+    logger.info(f"🕒 Zamanlama izi kaydedildi: {path.name} ({len(words)} kelime, {source})")
+    return path
+
+def load_timing(audio_path: str):
+    """Sesin zamanlama izini döndürür; yoksa veya okunamıyorsa None."""
+    try:
+        with open(timing_path(audio_path), "r", encoding="utf-8") as f:
+            track = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if track.get("version") != TIMING_VERSION or not track.get("words"):
+        return None
+    return track
+
+def spread_words(text: str, start: float, end: float) -> list:
+    """Zamanlaması bilinmeyen metnin kelimelerini aralığa uzunluklarıyla orantılı yayar."""
+    words = text.split()
+    if not words:
+        return []
+    weights = np.array([len(w) + 1 for w in words], dtype=np.float64)
+    edges = start + (end - start) * np.concatenate(([0.0], np.cumsum(weights) / weights.sum()))
+    return [(float(edges[i]), float(edges[i + 1]), w) for i, w in enumerate(words)]
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+def word_starts(script_words: list, track: dict) -> np.ndarray:
+    """Script kelimelerinin başlangıç zamanları.
+
+    İzdeki kelimeler script'le sıra eşleştirmesiyle hizalanır (noktalama ve büyük/küçük
+    harf farkları yok sayılır); eşleşmeyen kelimeler komşularından doğrusal enterpolasyonla
+    zamanlanır.
+    """
+    track_words = track["words"]
+    matcher = SequenceMatcher(
+        None, [_normalize(w) for w in script_words], [_normalize(w[2]) for w in track_words], autojunk=False
+    )
+    known_index, known_time = [], []
+    for a, b, size in matcher.get_matching_blocks():
+        for k in range(size):
+            known_index.append(a + k)
+            known_time.append(track_words[b + k][0])
+
+    if not known_index:
+        # Hiç eşleşme yoksa kelimeler tüm süreye orantılı yayılır
+        return np.array([start for start, _, _ in spread_words(" ".join(script_words), 0.0, track["duration"])])
+    known_index = [-1] + known_index + [len(script_words)]
+    known_time = [0.0] + known_time + [track["duration"]]
+    return np.interp(np.arange(len(script_words)), known_index, known_time)
+
+def schedule_from_timing(words: list, chunk_size: int, track: dict, total_duration: float) -> list:
+    """Kelime parçalarını zamanlama izine göre (metin, başlangıç, süre) olarak planlar.
+
+    Her slayt kendi ilk kelimesi söylenirken başlar ve bir sonraki parçanın başına kadar
+    ekranda kalır; ilk slayt 0'dan, son slayt videonun sonuna kadar gösterilir.
+    """
+    starts = word_starts(words, track)
+    chunk_starts = [0.0] + [float(starts[i]) for i in range(chunk_size, len(words), chunk_size)]
+    schedule = []
+    for n, start in enumerate(chunk_starts):
+        if start >= total_duration:
+            break
+        end = chunk_starts[n + 1] if n + 1 < len(chunk_starts) else total_duration
+        end = min(end, total_duration)
+        if end <= start:
+            continue
+        text = " ".join(words[n * chunk_size:(n + 1) * chunk_size])
+        schedule.append((text, start, end - start))
+    return schedule
@@ -2,7 +2,9 @@
 import os
 import re
 import json
+import time
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +20,27 @@ def setup_logging(log_file: Path = None):
     )
     return logging.getLogger("SynapseDaily")
 
+# Aşama süreleri (benchmark'lar okur): isim -> toplam saniye
+_stage_timings = {}
+
+@contextmanager
+def timed_stage(name: str):
+    """Bloğun süresini verilen aşamaya ekler."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage_time(name, time.perf_counter() - start)
+
+def add_stage_time(name: str, seconds: float):
+    _stage_timings[name] = _stage_timings.get(name, 0.0) + seconds
+
+def get_stage_timings() -> dict:
+    return dict(_stage_timings)
+
+def reset_stage_timings():
+    _stage_timings.clear()
+
 def get_todays_idea():
     """Günlük konuyu seç ve sidea.txt'yi güncelle."""
     from src.config import Config
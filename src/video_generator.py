@@ -1,51 +1,39 @@
 # src/video_generator.py
 import os
+import time
 import tempfile
 import shutil
 from pathlib import Path
 import numpy as np
-import asyncio
-import edge_tts
-from moviepy.editor import ColorClip, CompositeVideoClip, AudioFileClip, ImageClip
-from PIL import Image, ImageDraw, ImageFont
+from functools import partial
+from moviepy.editor import ColorClip, CompositeVideoClip, ImageClip
+from PIL import Image, ImageDraw
 from src.config import Config
-from src.utils import setup_logging
+from src.utils import setup_logging, timed_stage, add_stage_time, get_stage_timings
+from src.asset_cache import load_background
+from src.render_engine import (
+    render_static_slides, render_segmented, slide_clip, x264_params, LazySlide, SlideWindow, materialize
+)
+from src.text_layout import get_font, wrap_text, fit_font_size
+from src.parallel import ordered_map
+from src.media import probe_duration, mux_audio
+from src.tts.timing import load_timing, schedule_from_timing
+from src.tts.alignment import align_audio
 
 logger = setup_logging()
 
-async def generate_voice_with_edge_tts(text: str, output_path: str):
-    """Edge TTS ile kaliteli ses üretir (ücretsiz)."""
-    logger.info("🎧 Edge TTS ile ses üretiliyor...")
-    communicate = edge_tts.Communicate(text, "en-US-GuyNeural")
-    await communicate.save(output_path)
-    logger.info(f"✅ Ses dosyası hazır: {output_path}")
-
 def create_text_image_shorts(text: str, width: int, height: int, fontsize: int = 1000) -> Image.Image:
     """Shorts: Siyah yazı + beyaz gölge (sd_background.jpg üzerine)."""
     img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
-    try:
-        font = ImageFont.truetype("arial.ttf", fontsize)
-    except:
-        font = ImageFont.load_default()
-    
     # Metni kırp
     text = text[:50]
+    
+    # Ölçeklendirme: genişliğin %90'ına sığan en büyük punto (1000 pt'de rasterize etmeden)
+    fontsize = fit_font_size(text, width * 0.9, fontsize)
+    font = get_font(Config.FONT_PATH, fontsize)
     bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    
-    # Ölçeklendirme
-    max_width = width * 0.9
-    if text_width > max_width:
-        scale = max_width / text_width
-        fontsize = int(fontsize * scale)
-        try:
-            font = ImageFont.truetype("arial.ttf", fontsize)
-        except:
-            font = ImageFont.load_default()
-        bbox = draw.textbbox((0, 0), text, font=font)
     
     # Pozisyon hesaplama
     x = (width - (bbox[2] - bbox[0])) // 2
@@ -59,29 +47,10 @@ def create_text_image_podcast(text: str, width: int, height: int, fontsize: int
     """Podcast: Siyah ekran üzerine beyaz yazı (akışlı)."""
     img = Image.new("RGB", (width, height), (0, 0, 0))
     draw = ImageDraw.Draw(img)
-    
-    try:
-        font = ImageFont.truetype("arial.ttf", fontsize)
-    except:
-        font = ImageFont.load_default()
+    font = get_font(Config.FONT_PATH, fontsize)
     
     # Metni satırlara böl
-    lines = []
-    max_line_width = width - 200
-    
-    for paragraph in text.split('\n'):
-        words = paragraph.split()
-        current_line = ""
-        for word in words:
-            test_line = current_line + (" " + word if current_line else word)
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            if bbox[2] <= max_line_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
+    lines = wrap_text(text, width - 200, Config.FONT_PATH, fontsize)
     
     # Satırları yerleştir
     y_offset = 50
@@ -95,124 +64,179 @@ def create_text_image_podcast(text: str, width: int, height: int, fontsize: int
     
     return img
 
-def create_shorts_video(audio_path: str, script: str, output_path: str):
+def _schedule_chunks(chunks: list, total_duration: float, speed_factor: float, min_duration: float) -> list:
+    """Parçalara kelime sayısına göre (metin, başlangıç, süre) zamanlaması verir."""
+    schedule = []
+    start_time = 0.0
+    
+    for chunk in chunks:
+        if start_time >= total_duration:
+            break
+        
+        word_count = len(chunk.split())
+        duration = max(min_duration, min(word_count * speed_factor, total_duration - start_time))
+        schedule.append((chunk, start_time, duration))
+        start_time += duration
+    
+    return schedule
+
+def schedule_slides(audio_path: str, words: list, chunk_size: int, total_duration: float,
+                    speed_factor: float, min_duration: float) -> list:
+    """Parçaları sesin zamanlama izine göre planlar.
+    
+    İz yoksa (Piper, gTTS, Coqui) ses enerji/duraklama hizalamasıyla izlenir; o da
+    kapalıysa veya başarısızsa kelime sayısı tahminine düşülür.
+    """
+    track = load_timing(audio_path)
+    if track is None and Config.ALIGN_AUDIO:
+        try:
+            track = align_audio(audio_path, " ".join(words))
+        except Exception as e:
+            logger.warning(f"⚠️ Ses hizalanamadı, kelime sayısı tahmini kullanılıyor: {e}")
+    if track is not None:
+        logger.info(f"🕒 Slaytlar zamanlama izine göre planlanıyor ({track['source']})")
+        return schedule_from_timing(words, chunk_size, track, total_duration)
+    chunks = [" ".join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)]
+    return _schedule_chunks(chunks, total_duration, speed_factor, min_duration)
+
+def rasterize_slides(rasterizer, texts: list, width: int, height: int, fontsize: int, workers: int = None) -> list:
+    """Slaytları işçi havuzunda rasterize eder; sonuçlar metin sırasıyla döner."""
+    job = partial(rasterizer, width=width, height=height, fontsize=fontsize)
+    return ordered_map(job, texts, workers if workers is not None else Config.RENDER_WORKERS)
+
+def prepare_slides(rasterizer, texts: list, width: int, height: int, fontsize: int, transparent: bool) -> list:
+    """Config.LAZY_SLIDES açıksa tembel slayt tanımları, değilse rasterize edilmiş görüntüler."""
+    if Config.LAZY_SLIDES:
+        return [
+            LazySlide(partial(rasterizer, text, width=width, height=height, fontsize=fontsize), transparent)
+            for text in texts
+        ]
+    return rasterize_slides(rasterizer, texts, width, height, fontsize)
+
+def _dump_slides(slides: list, prefix: str):
+    """Hata ayıklama: Config.SLIDE_DEBUG_DIR ayarlıysa slaytları PNG olarak yazar."""
+    if not Config.SLIDE_DEBUG_DIR:
+        return
+    debug_dir = Path(Config.SLIDE_DEBUG_DIR)
+    debug_dir.mkdir(parents=True, exist_ok=True)
+    for i, (text_img, start_time, duration) in enumerate(slides):
+        materialize(text_img).save(debug_dir / f"{prefix}_{os.getpid()}_{i:04d}_{start_time:.2f}s.png")
+    logger.info(f"🐞 {len(slides)} slayt kaydedildi: {debug_dir}")
+
+def _render_moviepy(background, slides: list, audio_path: str, total_duration: float, output_path: str, profile: dict):
+    """MoviePy ile klasik birleştirme: her kare Python'da oluşturulur."""
+    # Yazı klipleri (bellekte; PNG gidiş-dönüşü yok). Tembel slaytlar pencereyle
+    # yalnızca oynarken rasterize edilip tutulur.
+    window = SlideWindow()
+    text_clips = [
+        clip for clip in (slide_clip(img, start, duration, window, background.size) for img, start, duration in slides)
+        if clip is not None
+    ]
+    
+    # Birleştir
+    final_video = CompositeVideoClip([background] + text_clips)
+    final_video = final_video.set_duration(total_duration)
+    
+    # Birleştirme süresini kodlamadan ayrı ölçmek için kare üreticisini sar
+    make_frame = final_video.make_frame
+    def timed_make_frame(t):
+        with timed_stage("composite"):
+            return make_frame(t)
+    final_video.make_frame = timed_make_frame
+    
+    # Kaydet: önce yalnız video, sonra orijinal TTS sesi tek geçişte eklenir
+    Config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR), prefix="render_") as work_dir:
+        video_only = str(Path(work_dir) / f"video{Path(output_path).suffix}")
+        composite_before = get_stage_timings().get("composite", 0.0)
+        encode_start = time.perf_counter()
+        final_video.write_videofile(
+            video_only,
+            fps=profile["fps"],
+            codec="libx264",
+            preset=profile["preset"],
+            ffmpeg_params=x264_params(profile),
+            audio=False,
+            logger=None,
+            threads=profile["threads"]
+        )
+        composite_time = get_stage_timings().get("composite", 0.0) - composite_before
+        add_stage_time("encode", time.perf_counter() - encode_start - composite_time)
+        
+        with timed_stage("mux"):
+            mux_audio(video_only, audio_path, str(output_path), total_duration)
+
+def _render(backend: str, background_frame: np.ndarray, background_clip, slides: list,
+            audio_path: str, total_duration: float, output_path: str, prefix: str, profile: dict):
+    """Seçilen render motoruna yönlendirir ('moviepy', 'ffmpeg' veya 'segmented')."""
+    _dump_slides(slides, prefix)
+    if backend == "ffmpeg":
+        render_static_slides(background_frame, slides, audio_path, str(output_path), total_duration, profile)
+    elif backend == "segmented":
+        render_segmented(background_frame, slides, audio_path, str(output_path), total_duration, profile)
+    elif backend == "moviepy":
+        _render_moviepy(background_clip, slides, audio_path, total_duration, output_path, profile)
+    else:
+        raise ValueError(f"Bilinmeyen render motoru: {backend}")
+
+def create_shorts_video(audio_path: str, script: str, output_path: str, backend: str = None, profile: str = None):
     """1 dk'lık Shorts videosu (dikey)."""
-    logger.info("🎥 Shorts videosu üretiliyor...")
+    backend = backend or Config.SHORTS_RENDER_BACKEND
+    profile = Config.get_encoder_profile(profile or Config.SHORTS_ENCODER_PROFILE)
+    logger.info(f"🎥 Shorts videosu üretiliyor ({backend}, {profile['name']})...")
     
-    # Ses ve süre
-    audio = AudioFileClip(audio_path)
-    total_duration = min(audio.duration, Config.SHORTS_DURATION)
+    # Süre (başlıktan okunur; ses çözülmez)
+    total_duration = min(probe_duration(audio_path), Config.SHORTS_DURATION)
     
     # Arka plan (sd_background.jpg)
     width, height = 1080, 1920
     bg_path = Config.BASE_DIR / "sd_background.jpg"
     
     if bg_path.exists():
-        from PIL import Image as PilImage
-        def resize_frame(frame):
-            img = PilImage.fromarray(frame)
-            return np.array(img.resize((width, height), PilImage.LANCZOS))
-        
-        background = ImageClip(str(bg_path))
-        background = background.fl_image(resize_frame).set_duration(total_duration)
+        # Boyutlandırma her karede değil, arka plan başına bir kez yapılır (önbellekli)
+        bg_frame = load_background(bg_path, (width, height), resample="LANCZOS")
+        background = ImageClip(bg_frame).set_duration(total_duration)
     else:
         logger.warning("⚠️ sd_background.jpg bulunamadı, siyah arka plan kullanılıyor")
+        bg_frame = np.zeros((height, width, 3), dtype=np.uint8)
         background = ColorClip((width, height), (0, 0, 0), duration=total_duration)
     
-    # Metni böl (6 kelime parçaları)
-    words = script.split()
-    chunks = [" ".join(words[i:i+6]) for i in range(0, len(words), 6)]
-    
-    # Yazı klipleri
-    text_clips = []
-    start_time = 0.0
-    speed_factor = 0.585
-    min_duration = 1.5
+    # Metni böl (6 kelime parçaları); zamanlama izi yoksa kelime başına 0.585 sn tahmini
+    schedule = schedule_slides(audio_path, script.split(), 6, total_duration, 0.585, 1.5)
     
-    for chunk in chunks:
-        if start_time >= total_duration:
-            break
-        
-        word_count = len(chunk.split())
-        duration = max(min_duration, min(word_count * speed_factor, total_duration - start_time))
-        
-        text_img = create_text_image_shorts(chunk, width, height, fontsize=1000)
-        img_path = f"/tmp/text_shorts_{abs(hash(chunk))}.png"
-        text_img.save(img_path)
-        
-        txt_clip = ImageClip(img_path).set_duration(duration).set_start(start_time)
-        text_clips.append(txt_clip)
-        start_time += duration
+    # Yazı slaytları (paralel ya da tembel rasterize)
+    with timed_stage("rasterize"):
+        images = prepare_slides(create_text_image_shorts, [c for c, _, _ in schedule], width, height, 1000, True)
+    slides = [(img, start_time, duration) for img, (_, start_time, duration) in zip(images, schedule)]
     
-    # Birleştir
-    final_video = CompositeVideoClip([background] + text_clips)
-    final_video = final_video.set_audio(audio).set_duration(total_duration)
-    
-    # Kaydet
-    final_video.write_videofile(
-        str(output_path),
-        fps=24,
-        audio_codec="aac",
-        temp_audiofile=str(Path(output_path).with_suffix(".m4a")),
-        remove_temp=True,
-        logger=None,
-        threads=4
-    )
+    _render(backend, bg_frame, background, slides, audio_path, total_duration, output_path, "shorts", profile)
     
     logger.info(f"✅ Shorts videosu hazır: {output_path}")
     return output_path
 
-def create_podcast_video(audio_path: str, script: str, output_path: str):
+def create_podcast_video(audio_path: str, script: str, output_path: str, backend: str = None, profile: str = None):
     """15 dk'lık podcast videosu (yatay)."""
-    logger.info("🎥 Podcast videosu üretiliyor...")
+    backend = backend or Config.PODCAST_RENDER_BACKEND
+    profile = Config.get_encoder_profile(profile or Config.PODCAST_ENCODER_PROFILE)
+    logger.info(f"🎥 Podcast videosu üretiliyor ({backend}, {profile['name']})...")
     
-    # Ses ve süre
-    audio = AudioFileClip(audio_path)
-    total_duration = min(audio.duration, Config.PODCAST_DURATION)
+    # Süre (başlıktan okunur; ses çözülmez)
+    total_duration = min(probe_duration(audio_path), Config.PODCAST_DURATION)
     
     # Arka plan (siyah)
     width, height = 1920, 1080
+    bg_frame = np.zeros((height, width, 3), dtype=np.uint8)
     background = ColorClip((width, height), (0, 0, 0), duration=total_duration)
     
-    # Metni böl (100 kelime blokları)
-    words = script.split()
-    chunks = [" ".join(words[i:i+100]) for i in range(0, len(words), 100)]
+    # Metni böl (100 kelime blokları); zamanlama izi yoksa kelime başına 0.4 sn tahmini
+    schedule = schedule_slides(audio_path, script.split(), 100, total_duration, 0.4, 4.0)
     
-    # Yazı klipleri
-    text_clips = []
-    start_time = 0.0
-    speed_factor = 0.4
-    min_duration = 4.0
+    # Yazı slaytları (paralel ya da tembel rasterize)
+    with timed_stage("rasterize"):
+        images = prepare_slides(create_text_image_podcast, [c for c, _, _ in schedule], width, height, 60, False)
+    slides = [(img, start_time, duration) for img, (_, start_time, duration) in zip(images, schedule)]
     
-    for chunk in chunks:
-        if start_time >= total_duration:
-            break
-        
-        word_count = len(chunk.split())
-        duration = max(min_duration, min(word_count * speed_factor, total_duration - start_time))
-        
-        text_img = create_text_image_podcast(chunk, width, height, fontsize=60)
-        img_path = f"/tmp/text_podcast_{abs(hash(chunk))}.png"
-        text_img.save(img_path)
-        
-        txt_clip = ImageClip(img_path).set_duration(duration).set_start(start_time)
-        text_clips.append(txt_clip)
-        start_time += duration
-    
-    # Birleştir
-    final_video = CompositeVideoClip([background] + text_clips)
-    final_video = final_video.set_audio(audio).set_duration(total_duration)
-    
-    # Kaydet
-    final_video.write_videofile(
-        str(output_path),
-        fps=24,
-        audio_codec="aac",
-        temp_audiofile=str(Path(output_path).with_suffix(".m4a")),
-        remove_temp=True,
-        logger=None,
-        threads=4
-    )
+    _render(backend, bg_frame, background, slides, audio_path, total_duration, output_path, "podcast", profile)
     
     logger.info(f"✅ Podcast videosu hazır: {output_path}")
     return output_path
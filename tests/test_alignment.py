@@ -0,0 +1,32 @@
+# tests/test_alignment.py
+"""align_words: sentetik konuşma/sessizlik sinyaliyle hizalama ve boş ses testleri."""
+import numpy as np
+from src.tts.alignment import align_words
+
+RATE = 16000
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (np.sin(2 * np.pi * 220 * t) * 12000).astype(np.int16)
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(RATE * seconds), dtype=np.int16)
+
+def test_empty_audio_returns_no_words():
+    assert align_words(np.zeros(0, dtype=np.int16), RATE, "Records show this. It was documented.") == ([], 0.0)
+
+def test_audio_shorter_than_a_frame_returns_no_words():
+    words, duration = align_words(tone(0.005), RATE, "Records show this.")
+    assert words == []
+    assert duration == 0.005
+
+def test_sentence_boundary_snaps_to_pause():
+    samples = np.concatenate([silence(0.2), tone(1.0), silence(0.5), tone(1.0), silence(0.2)])
+    words, duration = align_words(samples, RATE, "One two three. Four five six.")
+
+    assert [w for _, _, w in words] == ["One", "two", "three.", "Four", "five", "six."]
+    assert abs(words[0][0] - 0.2) < 0.05
+    # İkinci cümle duraklamadan sonra, konuşmanın yeniden başladığı anda başlar
+    assert abs(words[3][0] - 1.7) < 0.05
+    assert all(a[0] <= b[0] for a, b in zip(words, words[1:]))
+    assert duration == len(samples) / RATE
@@ -0,0 +1,52 @@
+# tests/test_audio_assembler.py
+"""mp3_frames / AudioAssembler: ID3 ve Xing başlıklarının ayıklanması, parça birleştirme."""
+import pytest
+from src.tts.audio_assembler import AudioAssembler, mp3_frames
+
+# MPEG-2 Layer III, 48 kbps, 24 kHz, mono: 144 baytlık kare
+FRAME_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+FRAME_LENGTH = 144
+
+def frame(marker: int) -> bytes:
+    return FRAME_HEADER + bytes([marker]) * (FRAME_LENGTH - 4)
+
+def xing_frame() -> bytes:
+    body = bytes(9) + b"Xing" + bytes(FRAME_LENGTH - 4 - 13)
+    return FRAME_HEADER + body
+
+def id3v2(payload_size: int, footer: bool = False) -> bytes:
+    # Boyut alanı 7 bitlik "synchsafe" baytlardır
+    size = bytes([(payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0)])
+    flags = 0x10 if footer else 0x00
+    tag = b"ID3" + bytes([4, 0, flags]) + size + b"\x00" * payload_size
+    return tag + (b"3DI" + bytes([4, 0, flags]) + size if footer else b"")
+
+def id3v1() -> bytes:
+    return b"TAG" + b"\x00" * 125
+
+AUDIO = frame(1) + frame(2)
+
+def test_plain_frames_are_unchanged():
+    assert bytes(mp3_frames(AUDIO)) == AUDIO
+
+@pytest.mark.parametrize("prefix", [id3v2(200), id3v2(300, footer=True), id3v2(50) + id3v2(70)])
+def test_leading_id3v2_tags_are_stripped(prefix):
+    assert bytes(mp3_frames(prefix + AUDIO)) == AUDIO
+
+def test_trailing_id3v1_tag_is_stripped():
+    assert bytes(mp3_frames(AUDIO + id3v1())) == AUDIO
+
+def test_xing_header_frame_is_stripped():
+    assert bytes(mp3_frames(id3v2(100) + xing_frame() + AUDIO + id3v1())) == AUDIO
+
+def test_info_header_frame_is_stripped():
+    info = xing_frame().replace(b"Xing", b"Info")
+    assert bytes(mp3_frames(info + AUDIO)) == AUDIO
+
+def test_assembled_mp3_contains_only_audio_frames(tmp_path):
+    output_path = tmp_path / "out.mp3"
+    with AudioAssembler(str(output_path)) as assembler:
+        assembler.append(id3v2(100) + xing_frame() + frame(1) + id3v1())
+        assembler.append(id3v2(40) + frame(2))
+    assert output_path.read_bytes() == AUDIO
+    assert not list(tmp_path.glob(".*.part"))
@@ -0,0 +1,37 @@
+# tests/test_duration_budget.py
+from src.config import Config
+from src.tts import duration_budget
+from src.tts.duration_budget import SpeechRateStore, fit_script, record_duration, trim_to_budget
+
+SCRIPT = 'Para one. He said "We go now."\n\nPara two here.'
+
+class FakeBackend:
+    name = "fake"
+
+    def voice(self, mode="shorts"):
+        return "voice"
+
+def test_script_that_fits_is_returned_unchanged():
+    trimmed, predicted = trim_to_budget(SCRIPT, budget_seconds=60, words_per_second=2.5)
+    assert trimmed == SCRIPT
+    assert predicted == 10 / 2.5
+
+def test_trim_cuts_original_text_at_sentence_end():
+    # 2 kelime/sn ile 4 sn bütçe: ilk iki cümle (7 kelime) sığar, üçüncüsü (3 kelime) sığmaz
+    trimmed, predicted = trim_to_budget(SCRIPT, budget_seconds=4, words_per_second=2.0)
+    assert trimmed == 'Para one. He said "We go now."'
+    assert predicted == 3.5
+
+def test_fit_script_keeps_paragraphs(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TTS_DURATION_BUDGET", True)
+    store = SpeechRateStore(tmp_path / "rates.json")
+    script, _ = fit_script(SCRIPT, "shorts", FakeBackend(), store)
+    assert script == SCRIPT
+
+def test_record_duration_survives_unreadable_audio(tmp_path, monkeypatch):
+    def probe_duration(path):
+        raise RuntimeError("❌ Süre okunamadı")
+    monkeypatch.setattr(duration_budget, "probe_duration", probe_duration)
+    store = SpeechRateStore(tmp_path / "rates.json")
+    assert record_duration(SCRIPT, str(tmp_path / "missing.mp3"), "shorts", FakeBackend(), 4.0, store) is None
+    assert store.load() == {}
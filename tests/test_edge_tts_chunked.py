@@ -0,0 +1,124 @@
+# tests/test_edge_tts_chunked.py
+"""synthesize_chunked: yerel taklit sentezleyiciyle sıra, yeniden deneme ve iptal testleri."""
+import asyncio
+import random
+import pytest
+from src.config import Config
+from src.tts.edge_tts_tts import synthesize_chunked
+
+# MPEG-2 Layer III, 48 kbps, 24 kHz, mono (edge-tts çıktı biçimi): 144 baytlık kare
+FRAME_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+FRAME_LENGTH = 144
+
+def fake_mp3(marker: int, frames: int = 2) -> bytes:
+    return (FRAME_HEADER + bytes([marker]) * (FRAME_LENGTH - 4)) * frames
+
+def frame_markers(data: bytes) -> list:
+    return [data[offset + 4] for offset in range(0, len(data), FRAME_LENGTH)]
+
+SENTENCES = ["One.", "Two.", "Three.", "Four.", "Five."]
+
+@pytest.fixture(autouse=True)
+def local_config(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "TEMP_DIR", tmp_path / "temp")
+    monkeypatch.setattr(Config, "TTS_CACHE_ENABLED", False)
+    monkeypatch.setattr(Config, "EDGE_TTS_RETRY_DELAY", 0.0)
+
+def run(synthesize, output_path, retries=2):
+    # max_chars cümleden kısa olduğundan her cümle ayrı bir parça olur
+    return asyncio.run(synthesize_chunked(
+        " ".join(SENTENCES), str(output_path), voice="test-voice", synthesize=synthesize,
+        max_chars=1, concurrency=3, retries=retries
+    ))
+
+def test_chunks_are_assembled_in_text_order(tmp_path):
+    rng = random.Random(7)
+
+    async def synthesize(text, path, voice):
+        # Parçalar karışık sırayla tamamlanır
+        await asyncio.sleep(rng.uniform(0.0, 0.05))
+        with open(path, "wb") as f:
+            f.write(fake_mp3(SENTENCES.index(text) + 1))
+        return None
+
+    output_path = tmp_path / "out.mp3"
+    run(synthesize, output_path)
+    assert frame_markers(output_path.read_bytes()) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+def test_failed_chunk_is_retried(tmp_path):
+    calls = {}
+
+    async def synthesize(text, path, voice):
+        calls[text] = calls.get(text, 0) + 1
+        if text == "Three." and calls[text] == 1:
+            raise ConnectionError("websocket closed")
+        with open(path, "wb") as f:
+            f.write(fake_mp3(SENTENCES.index(text) + 1))
+        return None
+
+    output_path = tmp_path / "out.mp3"
+    run(synthesize, output_path)
+    assert calls["Three."] == 2
+    assert all(calls[s] == 1 for s in SENTENCES if s != "Three.")
+    assert frame_markers(output_path.read_bytes()) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+def test_exhausted_chunk_cancels_siblings(tmp_path):
+    resumed = []
+
+    async def synthesize(text, path, voice):
+        if text == "One.":
+            raise ConnectionError("websocket closed")
+        await asyncio.sleep(0.3)
+        # Buraya ulaşan parça, silinmiş geçici dizine yazmaya çalışırdı
+        resumed.append(text)
+        with open(path, "wb") as f:
+            f.write(fake_mp3(1))
+        return None
+
+    async def caller():
+        with pytest.raises(RuntimeError):
+            await synthesize_chunked(
+                " ".join(SENTENCES), str(tmp_path / "out.mp3"), voice="test-voice",
+                synthesize=synthesize, max_chars=1, concurrency=3, retries=1
+            )
+        # Olay döngüsü çalışmaya devam eder (ör. çağıran başka bir motora geçer)
+        await asyncio.sleep(0.5)
+
+    asyncio.run(caller())
+    assert resumed == []
+    assert not (tmp_path / "out.mp3").exists()
+
+def test_cache_is_per_sentence_and_only_misses_are_requested(tmp_path, monkeypatch):
+    from src.tts import audio_cache
+    from src.tts.timing import load_timing
+    monkeypatch.setattr(Config, "TTS_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "TTS_CACHE_DIR", tmp_path / "tts_cache")
+    monkeypatch.setattr(audio_cache, "_cache", None)
+    markers = {"One": 1, "Two": 2, "Three": 3, "Deux": 4, "Four": 5}
+    requests = []
+
+    async def synthesize(text, path, voice):
+        # Her kelime 2 kare ses + 2 kare sessizlik (kare 0.024 sn); WordBoundary gibi sınırlar döner
+        requests.append(text)
+        audio, words = b"", []
+        for index, word in enumerate(w.rstrip(".") for w in text.split()):
+            audio += fake_mp3(markers[word]) + fake_mp3(0)
+            words.append((index * 0.096, index * 0.096 + 0.048, word))
+        with open(path, "wb") as f:
+            f.write(audio)
+        return words
+
+    def speak(text):
+        output_path = tmp_path / "out.mp3"
+        asyncio.run(synthesize_chunked(text, str(output_path), voice="test-voice",
+                                       synthesize=synthesize, max_chars=100))
+        return output_path
+
+    speak("One. Two. Three.")
+    output_path = speak("One. Deux. Three. Four.")
+    # Değişen ve yeni cümleler ayrı istenir; önbellekteki cümleler paketlenmiş parçadan,
+    # aradaki sessizliğin ortasından bölünmüştü
+    assert requests == ["One. Two. Three.", "Deux.", "Four."]
+    assert frame_markers(output_path.read_bytes()) == [1, 1, 0, 4, 4, 0, 0, 0, 3, 3, 0, 0, 5, 5, 0, 0]
+    starts = [round(start, 3) for start, _, _ in load_timing(str(output_path))["words"]]
+    assert starts == [0.0, 0.072, 0.192, 0.288]
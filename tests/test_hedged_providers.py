@@ -0,0 +1,154 @@
+# tests/test_hedged_providers.py
+"""Hedged sağlayıcı yarışı: yerel ThreadingHTTPServer taklitleriyle (ağ gerektirmez)."""
+import json
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.config import Config
+from src.script_generator import OpenSourceAIAPI
+
+TOPIC = "Project Orion: Nuclear Pulse Propulsion"
+CONTENT = (
+    "Project Orion records show a spacecraft pushed by nuclear pulse units. According to documented "
+    "sources, engineers tested the idea with chemical explosives. Like this video, comment below "
+    "and subscribe for more!"
+)
+
+def start_server(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def refused_url() -> str:
+    """Dinleyen sunucusu olmayan bir yerel port (bağlantı hemen reddedilir)."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/v1/chat/completions"
+
+@pytest.fixture
+def servers():
+    release = threading.Event()
+    hits = {"hung": 0, "good": 0}
+
+    class Hung(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            hits["hung"] += 1
+            release.wait(30)
+
+    class Good(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            hits["good"] += 1
+            self.rfile.read(int(self.headers["Content-Length"]))
+            data = json.dumps({"choices": [{"message": {"content": CONTENT}}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    hung, good = start_server(Hung), start_server(Good)
+    yield hung, good, hits
+    release.set()
+    hung.shutdown()
+    good.shutdown()
+
+@pytest.fixture
+def api(servers, monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(Config, "LLM_HEALTH_FILE", tmp_path / "provider_health.json")
+    hung, good, _ = servers
+    api = OpenSourceAIAPI()
+    api.ollama_url = f"http://127.0.0.1:{hung.server_port}/api/chat"
+    api.lmstudio_url = refused_url()
+    api.textgen_url = f"http://127.0.0.1:{good.server_port}/api/v1/chat"
+    api.streaming = False
+    api.hedged = True
+    api.hedge_stagger = 0.3
+    return api
+
+def test_hedged_race_skips_hung_and_refused_providers(api, servers):
+    _, _, hits = servers
+    start = time.monotonic()
+    result = api.generate_script_content(TOPIC, "shorts")
+    elapsed = time.monotonic() - start
+
+    assert result == CONTENT
+    assert hits["hung"] == 1 and hits["good"] == 1
+    # Ollama askıda (zaman aşımı 120 sn): refused LM Studio anında düşer, kazanan hemen başlatılır
+    assert elapsed < 2.0
+
+def test_hedged_race_records_provider_health(api):
+    api.generate_script_content(TOPIC, "shorts")
+    health = api.health.load()
+    assert health[api.lmstudio_url]["failures"] == 1
+    assert health[api.textgen_url]["failures"] == 0
+    assert len(health[api.textgen_url]["latencies"]["script"]) == 1
+
+def test_serial_order_waits_for_hung_provider(api):
+    # Karşılaştırma: sıralı modda askıdaki sağlayıcının zaman aşımı beklenir
+    api.hedged = False
+    api.timeouts["ollama"] = 1
+    start = time.monotonic()
+    assert api.generate_script_content(TOPIC, "shorts") == CONTENT
+    assert time.monotonic() - start >= 1.0
+
+def test_worker_crash_does_not_hang_the_race(api, monkeypatch):
+    def broken(url, error):
+        raise OSError("disk full")
+    monkeypatch.setattr(api.health, "record_failure", broken)
+    api.provider_order = ["lmstudio"]
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.setdefault("script", api._generate_hedged(TOPIC, "shorts", ["lmstudio"])),
+        daemon=True
+    )
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert result["script"] is None
+
+def test_losing_non_streaming_provider_writes_nothing(servers, monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "LLM_CACHE_FILE", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(Config, "LLM_HEALTH_FILE", tmp_path / "provider_health.json")
+    monkeypatch.setattr("src.llm_cache._cache", None)
+    _, good, _ = servers
+
+    class Slow(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            time.sleep(0.5)
+            Good = good.RequestHandlerClass
+            Good.do_POST(self)
+
+    slow = start_server(Slow)
+    try:
+        api = OpenSourceAIAPI()
+        api.lmstudio_url = f"http://127.0.0.1:{good.server_port}/v1/chat/completions"
+        api.textgen_url = f"http://127.0.0.1:{slow.server_port}/api/v1/chat"
+        api.streaming = False
+        api.hedge_stagger = 0.0
+        assert api._generate_hedged(TOPIC, "shorts", ["textgen", "lmstudio"]) == CONTENT
+        time.sleep(1.0)
+        health = api.health.load()
+        assert api.textgen_url not in health
+        assert health[api.lmstudio_url]["latencies"]["script"]
+        assert api._cached_result(TOPIC, "shorts") == CONTENT
+        with closing(sqlite3.connect(str(Config.LLM_CACHE_FILE))) as db:
+            assert [row[0] for row in db.execute("SELECT provider FROM responses")] == ["lmstudio"]
+    finally:
+        slow.shutdown()
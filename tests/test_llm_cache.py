@@ -0,0 +1,71 @@
+# tests/test_llm_cache.py
+"""LLM yanıt önbelleği: süre dolumu, boyut sınırı (LRU), --no-llm-cache ve anahtar kararlılığı."""
+import time
+import pytest
+from src import llm_cache
+from src.config import Config
+from src.llm_cache import LLMResponseCache, get_llm_cache, request_key
+
+def payload(prompt: str = "Write about Orion", **options) -> dict:
+    return dict({
+        "model": "llama3",
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": False,
+        "options": {"temperature": 0.7},
+    }, **options)
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl=0.2, max_bytes=1 << 20)
+    cache.put("key", "ollama", "llama3", "Records show the answer.")
+    assert cache.get("key") == "Records show the answer."
+    time.sleep(0.3)
+    assert cache.get("key") is None
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl=3600, max_bytes=250)
+    cache.put("a", "ollama", "llama3", "a" * 100)
+    time.sleep(0.01)
+    cache.put("b", "ollama", "llama3", "b" * 100)
+    time.sleep(0.01)
+    assert cache.get("a")  # a en yeni kullanılan olur
+    time.sleep(0.01)
+    cache.put("c", "ollama", "llama3", "c" * 100)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 100
+    assert cache.get("c") == "c" * 100
+
+def test_disabled_cache_is_bypassed(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_CACHE_FILE", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "_cache", None)
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+    assert get_llm_cache() is None
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", True)
+    assert get_llm_cache() is get_llm_cache() is not None
+
+def test_request_key_is_stable():
+    key = request_key("ollama", payload())
+    # Alan sırası ve akış bayrağı anahtarı değiştirmez
+    reordered = dict(reversed(list(payload(stream=True).items())))
+    assert request_key("ollama", reordered) == key
+    assert request_key("ollama", payload()) == key
+    assert request_key("lmstudio", payload()) != key
+    assert request_key("ollama", payload(prompt="Write about Apollo")) != key
+    assert request_key("ollama", payload(options={"temperature": 0.2})) != key
+    assert request_key("ollama", payload(model="mistral")) != key
+
+def test_connections_are_closed(monkeypatch, tmp_path):
+    opened = []
+    connect = LLMResponseCache._connect
+
+    def tracking_connect(self):
+        db = connect(self)
+        opened.append(db)
+        return db
+
+    monkeypatch.setattr(LLMResponseCache, "_connect", tracking_connect)
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl=3600, max_bytes=1 << 20)
+    cache.put("key", "ollama", "llama3", "content")
+    cache.get("key")
+    for db in opened:
+        with pytest.raises(Exception, match="closed"):
+            db.execute("SELECT 1")
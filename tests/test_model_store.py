@@ -0,0 +1,40 @@
+# tests/test_model_store.py
+"""ModelStore.fetch: yerel aynadan indirme, özet uyuşmazlığında yeniden indirme."""
+import hashlib
+from src.tts.model_store import ModelStore
+
+MODEL = b"onnx model weights " * 64
+
+def make_store(tmp_path) -> ModelStore:
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    (mirror / "voice.onnx").write_bytes(MODEL)
+    return ModelStore(root=tmp_path / "models", mirror=str(mirror))
+
+def test_same_size_corruption_is_refetched(tmp_path):
+    store = make_store(tmp_path)
+    path = store.fetch("voice.onnx", "https://example.invalid/voice.onnx")
+    assert path.read_bytes() == MODEL
+
+    path.write_bytes(b"X" + MODEL[1:])
+    assert store.fetch("voice.onnx", "https://example.invalid/voice.onnx").read_bytes() == MODEL
+    assert store.verify() == []
+
+def test_unrecorded_file_with_wrong_pinned_hash_is_refetched(tmp_path):
+    store = make_store(tmp_path)
+    stale = tmp_path / "models" / "voice.onnx"
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"old weights")
+
+    path = store.fetch("voice.onnx", "https://example.invalid/voice.onnx", hashlib.sha256(MODEL).hexdigest())
+    assert path.read_bytes() == MODEL
+    assert store.load_manifest()["voice.onnx"]["sha256"] == hashlib.sha256(MODEL).hexdigest()
+
+def test_unrecorded_file_is_recorded_without_download(tmp_path):
+    store = make_store(tmp_path)
+    local = tmp_path / "models" / "voice.onnx"
+    local.parent.mkdir(parents=True)
+    local.write_bytes(b"locally converted weights")
+
+    assert store.fetch("voice.onnx", "https://example.invalid/voice.onnx").read_bytes() == b"locally converted weights"
+    assert store.load_manifest()["voice.onnx"]["source"] == "local"
@@ -0,0 +1,119 @@
+# tests/test_provider_health.py
+"""Devre kesici: akışı süresinde bitmeyen sağlayıcı art arda hatayla devreyi açar."""
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.config import Config
+from src.script_generator import OpenSourceAIAPI
+
+class TrickleHandler(BaseHTTPRequestHandler):
+    """Ollama NDJSON akışını çok yavaş (bitmeyecek hızda) gönderir."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for _ in range(100):
+                line = (json.dumps({"message": {"content": "Project Orion "}, "done": False}) + "\n").encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(Config, "LLM_HEALTH_FILE", tmp_path / "provider_health.json")
+    monkeypatch.setattr(Config, "LLM_BREAKER_THRESHOLD", 3)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TrickleHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api = OpenSourceAIAPI()
+    api.ollama_url = f"http://127.0.0.1:{server.server_port}/api/chat"
+    api.streaming = True
+    api.timeouts["ollama"] = 0.3
+    yield api
+    server.shutdown()
+
+def test_stream_deadline_counts_as_failure(api):
+    assert api._generate("ollama", "Project Orion", "shorts") is None
+    entry = api.health.load()[api.ollama_url]
+    assert entry["failures"] == 1
+    assert entry["rejects"] == 0
+
+def test_repeated_stalls_open_the_circuit(api):
+    for _ in range(3):
+        assert api._generate("ollama", "Project Orion", "shorts") is None
+    assert api.health.state(api.ollama_url) == "open"
+    assert "ollama" not in api._healthy_providers()
+
+def test_rejects_do_not_enter_latency_window(tmp_path):
+    from src.provider_health import ProviderHealth
+    health = ProviderHealth(tmp_path / "health.json")
+    fast, slow = "http://fast/api", "http://slow/api"
+    for _ in range(3):
+        health.record_reject(fast)
+    health.record_success(slow, 8.0)
+    assert health.p50(fast) is None
+    assert health.load()[fast]["rejects"] == 3
+    # Sürekli reddedilen sağlayıcı yarışta öne alınmaz
+    assert health.order(["fast", "slow"], {"fast": fast, "slow": slow}) == ["slow", "fast"]
+
+def test_latency_is_tracked_per_request_kind(tmp_path):
+    from src.provider_health import ProviderHealth
+    health = ProviderHealth(tmp_path / "health.json")
+    a, b = "http://a/api", "http://b/api"
+    health.record_success(a, 1.0, "section")
+    health.record_success(a, 30.0)
+    health.record_success(b, 10.0)
+    urls = {"a": a, "b": b}
+    assert health.order(["a", "b"], urls) == ["b", "a"]
+    assert health.order(["b", "a"], urls, "section") == ["a", "b"]
+
+def test_legacy_latency_list_counts_as_script(tmp_path):
+    from src.provider_health import ProviderHealth
+    path = tmp_path / "health.json"
+    path.write_text(json.dumps({"http://a/api": {
+        "failures": 0, "opened_at": None, "latencies": [2.0, 4.0], "rejects": 0, "last_error": None
+    }}))
+    health = ProviderHealth(path)
+    assert health.p50("http://a/api") == 4.0
+    health.record_success("http://a/api", 1.0, "outline")
+    assert health.p50("http://a/api") == 4.0
+    assert health.p50("http://a/api", "outline") == 1.0
+
+def test_probe_treats_server_errors_as_failures(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_HEALTH_FILE", tmp_path / "provider_health.json")
+
+    class ErrorHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ErrorHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        api = OpenSourceAIAPI()
+        api.ollama_url = f"http://127.0.0.1:{server.server_port}/api/chat"
+        server.status = 503
+        assert api._probe("ollama") is False
+        assert api.health.load()[api.ollama_url]["failures"] == 1
+        server.status = 404
+        assert api._probe("ollama") is True
+    finally:
+        server.shutdown()
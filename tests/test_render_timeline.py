@@ -0,0 +1,50 @@
+# tests/test_render_timeline.py
+"""render_engine: concat zaman çizelgesi (_timeline) ve segment sınırları (_segment_bounds)."""
+import pytest
+from src.render_engine import _segment_bounds, _timeline
+
+def test_gaps_are_filled_with_background():
+    entries = _timeline([("a", 1.0, 2.0), ("b", 4.0, 1.0)], 6.0)
+    assert entries == [(None, 1.0), ("a", 2.0), (None, 1.0), ("b", 1.0), (None, 1.0)]
+
+def test_overlapping_slide_starts_after_previous_one():
+    entries = _timeline([("b", 1.5, 2.0), ("a", 0.0, 2.0)], 4.0)
+    assert entries == [("a", 2.0), ("b", 1.5), (None, 0.5)]
+
+def test_slides_are_clipped_to_total_duration():
+    entries = _timeline([("a", 0.0, 3.0), ("b", 2.5, 5.0), ("c", 9.0, 1.0)], 4.0)
+    assert entries == [("a", 3.0), ("b", 1.0)]
+
+def test_covered_slide_is_dropped():
+    entries = _timeline([("a", 0.0, 4.0), ("b", 1.0, 2.0)], 4.0)
+    assert entries == [("a", 4.0)]
+
+@pytest.mark.parametrize("total", [3.3, 10.0, 61.7])
+def test_durations_sum_to_total(total):
+    slides = [(i, i * 1.1, 1.5) for i in range(40)]
+    assert sum(duration for _, duration in _timeline(slides, total)) == pytest.approx(total)
+
+def slides_at(*starts):
+    return [(None, start, 1.0) for start in starts]
+
+def test_segment_bounds_snap_to_nearest_slide_start():
+    # 10 sn, 30 fps = 300 kare; 2 segment için hedef 150. kare, en yakın slayt başı 4.9 sn (147)
+    assert _segment_bounds(slides_at(0.0, 2.0, 4.9, 5.6, 8.0), 10.0, 2, 30) == [0, 147, 300]
+
+def test_segment_bounds_round_to_frame_grid():
+    # 1.016 sn * 30 = 30.48 -> 30. kare, 1.984 sn * 30 = 59.52 -> 60. kare
+    bounds = _segment_bounds(slides_at(1.016, 1.984), 3.0, 3, 30)
+    assert bounds == [0, 30, 60, 90]
+    assert all(isinstance(bound, int) for bound in bounds)
+
+def test_segment_bounds_skip_slides_at_edges_and_stay_increasing():
+    # 0. ve son karedeki slayt başları kesim değildir; hedefler aynı kareye düşerse tekrarlanmaz
+    assert _segment_bounds(slides_at(0.0, 1.0, 3.0), 3.0, 4, 10) == [0, 10, 30]
+    assert _segment_bounds(slides_at(0.0), 3.0, 4, 10) == [0, 30]
+
+@pytest.mark.parametrize("segments", [1, 2, 4, 8])
+def test_segment_bounds_cover_whole_timeline(segments):
+    bounds = _segment_bounds(slides_at(*[i * 0.7 for i in range(60)]), 42.0, segments, 30)
+    assert bounds[0] == 0 and bounds[-1] == 42 * 30
+    assert bounds == sorted(set(bounds))
+    assert len(bounds) == segments + 1
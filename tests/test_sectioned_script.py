@@ -0,0 +1,171 @@
+# tests/test_sectioned_script.py
+"""Bölümlü podcast üretimi: yerel Ollama akış taklidiyle sıra, iptal ve uzunluk testleri."""
+import json
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from src.config import Config
+from src.script_generator import OpenSourceAIAPI, trim_to_sentence
+from src.tts.text_chunks import split_sentences
+
+TOPIC = "Project Orion"
+TOKENS = 40
+OUTLINE = (
+    "HOOK: In 1958 engineers planned to ride atomic bombs to Mars.\n"
+    "SECTION 1: The Orion team at General Atomics.\n"
+    "SECTION 2: Chemical explosive flight tests.\n"
+    "CONCLUSION: What Orion teaches us."
+)
+MONOLITHIC = "Project Orion single request script. Records show the design was documented. " * 4
+
+def sentence(label: str) -> str:
+    return f"Records show the Project Orion {label.lower()} was documented. "
+
+class Stub:
+    def __init__(self, per_token: float = 0.005, bad_label: str = None, short: bool = False,
+                 outline: str = OUTLINE):
+        self.per_token = per_token
+        self.outline = outline
+        self.bad_label = bad_label
+        self.short = short
+        self.sent = {}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.handle(self, body["messages"][1]["content"], body.get("stream", False))
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, handler, prompt: str, stream: bool):
+        match = re.search(r"Write ONLY the (.+?) part", prompt)
+        if prompt.rstrip().endswith("OUTLINE:"):
+            label, tokens, delay = "OUTLINE", [self.outline], 0.0
+        elif match is None:
+            label, tokens, delay = "MONOLITHIC", [MONOLITHIC], 0.0
+        else:
+            label = match.group(1)
+            if label == self.bad_label:
+                tokens, delay = ["Maybe this never happened. "] + [sentence(label)] * TOKENS, self.per_token
+            elif self.short:
+                # Tek cümle (~60 karakter): 50 karakterlik genel alt sınırı geçer, bölüm bütçesine göre kısa
+                tokens, delay = [sentence(label)], 0.0
+            else:
+                tokens, delay = [sentence(label)] * TOKENS, self.per_token
+        if not stream:
+            body = json.dumps({"message": {"content": "".join(tokens)}, "done": True}).encode()
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            self.sent[label] = len(tokens)
+            return
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/x-ndjson")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        sent = 0
+        try:
+            for token in tokens:
+                self._write(handler, {"message": {"content": token}, "done": False})
+                sent += 1
+                time.sleep(delay)
+            self._write(handler, {"message": {"content": ""}, "done": True})
+            handler.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            pass
+        self.sent[label] = sent
+
+    @staticmethod
+    def _write(handler, obj):
+        line = (json.dumps(obj) + "\n").encode()
+        handler.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        handler.wfile.flush()
+
+@pytest.fixture
+def make_api(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(Config, "LLM_HEALTH_FILE", tmp_path / "provider_health.json")
+    monkeypatch.setattr(Config, "PODCAST_CHAR_LIMIT", 2000)
+    stubs = []
+
+    def make(stub: Stub) -> OpenSourceAIAPI:
+        stubs.append(stub)
+        api = OpenSourceAIAPI()
+        api.ollama_url = f"http://127.0.0.1:{stub.server.server_port}/api/chat"
+        api.provider_order = ["ollama"]
+        api.streaming = True
+        return api
+
+    yield make
+    for stub in stubs:
+        stub.server.shutdown()
+
+def test_sections_are_stitched_in_outline_order(make_api):
+    api = make_api(Stub())
+    script = api.generate_sectioned_script(TOPIC, sections=2, concurrency=4)
+    parts = script.split("\n\n")
+    labels = ["HOOK", "SECTION 1", "SECTION 2", "CONCLUSION"]
+    assert [part.startswith(sentence(label).strip()) for part, label in zip(parts, labels)] == [True] * 4
+    assert len(parts) == 4
+    assert len(script) <= Config.PODCAST_CHAR_LIMIT
+
+def test_failed_section_cancels_in_flight_sections(make_api):
+    stub = Stub(per_token=0.05, bad_label="SECTION 1")
+    api = make_api(stub)
+    start = time.monotonic()
+    script = api.generate_sectioned_script(TOPIC, sections=2, concurrency=2)
+    elapsed = time.monotonic() - start
+
+    assert script == MONOLITHIC.strip()
+    # HOOK akışı tamamlanmadan (40 x 0.05 sn) kesildi, beklemedeki bölümler hiç istenmedi
+    time.sleep(0.3)
+    assert stub.sent["HOOK"] < TOKENS
+    assert "SECTION 2" not in stub.sent and "CONCLUSION" not in stub.sent
+    assert elapsed < TOKENS * 0.05
+
+def test_short_sections_fall_back_to_single_request(make_api):
+    api = make_api(Stub(short=True))
+    assert api.generate_sectioned_script(TOPIC, sections=2, concurrency=4) == MONOLITHIC.strip()
+
+def test_unreachable_outline_uses_fallback_without_second_race(make_api, monkeypatch):
+    stub = Stub()
+    api = make_api(stub)
+    stub.server.shutdown()
+    stub.server.server_close()
+    monkeypatch.setattr(api, "generate_fallback_script", lambda topic, mode: "FALLBACK")
+    monkeypatch.setattr(api, "generate_script_content", lambda *args: pytest.fail("race repeated"))
+
+    assert api.generate_sectioned_script(TOPIC, sections=2) == "FALLBACK"
+    assert api.health.load()[api.ollama_url]["failures"] == 1
+
+def test_trim_to_sentence_agrees_with_tts_sentences():
+    text = 'He said "Go." Then left.\nNo punctuation line\nThe end is near. Final words here'
+    for limit in range(20, len(text)):
+        trimmed = trim_to_sentence(text, limit)
+        assert len(trimmed) <= limit
+        if len(trimmed) < limit and len(trimmed) >= limit // 2:
+            # Kesilen metnin cümleleri tam metnin ilk cümleleriyle aynı
+            head = split_sentences(trimmed)
+            assert head == split_sentences(text)[:len(head)]
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_outline_with_unreliable_phrase_is_rejected(make_api, streaming):
+    stub = Stub(outline=OUTLINE.replace("engineers planned", "engineers maybe planned"))
+    api = make_api(stub)
+    api.streaming = streaming
+
+    assert api.generate_sectioned_script(TOPIC, sections=2) == MONOLITHIC.strip()
+    assert "HOOK" not in stub.sent
+    assert api.health.load()[api.ollama_url]["rejects"] == 1
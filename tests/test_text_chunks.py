@@ -0,0 +1,20 @@
+# tests/test_text_chunks.py
+import pytest
+from src.tts.text_chunks import split_sentences, sentence_spans, pack_sentences
+
+@pytest.mark.parametrize("text, expected", [
+    ('He said "We go now." Then we left.', ['He said "We go now."', "Then we left."]),
+    ("(It failed.) Next", ["(It failed.)", "Next"]),
+    ("Next [one!] x", ["Next [one!]", "x"]),
+    ("Wait... what?! Yes.", ["Wait...", "what?!", "Yes."]),
+    ("Para  one.\n\nPara   two", ["Para one.", "Para two"]),
+])
+def test_split_sentences_keeps_closers(text, expected):
+    assert split_sentences(text) == expected
+
+def test_sentence_spans_index_the_original_text():
+    text = 'Intro "quoted."\n\n  Second line (aside.)  '
+    assert [text[start:end] for start, end in sentence_spans(text)] == ['Intro "quoted."', "Second line (aside.)"]
+
+def test_pack_sentences_respects_limit():
+    assert pack_sentences(["aa.", "bb.", "cc."], 7) == ["aa. bb.", "cc."]
@@ -0,0 +1,81 @@
+# tests/test_text_layout.py
+"""text_layout: doğrusal satır kaydırma ve punto sığdırma (sahte ölçeklenebilir fontla)."""
+import pytest
+from PIL import ImageFont
+from src import text_layout
+from src.text_layout import fit_font_size, text_width, wrap_text
+
+TEXT = (
+    "Records show the Project Orion team planned to ride atomic explosions to Mars "
+    "and documented every chemical explosive flight test in Nevada"
+)
+
+class FakeFont(ImageFont.FreeTypeFont):
+    """Karakter başına sabit ilerleme (+ kelime başına sabit pay) veren ölçeklenebilir font."""
+
+    def __init__(self, size: int, extra: float = 0.0):
+        self.size = size
+        self.extra = extra
+
+    def getlength(self, text, *args, **kwargs):
+        return 0.6 * self.size * len(text) + (self.extra if text.strip() else 0.0)
+
+@pytest.fixture
+def fake_font(monkeypatch):
+    def install(extra: float = 0.0):
+        monkeypatch.setattr(text_layout, "get_font", lambda path=None, size=60: FakeFont(size, extra))
+        text_layout.word_width.cache_clear()
+    yield install
+    text_layout.word_width.cache_clear()
+
+def greedy_reference(text: str, max_width: float, size: int) -> list:
+    """Kaydırmanın eski (satırı her kelimede yeniden ölçen) tanımı."""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if not line or text_width(candidate, "fake.ttf", size) <= max_width:
+                line = candidate
+            else:
+                lines.append(line)
+                line = word
+        if line:
+            lines.append(line)
+    return lines
+
+@pytest.mark.parametrize("max_width", [100, 250, 600, 2000])
+def test_wrap_matches_greedy_reference(fake_font, max_width):
+    fake_font()
+    text = TEXT + "\nSecond paragraph stays separate"
+    assert wrap_text(text, max_width, "fake.ttf", 20) == greedy_reference(text, max_width, 20)
+
+def test_wrapped_lines_fit_except_single_long_words(fake_font):
+    fake_font()
+    lines = wrap_text(TEXT + " Supercalifragilisticexpialidocious", 150, "fake.ttf", 20)
+    assert " ".join(lines) == " ".join((TEXT + " Supercalifragilisticexpialidocious").split())
+    for line in lines:
+        assert text_width(line, "fake.ttf", 20) <= 150 or " " not in line
+
+def test_wrap_keeps_blank_paragraphs_out():
+    assert wrap_text("one two\n\n  \nthree", 10_000, "missing-font.ttf", 20) == ["one two", "three"]
+
+def test_fit_font_size_is_largest_fitting_size(fake_font):
+    fake_font()
+    size = fit_font_size("Project Orion", 500, 200, "fake.ttf")
+    assert text_width("Project Orion", "fake.ttf", size) <= 500
+    assert text_width("Project Orion", "fake.ttf", size + 1) > 500
+
+def test_fit_font_size_shrinks_when_width_is_not_linear(fake_font):
+    # Kelime başına sabit pay, referans puntodan doğrusal tahmini aşırı iyimser yapar
+    fake_font(extra=40.0)
+    size = fit_font_size("Project Orion", 300, 200, "fake.ttf")
+    assert text_width("Project Orion", "fake.ttf", size) <= 300
+
+def test_fit_font_size_respects_bounds(fake_font):
+    fake_font()
+    assert fit_font_size("Hi", 10_000, 72, "fake.ttf") == 72
+    assert fit_font_size(TEXT, 50, 72, "fake.ttf", min_size=12) == 12
+
+def test_bitmap_font_keeps_max_size():
+    assert fit_font_size("Project Orion", 10, 64, "missing-font.ttf") == 64